@@ -0,0 +1,374 @@
+"""
+End-to-end HTTP load test with a mixed herd-browsing scenario.
+
+Each virtual user logs in through /api/auth/login, uploads a synthetic snapshot,
+then loops over weighted actions (list snapshots, browse /corrales and /vacas
+with random filters, sorts and pages, open a group, download the CSV, upload and
+delete snapshots), sleeping a random think time between actions. Latency
+percentiles and throughput are reported per endpoint.
+
+Targets:
+- in-process (default): create_app() served through Flask's test client,
+  against DATABASE_URL or a throwaway SQLite file, with a seeded user
+- --base-url: a running server (e.g., local gunicorn), using --email/--password
+  of an approved account (or LOADTEST_EMAIL / LOADTEST_PASSWORD)
+
+Usage:
+    python benchmarks/load_test.py --users 10 --duration 60
+    python benchmarks/load_test.py --base-url http://localhost:8000 --users 50 --think-time 0.5
+    python benchmarks/load_test.py --users 20 --output load.json
+"""
+import sys
+import os
+import io
+import json
+import time
+import uuid
+import random
+import argparse
+import tempfile
+import threading
+import statistics
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from datetime import date, timedelta
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+from synthetic_herd import generate_herd
+
+# Relative frequency of each action in the mixed scenario
+ACTION_WEIGHTS = {
+    "list_snapshots": 15,
+    "browse_corrales": 15,
+    "browse_vacas": 35,
+    "browse_group": 10,
+    "download_csv": 8,
+    "upload_snapshot": 10,
+    "delete_snapshot": 7,
+}
+
+SORT_COLUMNS = [
+    "numero_animal", "nombre_grupo", "produccion_leche_ayer", "produccion_media_7dias",
+    "estado_reproduccion", "dias_ordeno", "recomendacion",
+]
+SEARCH_TERMS = ["Preñada", "Vacía", "CORRAL 1", "12", "Fresca"]
+HERD_VARIANTS = 3
+
+
+class HttpTransport:
+    """Sends requests to a running server with urllib (one connection per request)."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+    def request(self, method: str, path: str, headers=None, json_body=None, form=None, files=None):
+        headers = dict(headers or {})
+        data = None
+        if json_body is not None:
+            data = json.dumps(json_body).encode()
+            headers["Content-Type"] = "application/json"
+        elif files is not None:
+            boundary = uuid.uuid4().hex
+            data = _encode_multipart(form or {}, files, boundary)
+            headers["Content-Type"] = f"multipart/form-data; boundary={boundary}"
+
+        req = urllib.request.Request(self.base_url + path, data=data, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=120) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+        except (urllib.error.URLError, OSError):
+            return 0, b""
+
+
+class InProcessTransport:
+    """Serves requests with create_app() through one Flask test client per thread."""
+
+    def __init__(self, app):
+        self.app = app
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, headers=None, json_body=None, form=None, files=None):
+        if not hasattr(self._local, "client"):
+            self._local.client = self.app.test_client()
+
+        kwargs = {"headers": headers or {}}
+        if json_body is not None:
+            kwargs["json"] = json_body
+        elif files is not None:
+            data = dict(form or {})
+            for field, (filename, content) in files.items():
+                data[field] = (io.BytesIO(content), filename)
+            kwargs["data"] = data
+            kwargs["content_type"] = "multipart/form-data"
+
+        response = self._local.client.open(path, method=method, **kwargs)
+        return response.status_code, response.get_data()
+
+
+def _encode_multipart(form: dict, files: dict, boundary: str) -> bytes:
+    """Encode form fields and files as multipart/form-data."""
+    parts = []
+    for name, value in form.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    for name, (filename, content) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: text/csv\r\n\r\n'.encode() + content + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts)
+
+
+class LoadStats:
+    """Thread-safe latency samples per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, endpoint: str, seconds: float, ok: bool):
+        with self._lock:
+            self.latencies[endpoint].append(seconds)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def report(self, elapsed: float) -> dict:
+        """Per-endpoint and overall percentiles (ms) and throughput (req/s)."""
+        def summarize(samples, errors):
+            ordered = sorted(samples)
+
+            def percentile(p):
+                return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)] * 1000
+
+            return {
+                "requests": len(ordered),
+                "errors": errors,
+                "throughput_rps": round(len(ordered) / elapsed, 2),
+                "mean_ms": round(statistics.fmean(ordered) * 1000, 1),
+                "p50_ms": round(percentile(50), 1),
+                "p95_ms": round(percentile(95), 1),
+                "p99_ms": round(percentile(99), 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+            }
+
+        endpoints = {
+            endpoint: summarize(samples, self.errors[endpoint])
+            for endpoint, samples in sorted(self.latencies.items())
+        }
+        all_samples = [s for samples in self.latencies.values() for s in samples]
+        overall = summarize(all_samples, sum(self.errors.values())) if all_samples else {}
+        return {"elapsed_seconds": round(elapsed, 1), "overall": overall, "endpoints": endpoints}
+
+
+class VirtualUser(threading.Thread):
+    """One simulated user running the mixed scenario until the deadline."""
+
+    def __init__(self, index, transport, stats, credentials, herds, think_time, deadline, seed):
+        super().__init__(name=f"vu-{index}", daemon=True)
+        self.transport = transport
+        self.stats = stats
+        self.credentials = credentials
+        self.herds = herds
+        self.think_time = think_time
+        self.deadline = deadline
+        self.rng = random.Random(seed)
+        self.headers = {}
+        self.snapshots = {}  # id -> corral names, uploaded by this user
+
+    def call(self, endpoint: str, method: str, path: str, ok_status=(200,), **kwargs):
+        start = time.perf_counter()
+        status, body = self.transport.request(method, path, headers=self.headers, **kwargs)
+        self.stats.record(endpoint, time.perf_counter() - start, status in ok_status)
+        return status, body
+
+    def run(self):
+        status, body = self.call("POST /api/auth/login", "POST", "/api/auth/login", json_body=self.credentials)
+        if status != 200:
+            return
+        self.headers = {"Authorization": f"Bearer {json.loads(body)['accessToken']}"}
+        self.upload_snapshot()
+
+        actions = list(ACTION_WEIGHTS)
+        weights = list(ACTION_WEIGHTS.values())
+        while time.monotonic() < self.deadline:
+            action = self.rng.choices(actions, weights)[0]
+            if not self.snapshots and action != "upload_snapshot":
+                action = "upload_snapshot"
+            getattr(self, action)()
+            if self.think_time:
+                time.sleep(self.rng.uniform(0, 2 * self.think_time))
+
+        # Leave the database as we found it
+        for snapshot_id in list(self.snapshots):
+            self.call("DELETE /api/global-hatos/<id>", "DELETE", f"/api/global-hatos/{snapshot_id}")
+
+    def pick_snapshot(self):
+        return self.rng.choice(list(self.snapshots))
+
+    def list_snapshots(self):
+        params = f"page=1&limit=10&sort_by=fecha_snapshot&sort_order={self.rng.choice(['asc', 'desc'])}"
+        self.call("GET /api/global-hatos", "GET", f"/api/global-hatos?{params}")
+
+    def browse_corrales(self):
+        snapshot_id = self.pick_snapshot()
+        status, body = self.call(
+            "GET /api/global-hatos/<id>/corrales", "GET", f"/api/global-hatos/{snapshot_id}/corrales"
+        )
+        if status == 200:
+            corrales = [c["nombre_grupo"] for c in json.loads(body)]
+            if corrales:
+                self.snapshots[snapshot_id] = corrales
+
+    def browse_vacas(self):
+        snapshot_id = self.pick_snapshot()
+        params = [f"page={self.rng.randint(1, 5)}", f"limit={self.rng.choice([10, 25, 50])}"]
+        if self.rng.random() < 0.6:
+            params += [f"sort_by={self.rng.choice(SORT_COLUMNS)}", f"sort_order={self.rng.choice(['asc', 'desc'])}"]
+        if self.rng.random() < 0.3:
+            params.append(f"search={urllib.parse.quote(self.rng.choice(SEARCH_TERMS))}")
+        if self.rng.random() < 0.3 and self.snapshots[snapshot_id]:
+            params.append(f"nombre_grupo={urllib.parse.quote(self.rng.choice(self.snapshots[snapshot_id]))}")
+        if self.rng.random() < 0.2:
+            params.append(f"recomendacion={self.rng.randint(0, 2)}")
+        self.call(
+            "GET /api/global-hatos/<id>/vacas", "GET", f"/api/global-hatos/{snapshot_id}/vacas?{'&'.join(params)}"
+        )
+
+    def browse_group(self):
+        snapshot_id = self.pick_snapshot()
+        if not self.snapshots[snapshot_id]:
+            return self.browse_corrales()
+        group = urllib.parse.quote(self.rng.choice(self.snapshots[snapshot_id]))
+        self.call(
+            "GET /api/global-hatos/<id>/grupos/<grupo>/vacas", "GET",
+            f"/api/global-hatos/{snapshot_id}/grupos/{group}/vacas"
+        )
+
+    def download_csv(self):
+        snapshot_id = self.pick_snapshot()
+        self.call("GET /api/global-hatos/<id>/download", "GET", f"/api/global-hatos/{snapshot_id}/download")
+
+    def upload_snapshot(self):
+        fecha = date(2025, 1, 1) + timedelta(days=self.rng.randint(0, 365))
+        status, body = self.call(
+            "POST /api/global-hatos/upload-csv", "POST", "/api/global-hatos/upload-csv", ok_status=(201,),
+            form={"nombre": f"Load test {fecha}", "fecha_snapshot": fecha.isoformat()},
+            files={"file": ("herd.csv", self.rng.choice(self.herds))}
+        )
+        if status == 201:
+            self.snapshots[json.loads(body)["id"]] = []
+
+    def delete_snapshot(self):
+        if len(self.snapshots) < 2:
+            return self.upload_snapshot()
+        snapshot_id = self.pick_snapshot()
+        status, _ = self.call("DELETE /api/global-hatos/<id>", "DELETE", f"/api/global-hatos/{snapshot_id}")
+        if status == 200:
+            del self.snapshots[snapshot_id]
+
+
+def build_in_process_target(workdir: str):
+    """Create the app in this process and seed an approved user to log in with."""
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(workdir, 'loadtest.db')}")
+    os.environ.setdefault("JWT_SECRET_KEY", "load-test-secret")
+    os.environ.setdefault("UPLOAD_BASE_PATH", os.path.join(workdir, "uploads"))
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    sys.path.insert(0, os.path.join(BACKEND_DIR, "src"))
+
+    import bcrypt
+    from app_factory import create_app
+    from infrastructure.database import db_config, UserModel
+    from utils.constants.roles import ROLE_COLAB
+
+    app = create_app()
+    db_config.create_all_tables()
+
+    credentials = {"email": f"loadtest-{uuid.uuid4().hex[:8]}@example.com", "password": "LoadTest123!"}
+    session = db_config.get_session()
+    session.add(UserModel(
+        name="Load Test",
+        email=credentials["email"],
+        password=bcrypt.hashpw(credentials["password"].encode(), bcrypt.gensalt()).decode(),
+        role=ROLE_COLAB,
+    ))
+    session.commit()
+    session.close()
+    return InProcessTransport(app), credentials
+
+
+def print_report(report: dict):
+    print(f"\n{'endpoint':<50} {'reqs':>6} {'err':>5} {'rps':>7} {'p50':>8} {'p95':>8} {'p99':>8}")
+    rows = list(report["endpoints"].items()) + [("TOTAL", report["overall"])]
+    for endpoint, s in rows:
+        if not s:
+            continue
+        print(
+            f"{endpoint:<50} {s['requests']:>6} {s['errors']:>5} {s['throughput_rps']:>7.1f} "
+            f"{s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} {s['p99_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="Target server (default: in-process create_app())")
+    parser.add_argument("--email", default=os.getenv("LOADTEST_EMAIL"), help="Account for --base-url")
+    parser.add_argument("--password", default=os.getenv("LOADTEST_PASSWORD"), help="Password for --base-url")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=60, help="Test duration in seconds")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean think time between actions (s)")
+    parser.add_argument("--ramp-up", type=float, default=5, help="Seconds over which users start")
+    parser.add_argument("--herd-rows", type=int, default=500, help="Animals per uploaded snapshot")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Write the report as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="vacas_loadtest_") as workdir:
+        if args.base_url:
+            if not args.email or not args.password:
+                parser.error("--email and --password (or LOADTEST_EMAIL/LOADTEST_PASSWORD) are required with --base-url")
+            transport = HttpTransport(args.base_url)
+            credentials = {"email": args.email, "password": args.password}
+        else:
+            transport, credentials = build_in_process_target(workdir)
+
+        herds = [
+            generate_herd(args.herd_rows, seed=args.seed + i).to_csv(index=False).encode()
+            for i in range(HERD_VARIANTS)
+        ]
+
+        stats = LoadStats()
+        start = time.monotonic()
+        deadline = start + args.ramp_up + args.duration
+        users = [
+            VirtualUser(i, transport, stats, credentials, herds, args.think_time, deadline, args.seed + i)
+            for i in range(args.users)
+        ]
+        print(f"Running {args.users} users for {args.duration:.0f}s against {args.base_url or 'in-process app'}...")
+        for user in users:
+            user.start()
+            time.sleep(args.ramp_up / max(args.users, 1))
+        for user in users:
+            user.join()
+
+        report = stats.report(time.monotonic() - start)
+        report["config"] = {
+            "target": args.base_url or "in-process",
+            "users": args.users,
+            "duration": args.duration,
+            "think_time": args.think_time,
+            "herd_rows": args.herd_rows,
+        }
+        print_report(report)
+
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"\nReport written to {args.output}")
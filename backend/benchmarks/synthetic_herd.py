@@ -0,0 +1,121 @@
+"""
+Synthetic herd CSV generator for benchmarks.
+
+Produces exports with the same column headers as the real herd management
+software, with realistic distributions: a Wood lactation curve for daily milk,
+reproduction status driven by days in milk, a few groups that HatoDataCleaner
+filters out (SECAS, RETO, ...) and some missing values.
+
+Usage:
+    python benchmarks/synthetic_herd.py --rows 10000 --output herd_10k.csv
+"""
+import argparse
+import numpy as np
+import pandas as pd
+
+COLUMNS = [
+    'Número del animal',
+    'Nombre del grupo',
+    'Estado de la reproducción',
+    'Nº Lactación',
+    'Días en ordeño',
+    'Número de inseminaciones',
+    'Días preñada',
+    'Días para el parto',
+    'Producción de leche ayer',
+    'Producción media diaria últimos 7 días',
+    'Producción TOTAL en lactación',
+    'Número(s) de selección de animal',
+]
+
+# Groups removed by HatoDataCleaner.filter_groups, with their share of the herd
+FILTERED_GROUPS = {'SECAS': 0.08, 'RETO': 0.03, 'BECERRAS/NOVILLAS': 0.03, 'MACHOS': 0.005, 'ESTABLO INICIAL': 0.005}
+GESTATION_DAYS = 283
+MISSING_RATE = 0.01
+
+
+def _wood_curve(days: np.ndarray, lactation: np.ndarray) -> np.ndarray:
+    """Daily milk (kg) from Wood's lactation curve y = a * t^b * e^(-c t)."""
+    a = np.where(lactation == 1, 13.0, 17.0)
+    b = np.where(lactation == 1, 0.20, 0.23)
+    c = np.where(lactation == 1, 0.0025, 0.0035)
+    t = np.maximum(days, 1)
+    return a * np.power(t, b) * np.exp(-c * t)
+
+
+def generate_herd(rows: int, seed: int = 42, corrales: int = None) -> pd.DataFrame:
+    """
+    Generate a synthetic herd export.
+
+    Args:
+        rows: Number of animals
+        seed: Random seed (same seed, same herd)
+        corrales: Number of production groups (default: one per ~120 animals)
+
+    Returns:
+        DataFrame with the real export column headers
+    """
+    rng = np.random.default_rng(seed)
+    corrales = corrales or max(rows // 120, 3)
+
+    lactation = np.minimum(rng.geometric(0.38, rows), 9)
+    dias_ordeno = rng.integers(1, 450, rows)
+
+    # Reproduction: fresh cows are not bred; most cows past ~120 DIM are pregnant
+    p_pregnant = np.clip((dias_ordeno - 60) / 180, 0, 0.85)
+    pregnant = rng.random(rows) < p_pregnant
+    inseminated = ~pregnant & (dias_ordeno > 50) & (rng.random(rows) < 0.6)
+    estado = np.select(
+        [pregnant, inseminated, dias_ordeno <= 21, dias_ordeno > 300],
+        ['Preñada', 'Inseminada', 'Fresca', 'No inseminar'],
+        default='Vacía'
+    )
+
+    dias_prenada = np.where(pregnant, rng.integers(1, np.maximum(dias_ordeno - 50, 2)), 0)
+    dias_prenada = np.minimum(dias_prenada, GESTATION_DAYS - 1)
+    dias_para_parto = np.where(pregnant, GESTATION_DAYS - dias_prenada, 0)
+    inseminaciones = np.where(pregnant | inseminated, rng.poisson(1.2, rows) + 1, 0)
+
+    leche_media = _wood_curve(dias_ordeno, lactation) * rng.normal(1.0, 0.12, rows)
+    leche_ayer = leche_media * rng.normal(1.0, 0.06, rows)
+    leche_total = leche_media * dias_ordeno * rng.normal(1.0, 0.05, rows)
+
+    groups = np.array([f'CORRAL {i + 1}' for i in range(corrales)] + list(FILTERED_GROUPS))
+    filtered_share = sum(FILTERED_GROUPS.values())
+    weights = np.array([(1 - filtered_share) / corrales] * corrales + list(FILTERED_GROUPS.values()))
+    nombre_grupo = rng.choice(groups, rows, p=weights / weights.sum())
+
+    seleccion = np.where(rng.random(rows) < 0.15, rng.integers(1, 20, rows).astype(str), '')
+
+    df = pd.DataFrame({
+        'Número del animal': np.char.zfill(rng.permutation(rows * 3)[:rows].astype(str), 5),
+        'Nombre del grupo': nombre_grupo,
+        'Estado de la reproducción': estado,
+        'Nº Lactación': lactation,
+        'Días en ordeño': dias_ordeno,
+        'Número de inseminaciones': inseminaciones,
+        'Días preñada': dias_prenada,
+        'Días para el parto': dias_para_parto,
+        'Producción de leche ayer': np.round(np.maximum(leche_ayer, 0), 1),
+        'Producción media diaria últimos 7 días': np.round(np.maximum(leche_media, 0), 1),
+        'Producción TOTAL en lactación': np.round(np.maximum(leche_total, 0)),
+        'Número(s) de selección de animal': seleccion,
+    }, columns=COLUMNS)
+
+    # Sprinkle missing values over the numeric columns, as real exports have
+    for column in COLUMNS[3:11]:
+        mask = rng.random(rows) < MISSING_RATE
+        df[column] = df[column].astype(float).mask(mask)
+
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="Number of animals")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", required=True, help="Output CSV path")
+    args = parser.parse_args()
+
+    generate_herd(args.rows, args.seed).to_csv(args.output, index=False)
+    print(f"Wrote {args.rows} animals to {args.output}")
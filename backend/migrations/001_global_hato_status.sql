@@ -0,0 +1,3 @@
+-- Staged ingestion: snapshots are 'loading' until all their cows are stored
+ALTER TABLE global_hato ADD COLUMN IF NOT EXISTS status VARCHAR NOT NULL DEFAULT 'ready';
+CREATE INDEX IF NOT EXISTS idx_global_hato_loading ON global_hato(created_at) WHERE status = 'loading';
@@ -0,0 +1,6 @@
+"""Convert cows into a table range-partitioned by global_hato_id (copies all rows)."""
+from infrastructure.database.partitioning import CowsPartitionManager
+
+
+def upgrade(conn):
+    CowsPartitionManager().convert_to_partitioned(conn)
@@ -0,0 +1,2 @@
+-- Cold-tier archival: archived snapshots keep their cows in a Parquet file
+ALTER TABLE global_hato ADD COLUMN IF NOT EXISTS archive_route VARCHAR;
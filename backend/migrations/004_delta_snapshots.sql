@@ -0,0 +1,5 @@
+-- Delta-encoded snapshots: only cows that differ from a full base snapshot are stored
+ALTER TABLE global_hato ADD COLUMN IF NOT EXISTS base_snapshot_id INTEGER REFERENCES global_hato(id) ON DELETE CASCADE;
+CREATE INDEX IF NOT EXISTS idx_global_hato_base_snapshot ON global_hato(base_snapshot_id) WHERE base_snapshot_id IS NOT NULL;
+ALTER TABLE cows ADD COLUMN IF NOT EXISTS removed BOOLEAN NOT NULL DEFAULT FALSE;
+CREATE INDEX IF NOT EXISTS idx_cows_snapshot_animal ON cows(global_hato_id, numero_animal);
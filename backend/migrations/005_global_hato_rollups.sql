@@ -0,0 +1,16 @@
+-- Per-snapshot herd totals for trend charts (backfill: python scripts/rebuild_trend_rollups.py)
+CREATE TABLE IF NOT EXISTS global_hato_rollups (
+    global_hato_id INTEGER PRIMARY KEY REFERENCES global_hato(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    fecha_snapshot DATE NOT NULL,
+    total_animales INTEGER NOT NULL,
+    grupos_detectados INTEGER NOT NULL,
+    produccion_total DOUBLE PRECISION NOT NULL,
+    produccion_promedio DOUBLE PRECISION,
+    produccion_promedio_7dias DOUBLE PRECISION,
+    en_produccion INTEGER NOT NULL DEFAULT 0,
+    en_monitoreo INTEGER NOT NULL DEFAULT 0,
+    previo_secado INTEGER NOT NULL DEFAULT 0,
+    sin_recomendacion INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_global_hato_rollups_user_fecha ON global_hato_rollups(user_id, fecha_snapshot);
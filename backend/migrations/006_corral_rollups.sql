@@ -0,0 +1,17 @@
+-- Per-snapshot corral totals for corral time series (backfill: python scripts/rebuild_trend_rollups.py)
+CREATE TABLE IF NOT EXISTS global_hato_corral_rollups (
+    global_hato_id INTEGER NOT NULL REFERENCES global_hato(id) ON DELETE CASCADE,
+    nombre_grupo VARCHAR NOT NULL,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    fecha_snapshot DATE NOT NULL,
+    total_animales INTEGER NOT NULL,
+    produccion_total DOUBLE PRECISION NOT NULL,
+    produccion_promedio DOUBLE PRECISION,
+    produccion_promedio_7dias DOUBLE PRECISION,
+    en_produccion INTEGER NOT NULL DEFAULT 0,
+    en_monitoreo INTEGER NOT NULL DEFAULT 0,
+    previo_secado INTEGER NOT NULL DEFAULT 0,
+    sin_recomendacion INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (global_hato_id, nombre_grupo)
+);
+CREATE INDEX IF NOT EXISTS idx_corral_rollups_user_fecha_grupo ON global_hato_corral_rollups(user_id, fecha_snapshot, nombre_grupo);
@@ -0,0 +1,17 @@
+-- Cross-snapshot search: distinct animal/selection/group values per snapshot
+-- (backfill: python scripts/rebuild_search_index.py)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+CREATE TABLE IF NOT EXISTS cow_search_terms (
+    global_hato_id INTEGER NOT NULL REFERENCES global_hato(id) ON DELETE CASCADE,
+    kind VARCHAR NOT NULL,
+    term VARCHAR NOT NULL,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    fecha_snapshot DATE NOT NULL,
+    search_key VARCHAR NOT NULL,
+    PRIMARY KEY (global_hato_id, kind, term)
+);
+-- Prefix autocomplete: one range scan per user, in result order
+CREATE INDEX IF NOT EXISTS idx_cow_search_terms_user_key ON cow_search_terms(user_id, search_key varchar_pattern_ops, kind);
+-- Substring search: trigram lookup scoped to the user
+CREATE INDEX IF NOT EXISTS idx_cow_search_terms_user_trgm ON cow_search_terms USING gin (user_id, search_key gin_trgm_ops);
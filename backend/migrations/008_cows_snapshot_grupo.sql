@@ -0,0 +1,2 @@
+-- Group IN-list filters on /vacas and cows-by-group reads within one snapshot
+CREATE INDEX IF NOT EXISTS idx_cows_snapshot_grupo ON cows(global_hato_id, nombre_grupo);
@@ -0,0 +1,7 @@
+-- Per-corral rankings: ROW_NUMBER() OVER (PARTITION BY nombre_grupo ORDER BY <metric>)
+-- reads each group already ordered by the production columns. The leche index also
+-- serves the group lookups of idx_cows_snapshot_grupo (same leading columns), so
+-- that one is dropped rather than kept as a third index to maintain on ingest.
+CREATE INDEX IF NOT EXISTS idx_cows_snapshot_grupo_leche ON cows(global_hato_id, nombre_grupo, produccion_leche_ayer);
+CREATE INDEX IF NOT EXISTS idx_cows_snapshot_grupo_media7 ON cows(global_hato_id, nombre_grupo, produccion_media_7dias);
+DROP INDEX IF EXISTS idx_cows_snapshot_grupo;
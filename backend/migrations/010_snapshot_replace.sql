@@ -0,0 +1,5 @@
+-- Re-uploads replacing a snapshot: per-row content hashes to skip unchanged cows,
+-- and the time of the last replacement (cached snapshot columns are keyed on it).
+-- Rows stored before this migration have no hash and are re-scored once.
+ALTER TABLE cows ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32);
+ALTER TABLE global_hato ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
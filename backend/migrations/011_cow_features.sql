@@ -0,0 +1,8 @@
+-- Model features stored per cow (float32), so a new model can re-score stored
+-- snapshots without the original CSVs. The other model inputs are already columns.
+-- Rows stored before this migration have no features and are not re-scored.
+ALTER TABLE cows ADD COLUMN IF NOT EXISTS numero_lactacion REAL;
+ALTER TABLE cows ADD COLUMN IF NOT EXISTS numero_inseminaciones REAL;
+ALTER TABLE cows ADD COLUMN IF NOT EXISTS dias_prenada REAL;
+ALTER TABLE cows ADD COLUMN IF NOT EXISTS dias_para_parto REAL;
+ALTER TABLE cows ADD COLUMN IF NOT EXISTS produccion_total_lactacion REAL;
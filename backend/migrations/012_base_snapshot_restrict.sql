@@ -0,0 +1,6 @@
+-- Deleting a base snapshot must fail while delta snapshots still inherit from it:
+-- the adapter materializes dependents first, and anything that misses one (a race,
+-- a manual delete) should error out instead of cascading the deltas away.
+ALTER TABLE global_hato DROP CONSTRAINT IF EXISTS global_hato_base_snapshot_id_fkey;
+ALTER TABLE global_hato ADD CONSTRAINT global_hato_base_snapshot_id_fkey
+    FOREIGN KEY (base_snapshot_id) REFERENCES global_hato(id) ON DELETE RESTRICT;
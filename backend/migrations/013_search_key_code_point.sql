@@ -0,0 +1,6 @@
+-- Autocomplete orders by search_key COLLATE "C" (code point, like SQLite and the
+-- in-memory reads). A varchar_pattern_ops index serves the prefix LIKE but not that
+-- ORDER BY, so every match was sorted before the LIMIT; a "C" collation btree does both.
+CREATE INDEX IF NOT EXISTS idx_cow_search_terms_user_key_c ON cow_search_terms(user_id, search_key COLLATE "C", kind);
+DROP INDEX IF EXISTS idx_cow_search_terms_user_key;
+ALTER INDEX idx_cow_search_terms_user_key_c RENAME TO idx_cow_search_terms_user_key;
@@ -0,0 +1,35 @@
+"""
+Move old Global Hato snapshots to cold storage (Parquet files).
+
+An archived snapshot's cows are written to a compressed Parquet file in the
+storage backend and deleted from the cows table; the API keeps serving them
+from the file. Run this from cron so the cows table tracks recent activity.
+
+Usage:
+    python scripts/archive_snapshots.py                        # ARCHIVE_AFTER_DAYS
+    python scripts/archive_snapshots.py --older-than-days 90 --limit 50
+"""
+import sys
+import os
+import asyncio
+import argparse
+from dotenv import load_dotenv
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+load_dotenv()
+
+from infrastructure.adapters.global_hato_repository_adapter import GlobalHatoRepositoryAdapter
+from domain.usecases import ArchiveOldSnapshots
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--older-than-days", type=int, default=None, help="Archive snapshots taken before this many days ago")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum snapshots to archive in this run")
+    args = parser.parse_args()
+
+    archive = ArchiveOldSnapshots(GlobalHatoRepositoryAdapter())
+    archived = asyncio.run(archive.execute(args.older_than_days, args.limit))
+    print(f"Archived {len(archived)} snapshot(s)" + (f": {', '.join(map(str, archived))}" if archived else ""))
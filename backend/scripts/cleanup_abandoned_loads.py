@@ -0,0 +1,34 @@
+"""
+Remove Global Hato snapshots whose staged load never finished.
+
+Uploads normally clean up after themselves (and sweep old abandoned loads), but
+a worker killed mid-ingest leaves a snapshot in 'loading' status; run this from
+cron to remove them even when nobody uploads.
+
+Usage:
+    python scripts/cleanup_abandoned_loads.py                  # INGEST_ABANDONED_LOAD_MINUTES
+    python scripts/cleanup_abandoned_loads.py --max-age-minutes 30
+"""
+import sys
+import os
+import asyncio
+import argparse
+from dotenv import load_dotenv
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+load_dotenv()
+
+from infrastructure.adapters.global_hato_repository_adapter import GlobalHatoRepositoryAdapter
+from domain.usecases import CleanupAbandonedLoads
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-age-minutes", type=int, default=None, help="Age after which a load is abandoned")
+    args = parser.parse_args()
+
+    cleanup = CleanupAbandonedLoads(GlobalHatoRepositoryAdapter())
+    removed = asyncio.run(cleanup.execute(args.max_age_minutes))
+    print(f"Removed {removed} abandoned snapshot load(s)")
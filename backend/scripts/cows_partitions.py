@@ -0,0 +1,112 @@
+"""
+Maintain the range partitions of the cows table (PostgreSQL).
+
+Usage:
+    python scripts/cows_partitions.py list
+    python scripts/cows_partitions.py ensure                       # cron: keep partitions ahead of uploads
+    python scripts/cows_partitions.py drop-before --older-than-days 730 [--dry-run]
+    python scripts/cows_partitions.py drop-before --snapshot-id 5000 [--dry-run]
+
+drop-before only removes whole partitions (DETACH + DROP, no row-by-row
+DELETE of cows), together with their snapshots and stored CSV files.
+"""
+import sys
+import os
+import argparse
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+load_dotenv()
+
+from sqlalchemy import text
+from infrastructure.database import db_config
+from infrastructure.database.partitioning import CowsPartitionManager
+
+
+def _first_snapshot_since(conn, cutoff: datetime) -> int:
+    """Id of the oldest snapshot created at or after `cutoff` (everything below it is older)."""
+    first_kept = conn.execute(
+        text("SELECT min(id) FROM global_hato WHERE created_at >= :cutoff"), {"cutoff": cutoff}
+    ).scalar()
+    if first_kept is None:
+        first_kept = conn.execute(text("SELECT COALESCE(max(id), 0) + 1 FROM global_hato")).scalar()
+    return first_kept
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("list", help="List partitions and their estimated rows")
+    subcommands.add_parser("ensure", help="Create partitions ahead of the newest snapshot")
+    drop = subcommands.add_parser("drop-before", help="Drop partitions holding only old snapshots")
+    group = drop.add_mutually_exclusive_group(required=True)
+    group.add_argument("--snapshot-id", type=int, help="Keep this snapshot id and newer")
+    group.add_argument("--older-than-days", type=int, help="Keep snapshots created in the last N days")
+    drop.add_argument("--dry-run", action="store_true", help="Only show what would be dropped")
+    args = parser.parse_args()
+
+    manager = CowsPartitionManager()
+    engine = db_config.engine
+    if engine.dialect.name != "postgresql":
+        sys.exit(f"{engine.dialect.name} is not supported; migrations and partitioning target PostgreSQL")
+
+    with engine.begin() as conn:
+        if not manager.is_partitioned(conn):
+            sys.exit("cows is not partitioned yet; run scripts/migrate.py first")
+
+        if args.command == "list":
+            for name, lower, upper in manager.list_partitions(conn):
+                rows = conn.execute(text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name"), {"name": name}).scalar()
+                bounds = "DEFAULT" if lower is None else f"[{lower}, {upper})"
+                print(f"{name:<20} {bounds:<20} ~{max(rows or 0, 0)} rows")
+
+        elif args.command == "ensure":
+            created = manager.ensure_partitions(conn)
+            print(f"Created: {', '.join(created)}" if created else "Partitions are up to date")
+
+        elif args.command == "drop-before":
+            snapshot_id = args.snapshot_id
+            if snapshot_id is None:
+                snapshot_id = _first_snapshot_since(conn, datetime.now() - timedelta(days=args.older_than_days))
+
+            droppable = [
+                (name, lower, upper) for name, lower, upper in manager.list_partitions(conn)
+                if lower is not None and upper <= snapshot_id
+            ]
+            if not droppable:
+                print(f"No partition lies entirely below snapshot {snapshot_id}")
+                sys.exit(0)
+
+            # Deltas outside the dropped range would lose the cows they inherit
+            upper_bound = max(upper for _, _, upper in droppable)
+            dependents = conn.execute(
+                text("SELECT count(*) FROM global_hato WHERE id >= :upper AND base_snapshot_id < :upper"),
+                {"upper": upper_bound}
+            ).scalar()
+            if dependents:
+                print(f"{dependents} newer delta snapshot(s) are based on snapshots below {upper_bound}; "
+                      "delete or archive those bases through the API/archive job first")
+                sys.exit(1)
+
+            blob_routes = [
+                route for row in conn.execute(
+                    text("SELECT blob_route, archive_route FROM global_hato WHERE id < :upper"),
+                    {"upper": upper_bound}
+                )
+                for route in (row.blob_route, row.archive_route) if route
+            ]
+            print(f"Dropping {', '.join(name for name, _, _ in droppable)} ({len(blob_routes)} stored files)")
+            if args.dry_run:
+                sys.exit(0)
+
+            manager.drop_partitions_before(conn, snapshot_id)
+
+    if args.command == "drop-before":
+        # Files only go once the database transaction has committed
+        from infrastructure.storage import storage_service
+
+        for blob_route in blob_routes:
+            storage_service.delete_file(blob_route)
@@ -0,0 +1,68 @@
+"""
+Run the shared inference server.
+
+Loads the model once and serves predictions to every gunicorn worker and Celery
+task on the same host over a Unix socket, merging requests that arrive within
+INFERENCE_BATCH_WINDOW_MS into one model call. Point the workers at it with
+INFERENCE_SOCKET and the same INFERENCE_AUTHKEY; while it is down they predict
+in process.
+
+Usage:
+    python scripts/inference_server.py                          # INFERENCE_SOCKET
+    python scripts/inference_server.py --socket /tmp/inference.sock --batch-window-ms 10
+"""
+import sys
+import os
+import argparse
+import logging
+from dotenv import load_dotenv
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+load_dotenv()
+
+from infrastructure.ml.services import PredictionService
+from infrastructure.ml.services.inference_server import InferenceServer
+from utils.constants import app_config
+from utils.logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = os.path.join(os.path.dirname(__file__), '../src/infrastructure/ml/models')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=app_config.INFERENCE_SOCKET, help="Unix socket to listen on (default: INFERENCE_SOCKET)")
+    parser.add_argument("--batch-window-ms", type=float, default=app_config.INFERENCE_BATCH_WINDOW_MS,
+                        help="How long a batch waits for concurrent requests")
+    parser.add_argument("--max-batch-rows", type=int, default=app_config.INFERENCE_MAX_BATCH_ROWS,
+                        help="Rows at which a batch stops waiting")
+    args = parser.parse_args()
+    if not args.socket:
+        parser.error("--socket or INFERENCE_SOCKET is required")
+    if not app_config.INFERENCE_AUTHKEY:
+        parser.error("INFERENCE_AUTHKEY is required")
+
+    configure_logging()
+    # The server predicts in process: it holds the single model copy
+    prediction_service = PredictionService(model_dir=MODEL_DIR)
+    if not prediction_service.load_model():
+        logger.warning("No model found; serving empty predictions", extra={"model_dir": MODEL_DIR})
+
+    server = InferenceServer(
+        prediction_service, args.socket, app_config.INFERENCE_AUTHKEY.encode(),
+        batch_window=args.batch_window_ms / 1000, max_batch_rows=args.max_batch_rows
+    )
+    logger.info("Starting inference server", extra={
+        "socket": args.socket,
+        "model_type": prediction_service.model_type,
+        "batch_window_ms": args.batch_window_ms,
+        "max_batch_rows": args.max_batch_rows,
+    })
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+        logger.info("Inference server stopped")
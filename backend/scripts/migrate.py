@@ -0,0 +1,87 @@
+"""
+Apply pending database migrations (PostgreSQL).
+
+Migrations live in backend/migrations and run in file name order, each in its
+own transaction: `NNN_name.sql` files are executed as-is, `NNN_name.py` files
+must define `upgrade(conn)`. Applied versions are recorded in schema_migrations.
+Fresh databases created from init.sql already record every migration up to the
+schema they create.
+
+Usage:
+    python scripts/migrate.py            # apply pending migrations
+    python scripts/migrate.py --list     # show applied / pending
+"""
+import sys
+import os
+import argparse
+import importlib.util
+from dotenv import load_dotenv
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+load_dotenv()
+
+from sqlalchemy import text
+from infrastructure.database import db_config
+
+MIGRATIONS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'migrations'))
+
+
+def discover_migrations():
+    """Return [(version, path)] sorted by version."""
+    migrations = []
+    for name in sorted(os.listdir(MIGRATIONS_DIR)):
+        version, extension = os.path.splitext(name)
+        if extension in (".sql", ".py") and version[:3].isdigit():
+            migrations.append((version, os.path.join(MIGRATIONS_DIR, name)))
+    return migrations
+
+
+def applied_versions(engine):
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version VARCHAR PRIMARY KEY, applied_at TIMESTAMP NOT NULL DEFAULT NOW())"
+        ))
+        return {row.version for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def apply_migration(engine, version, path):
+    """Run one migration and record it, atomically."""
+    with engine.begin() as conn:
+        if path.endswith(".sql"):
+            with open(path) as f:
+                conn.exec_driver_sql(f.read())
+        else:
+            spec = importlib.util.spec_from_file_location(f"migration_{version}", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            module.upgrade(conn)
+        conn.execute(text("INSERT INTO schema_migrations (version) VALUES (:version)"), {"version": version})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--list", action="store_true", help="Show migration status and exit")
+    args = parser.parse_args()
+
+    engine = db_config.engine
+    if engine.dialect.name != "postgresql":
+        sys.exit(f"{engine.dialect.name} is not supported; migrations and partitioning target PostgreSQL")
+    done = applied_versions(engine)
+    migrations = discover_migrations()
+
+    if args.list:
+        for version, _ in migrations:
+            print(f"{'applied' if version in done else 'pending':<8} {version}")
+        sys.exit(0)
+
+    pending = [(version, path) for version, path in migrations if version not in done]
+    if not pending:
+        print("Database is up to date")
+    for version, path in pending:
+        print(f"Applying {version}...")
+        apply_migration(engine, version, path)
+    if pending:
+        print(f"Applied {len(pending)} migration(s)")
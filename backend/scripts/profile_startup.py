@@ -0,0 +1,101 @@
+"""
+Startup profile for the backend: cold create_app() time, RSS and an import-time report.
+
+Runs create_app() in a fresh interpreter with `-X importtime` and aggregates the
+self import time per top-level package, so heavy dependencies that sneak back
+into the startup path are easy to spot.
+
+Usage:
+    python scripts/profile_startup.py            # top 15 packages
+    python scripts/profile_startup.py --top 40
+"""
+import sys
+import os
+import json
+import argparse
+import subprocess
+from collections import defaultdict
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modules that must only be imported by the endpoints that need them
+HEAVY_MODULES = ["pandas", "numpy", "boto3", "botocore", "joblib", "tensorflow", "sklearn", "xgboost"]
+
+_PROBE = """
+import sys, os, time, json, resource
+sys.path.insert(0, os.path.join(os.getcwd(), 'src'))
+start = time.perf_counter()
+from app_factory import create_app
+create_app()
+elapsed = time.perf_counter() - start
+# Peak RSS of this process; ru_maxrss survives fork+exec on Linux, so prefer VmHWM
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if os.path.exists('/proc/self/status'):
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmHWM:'):
+                rss_kb = int(line.split()[1])
+print(json.dumps({
+    'create_app_seconds': elapsed,
+    'max_rss_mb': rss_kb / 1024,
+    'heavy_modules_loaded': sorted(m for m in %r if m in sys.modules),
+}))
+""" % (HEAVY_MODULES,)
+
+
+def run_startup_probe(importtime: bool = False, env: dict = None) -> dict:
+    """
+    Import the app and call create_app() in a fresh interpreter.
+
+    Args:
+        importtime: Also collect the `-X importtime` report
+        env: Extra environment variables for the child process
+
+    Returns:
+        Dict with 'create_app_seconds', 'max_rss_mb', 'heavy_modules_loaded'
+        and, when requested, 'importtime' (raw report lines)
+    """
+    child_env = dict(os.environ)
+    child_env.update(env or {})
+
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _PROBE]
+
+    proc = subprocess.run(cmd, cwd=BACKEND_DIR, env=child_env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"create_app() failed:\n{proc.stderr}")
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    if importtime:
+        result["importtime"] = [l for l in proc.stderr.splitlines() if l.startswith("import time:")]
+    return result
+
+
+def summarize_importtime(lines):
+    """Aggregate self import time (microseconds) per top-level package."""
+    per_package = defaultdict(int)
+    for line in lines:
+        parts = line.split("|")
+        if len(parts) != 3 or "self" in parts[0]:
+            continue
+        self_us = int(parts[0].split(":")[1].strip())
+        package = parts[2].strip().split(".")[0]
+        per_package[package] += self_us
+    return sorted(per_package.items(), key=lambda item: item[1], reverse=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=15, help="Number of packages to show")
+    args = parser.parse_args()
+
+    result = run_startup_probe(importtime=True)
+
+    print(f"create_app(): {result['create_app_seconds']:.3f}s, max RSS {result['max_rss_mb']:.1f} MB")
+    print(f"Heavy modules loaded at startup: {', '.join(result['heavy_modules_loaded']) or 'none'}")
+    print()
+    print(f"{'package':<30} {'self ms':>10}")
+    for package, self_us in summarize_importtime(result["importtime"])[:args.top]:
+        print(f"{package:<30} {self_us / 1000:>10.1f}")
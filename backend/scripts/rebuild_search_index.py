@@ -0,0 +1,31 @@
+"""
+Index every snapshot that has no cross-snapshot search terms.
+
+Uploads and deletes keep the index up to date; run this once after upgrading (to
+backfill existing snapshots) or if an upload could not save its search terms.
+
+Usage:
+    python scripts/rebuild_search_index.py
+"""
+import sys
+import os
+import asyncio
+import argparse
+from dotenv import load_dotenv
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+load_dotenv()
+
+from infrastructure.adapters import GlobalHatoRepositoryAdapter, SearchIndexRepositoryAdapter
+from domain.usecases import RebuildSearchIndex
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    rebuild = RebuildSearchIndex(GlobalHatoRepositoryAdapter(), SearchIndexRepositoryAdapter())
+    rebuilt = asyncio.run(rebuild.execute())
+    print(f"Indexed {len(rebuilt)} snapshot(s) for search")
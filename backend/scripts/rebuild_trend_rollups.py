@@ -0,0 +1,31 @@
+"""
+Compute the trend rollup of every snapshot that lacks one.
+
+Uploads and deletes keep rollups up to date; run this once after upgrading (to
+backfill existing snapshots) or if an upload could not save its rollup.
+
+Usage:
+    python scripts/rebuild_trend_rollups.py
+"""
+import sys
+import os
+import asyncio
+import argparse
+from dotenv import load_dotenv
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+load_dotenv()
+
+from infrastructure.adapters import GlobalHatoRepositoryAdapter, SnapshotRollupRepositoryAdapter
+from domain.usecases import RebuildSnapshotRollups
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    rebuild = RebuildSnapshotRollups(GlobalHatoRepositoryAdapter(), SnapshotRollupRepositoryAdapter())
+    rebuilt = asyncio.run(rebuild.execute())
+    print(f"Rebuilt {len(rebuilt)} trend rollup(s)")
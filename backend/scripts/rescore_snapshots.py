@@ -0,0 +1,47 @@
+"""
+Re-score every stored cow with the current model.
+
+Run after deploying a new model: each cow's persisted features are streamed
+through the model in batches and its recomendacion is updated in place (trend
+rollups of the affected snapshots are rebuilt). Archived snapshots and cows
+uploaded before features were stored keep their recomendacion.
+
+Usage:
+    python scripts/rescore_snapshots.py
+    python scripts/rescore_snapshots.py --user-id 7 --batch-size 10000
+"""
+import sys
+import os
+import asyncio
+import argparse
+from dotenv import load_dotenv
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+load_dotenv()
+
+from infrastructure.adapters import GlobalHatoRepositoryAdapter, SnapshotRollupRepositoryAdapter
+from infrastructure.ml.services import PredictionService
+from domain.usecases import RebuildSnapshotRollups, RescoreSnapshots
+
+MODEL_DIR = os.path.join(os.path.dirname(__file__), '../src/infrastructure/ml/models')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, help="Only re-score this user's snapshots")
+    parser.add_argument("--batch-size", type=int, help="Cows per model call (default: RESCORE_BATCH_SIZE)")
+    args = parser.parse_args()
+
+    global_hato_repository = GlobalHatoRepositoryAdapter()
+    rescore = RescoreSnapshots(
+        global_hato_repository,
+        PredictionService(model_dir=MODEL_DIR),
+        RebuildSnapshotRollups(global_hato_repository, SnapshotRollupRepositoryAdapter())
+    )
+    report = asyncio.run(rescore.execute(user_id=args.user_id, batch_size=args.batch_size))
+    print(
+        f"Re-scored {report.rows} cow(s) in {report.snapshots} snapshot(s): "
+        f"{report.changed} changed, {report.rows_per_second:.0f} rows/s"
+    )
@@ -0,0 +1,136 @@
+"""
+Storage savings report and compression throughput benchmark for uploaded herd files.
+
+Usage:
+    python scripts/storage_report.py                       # report on UPLOAD_BASE_PATH
+    python scripts/storage_report.py --benchmark file.csv  # gzip throughput per level
+    python scripts/storage_report.py --snapshots           # cow rows saved by delta snapshots
+"""
+import sys
+import os
+import gzip
+import time
+import shutil
+import argparse
+import tempfile
+from dotenv import load_dotenv
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+load_dotenv()
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def _uncompressed_size(path: str) -> int:
+    """Stream-decompress a gzip file and count its bytes."""
+    total = 0
+    with gzip.open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            total += len(chunk)
+    return total
+
+
+def _format_mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f} MB"
+
+
+def storage_report(base_path: str):
+    """Print stored vs original bytes for every file under the uploads directory."""
+    stored_total = 0
+    original_total = 0
+    compressed_files = 0
+    raw_files = 0
+
+    for root, _, files in os.walk(base_path):
+        for name in files:
+            if name.startswith("."):
+                continue
+            path = os.path.join(root, name)
+            stored = os.path.getsize(path)
+            if name.endswith(".gz"):
+                original = _uncompressed_size(path)
+                compressed_files += 1
+            else:
+                original = stored
+                raw_files += 1
+            stored_total += stored
+            original_total += original
+
+    print(f"Uploads directory: {base_path}")
+    print(f"Files: {compressed_files} compressed, {raw_files} uncompressed")
+    print(f"Original size: {_format_mb(original_total)}")
+    print(f"Stored size:   {_format_mb(stored_total)}")
+    if stored_total:
+        saved = original_total - stored_total
+        print(f"Saved:         {_format_mb(saved)} (ratio {original_total / stored_total:.1f}x)")
+
+
+def snapshot_report():
+    """Print cow rows stored in the database vs rows a full copy of every snapshot would take."""
+    from sqlalchemy import text
+    from infrastructure.database import db_config
+
+    with db_config.engine.connect() as conn:
+        snapshots = conn.execute(text(
+            "SELECT count(*) AS total, "
+            "count(*) FILTER (WHERE base_snapshot_id IS NOT NULL) AS deltas, "
+            "COALESCE(sum(total_animales), 0) AS logical_rows "
+            "FROM global_hato WHERE status = 'ready'"
+        )).one()
+        stored_rows = conn.execute(text(
+            "SELECT count(*) FROM cows c JOIN global_hato g ON g.id = c.global_hato_id WHERE g.status = 'ready'"
+        )).scalar()
+
+    print(f"Ready snapshots: {snapshots.total} ({snapshots.deltas} delta-encoded)")
+    print(f"Cow rows if stored in full: {snapshots.logical_rows}")
+    print(f"Cow rows stored:            {stored_rows}")
+    if stored_rows:
+        saved = snapshots.logical_rows - stored_rows
+        print(f"Saved:                      {saved} rows (ratio {snapshots.logical_rows / stored_rows:.1f}x)")
+
+
+def benchmark(file_path: str, levels=(1, 6, 9)):
+    """Measure streaming gzip compression and decompression throughput."""
+    original = os.path.getsize(file_path)
+    print(f"Benchmark file: {file_path} ({_format_mb(original)})")
+    print(f"{'level':>5} {'ratio':>7} {'compress MB/s':>14} {'decompress MB/s':>16}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for level in levels:
+            dest = os.path.join(tmp_dir, f"bench_{level}.csv.gz")
+
+            start = time.perf_counter()
+            with open(file_path, "rb") as src, gzip.open(dest, "wb", compresslevel=level) as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            compress_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            _uncompressed_size(dest)
+            decompress_seconds = time.perf_counter() - start
+
+            stored = os.path.getsize(dest)
+            mb = original / (1024 * 1024)
+            print(
+                f"{level:>5} {original / stored:>6.1f}x "
+                f"{mb / compress_seconds:>14.1f} {mb / decompress_seconds:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-path", default=os.getenv("UPLOAD_BASE_PATH", "/app/uploads"))
+    parser.add_argument("--benchmark", metavar="CSV", help="Benchmark gzip throughput on a sample file")
+    parser.add_argument("--snapshots", action="store_true", help="Report cow rows saved by delta snapshots (PostgreSQL)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    elif args.snapshots:
+        snapshot_report()
+    else:
+        storage_report(args.base_path)
@@ -16,7 +16,9 @@ from infrastructure.adapters import (
     UserRepositoryAdapter,
     CowRepositoryAdapter,
     DatasetRepositoryAdapter,
-    GlobalHatoRepositoryAdapter
+    GlobalHatoRepositoryAdapter,
+    SnapshotRollupRepositoryAdapter,
+    SearchIndexRepositoryAdapter
 )
 
 # Domain Use Cases
@@ -30,6 +32,7 @@ from domain.usecases import (
     GetAllUsers,
     UpdateUserRole,
     CreateGlobalHato,
+    ReplaceGlobalHato,
     GetAllGlobalHatos,
     DeleteGlobalHato,
     RequestPasswordReset,
@@ -37,17 +40,26 @@ from domain.usecases import (
     VerifyResetCode,
     GetCorralesBySnapshot,
     GetCowsByGroup,
-    GetAllCowsBySnapshot
+    GetAllCowsBySnapshot,
+    CleanupAbandonedLoads,
+    GetHatoTrends,
+    GetCorralSeries,
+    GetSnapshotStatistics,
+    GetCorralRanking,
+    SearchCows,
+    FindTermSnapshots
 )
 from infrastructure.adapters.email_service import EmailService
+from infrastructure.monitoring import request_profiler
 
 # Presentation
-from presentation.controllers import AuthController, CowController, DatasetController, UserController, GlobalHatoController
-from presentation.routes import create_auth_routes, create_cow_routes, create_dataset_routes, create_user_routes, create_global_hato_routes
-from presentation.middleware import register_error_handlers
+from presentation.controllers import AuthController, CowController, DatasetController, UserController, GlobalHatoController, ProfileController, SearchController
+from presentation.routes import create_auth_routes, create_cow_routes, create_dataset_routes, create_user_routes, create_global_hato_routes, create_profile_routes, create_search_routes
+from presentation.middleware import register_error_handlers, register_metrics, register_sql_instrumentation
 
 # Utils
 from utils.constants import app_config
+from utils.logging_config import configure_logging
 
 
 def create_app() -> Flask:
@@ -57,6 +69,9 @@ def create_app() -> Flask:
     """
     load_dotenv()
 
+    # Structured logging through a background queue writer
+    configure_logging()
+
     app = Flask(__name__)
 
     # Configure Flask
@@ -73,7 +88,8 @@ def create_app() -> Flask:
     )
 
     # Initialize database
-    db_config.create_all_tables()
+    if app_config.CREATE_TABLES_ON_STARTUP:
+        db_config.create_all_tables()
 
     from infrastructure.ml.services import PredictionService
     
@@ -83,9 +99,18 @@ def create_app() -> Flask:
     cow_repository = CowRepositoryAdapter()
     dataset_repository = DatasetRepositoryAdapter()
     global_hato_repository = GlobalHatoRepositoryAdapter()
-
-    # Dependency Injection: Create service instances
-    prediction_service = PredictionService(model_dir=os.path.join(os.path.dirname(__file__), 'infrastructure', 'ml', 'models'))
+    snapshot_rollup_repository = SnapshotRollupRepositoryAdapter()
+    search_index_repository = SearchIndexRepositoryAdapter()
+
+    # Dependency Injection: Create service instances (model is loaded on first prediction,
+    # and only as a fallback when the shared inference server is configured)
+    prediction_service = PredictionService(
+        model_dir=os.path.join(os.path.dirname(__file__), 'infrastructure', 'ml', 'models'),
+        inference_socket=app_config.INFERENCE_SOCKET,
+        authkey=app_config.INFERENCE_AUTHKEY,
+        timeout=app_config.INFERENCE_TIMEOUT_SECONDS,
+        retry_after=app_config.INFERENCE_RETRY_SECONDS
+    )
 
     # Dependency Injection: Create use case instances
     login_user = LoginUser(auth_repository)
@@ -96,9 +121,14 @@ def create_app() -> Flask:
     upload_dataset = UploadDataset(dataset_repository)
     get_all_users = GetAllUsers(user_repository)
     update_user_role = UpdateUserRole(user_repository)
-    create_global_hato = CreateGlobalHato(global_hato_repository, prediction_service)
+    cleanup_abandoned_loads = CleanupAbandonedLoads(global_hato_repository)
+    create_global_hato = CreateGlobalHato(
+        global_hato_repository, prediction_service, cleanup_abandoned_loads, snapshot_rollup_repository,
+        search_index_repository
+    )
+    replace_global_hato = ReplaceGlobalHato(global_hato_repository, create_global_hato)
     get_all_global_hatos = GetAllGlobalHatos(global_hato_repository)
-    delete_global_hato = DeleteGlobalHato(global_hato_repository)
+    delete_global_hato = DeleteGlobalHato(global_hato_repository, snapshot_rollup_repository, search_index_repository)
     email_service = EmailService()
     request_password_reset = RequestPasswordReset(auth_repository, email_service)
     reset_password_usecase = ResetPassword(auth_repository)
@@ -106,6 +136,12 @@ def create_app() -> Flask:
     get_corrales_by_snapshot = GetCorralesBySnapshot(global_hato_repository)
     get_cows_by_group = GetCowsByGroup(global_hato_repository)
     get_all_cows_by_snapshot = GetAllCowsBySnapshot(global_hato_repository)
+    get_hato_trends = GetHatoTrends(snapshot_rollup_repository)
+    get_corral_series = GetCorralSeries(snapshot_rollup_repository)
+    get_snapshot_statistics = GetSnapshotStatistics(global_hato_repository)
+    get_corral_ranking = GetCorralRanking(global_hato_repository)
+    search_cows = SearchCows(search_index_repository)
+    find_term_snapshots = FindTermSnapshots(search_index_repository)
 
     # Dependency Injection: Create controller instances
     auth_controller = AuthController(
@@ -133,7 +169,17 @@ def create_app() -> Flask:
         delete_global_hato=delete_global_hato,
         get_corrales_by_snapshot=get_corrales_by_snapshot,
         get_cows_by_group=get_cows_by_group,
-        get_all_cows_by_snapshot=get_all_cows_by_snapshot
+        get_all_cows_by_snapshot=get_all_cows_by_snapshot,
+        get_hato_trends=get_hato_trends,
+        get_corral_series=get_corral_series,
+        get_snapshot_statistics=get_snapshot_statistics,
+        get_corral_ranking=get_corral_ranking,
+        replace_global_hato=replace_global_hato
+    )
+    profile_controller = ProfileController(request_profiler=request_profiler)
+    search_controller = SearchController(
+        search_cows=search_cows,
+        find_term_snapshots=find_term_snapshots
     )
 
     # Register blueprints with injected controllers
@@ -142,10 +188,18 @@ def create_app() -> Flask:
     app.register_blueprint(create_dataset_routes(dataset_controller))
     app.register_blueprint(create_user_routes(user_controller))
     app.register_blueprint(create_global_hato_routes(global_hato_controller))
+    app.register_blueprint(create_profile_routes(profile_controller))
+    app.register_blueprint(create_search_routes(search_controller))
 
     # Register error handlers
     register_error_handlers(app)
 
+    # Register Prometheus metrics (request latency + /metrics endpoint)
+    register_metrics(app)
+
+    # Register per-request SQL instrumentation (query count/time, N+1 detection)
+    register_sql_instrumentation(app)
+
     # Health check endpoints
     @app.route('/api/ping')
     def ping():
@@ -6,6 +6,14 @@ from .model import Model
 from .prediction import Prediction
 from .global_hato import GlobalHato
 from .corral_group import CorralGroup
+from .snapshot_rollup import SnapshotRollup
+from .corral_rollup import CorralRollup
+from .distribution_stats import DistributionStats
+from .search_term import SearchTerm, SearchMatch, SearchOccurrence
+from .cow_filter import CowFilter
+from .ranked_cow import RankedCow
+from .snapshot_diff import SnapshotDiff
+from .rescore_report import RescoreReport
 
 __all__ = [
     "User",
@@ -16,4 +24,14 @@ __all__ = [
     "Prediction",
     "GlobalHato",
     "CorralGroup",
+    "SnapshotRollup",
+    "CorralRollup",
+    "DistributionStats",
+    "SearchTerm",
+    "SearchMatch",
+    "SearchOccurrence",
+    "CowFilter",
+    "RankedCow",
+    "SnapshotDiff",
+    "RescoreReport",
 ]
@@ -0,0 +1,41 @@
+"""Corral rollup domain entity."""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, List, Optional
+from domain.entities.snapshot_rollup import summarize_cows
+
+
+@dataclass
+class CorralRollup:
+    """Totals of one corral (nombre_grupo) in one snapshot, kept for time series."""
+    global_hato_id: int
+    user_id: int
+    fecha_snapshot: date
+    nombre_grupo: str
+    total_animales: int
+    produccion_total: float  # Sum of produccion_leche_ayer
+    produccion_promedio: Optional[float]  # Average of produccion_leche_ayer
+    produccion_promedio_7dias: Optional[float]  # Average of produccion_media_7dias
+    en_produccion: int = 0
+    en_monitoreo: int = 0
+    previo_secado: int = 0
+    sin_recomendacion: int = 0
+
+    @classmethod
+    def from_cows(cls, global_hato, cows: Iterable) -> List["CorralRollup"]:
+        """Summarize a snapshot's cows per corral (cows without a group are left out, as in /corrales)."""
+        groups = defaultdict(list)
+        for cow in cows:
+            if cow.nombre_grupo:
+                groups[cow.nombre_grupo].append(cow)
+        return [
+            cls(
+                global_hato_id=global_hato.id,
+                user_id=global_hato.user_id,
+                fecha_snapshot=global_hato.fecha_snapshot,
+                nombre_grupo=nombre_grupo,
+                **summarize_cows(group)
+            )
+            for nombre_grupo, group in groups.items()
+        ]
@@ -1,6 +1,15 @@
 from dataclasses import dataclass
 from typing import Optional
 
+# Model inputs that are not API fields, stored as float32 so snapshots can be re-scored
+STORED_FEATURE_FIELDS = [
+    "numero_lactacion",
+    "numero_inseminaciones",
+    "dias_prenada",
+    "dias_para_parto",
+    "produccion_total_lactacion",
+]
+
 
 @dataclass
 class Cow:
@@ -15,3 +24,11 @@ class Cow:
     dias_ordeno: Optional[int] = None
     numero_seleccion: Optional[str] = None
     recomendacion: Optional[int] = None
+    # Hash of the uploaded row (see utils.content_hash), to spot unchanged cows on re-upload
+    content_hash: Optional[str] = None
+    # STORED_FEATURE_FIELDS
+    numero_lactacion: Optional[float] = None
+    numero_inseminaciones: Optional[float] = None
+    dias_prenada: Optional[float] = None
+    dias_para_parto: Optional[float] = None
+    produccion_total_lactacion: Optional[float] = None
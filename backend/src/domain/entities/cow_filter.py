@@ -0,0 +1,97 @@
+"""Cow filter domain entity (range and IN-list filters for snapshot reads)."""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+# Fields filterable by range: <field>_min / <field>_max (inclusive)
+RANGE_FIELDS = {
+    "produccion_leche_ayer": float,
+    "produccion_media_7dias": float,
+    "dias_ordeno": int,
+}
+# Fields filterable by a list of accepted values (repeat the parameter)
+IN_FIELDS = {
+    "nombre_grupo": str,
+    "estado_reproduccion": str,
+    "recomendacion": int,
+}
+MAX_IN_VALUES = 100
+
+
+@dataclass(frozen=True)
+class CowFilter:
+    """Validated conjunction of range and IN-list conditions on a snapshot's cows."""
+    ranges: Tuple[Tuple[str, Optional[Any], Optional[Any]], ...] = ()  # (field, min, max)
+    in_lists: Tuple[Tuple[str, Tuple[Any, ...]], ...] = ()  # (field, values)
+
+    @classmethod
+    def from_params(cls, params: Mapping[str, List[str]]) -> "CowFilter":
+        """
+        Parse request parameters; parameters that are not filters are ignored.
+
+        Args:
+            params: Parameter name -> raw values (several for IN lists)
+
+        Raises:
+            ValueError: If a value does not parse, a range is empty or a list is too long
+        """
+        ranges = []
+        for field, cast in RANGE_FIELDS.items():
+            low = cls._single(params, f"{field}_min", cast)
+            high = cls._single(params, f"{field}_max", cast)
+            if low is not None and high is not None and low > high:
+                raise ValueError(f"{field}_min must not be greater than {field}_max")
+            if low is not None or high is not None:
+                ranges.append((field, low, high))
+
+        in_lists = []
+        for field, cast in IN_FIELDS.items():
+            raw = [value for value in params.get(field, []) if value != ""]
+            if not raw:
+                continue
+            if len(raw) > MAX_IN_VALUES:
+                raise ValueError(f"At most {MAX_IN_VALUES} values are allowed for {field}")
+            try:
+                values = tuple(sorted({cast(value) for value in raw}))
+            except ValueError:
+                raise ValueError(f"Invalid value for {field}")
+            in_lists.append((field, values))
+
+        return cls(ranges=tuple(ranges), in_lists=tuple(in_lists))
+
+    @staticmethod
+    def _single(params: Mapping[str, List[str]], name: str, cast) -> Optional[Any]:
+        values = [value for value in params.get(name, []) if value != ""]
+        if not values:
+            return None
+        try:
+            return cast(values[-1])
+        except ValueError:
+            raise ValueError(f"Invalid value for {name}")
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.ranges and not self.in_lists
+
+    @property
+    def shape(self) -> Tuple[Tuple[str, str], ...]:
+        """Fields and operators used, without values (filters of the same shape share a query)."""
+        shape = []
+        for field, low, high in self.ranges:
+            if low is not None:
+                shape.append((field, "min"))
+            if high is not None:
+                shape.append((field, "max"))
+        shape.extend((field, "in") for field, _ in self.in_lists)
+        return tuple(shape)
+
+    def bind_values(self) -> Dict[str, Any]:
+        """Values of the shape's parameters, keyed like the compiled query's bind parameters."""
+        values = {}
+        for field, low, high in self.ranges:
+            if low is not None:
+                values[f"filter_{field}_min"] = low
+            if high is not None:
+                values[f"filter_{field}_max"] = high
+        for field, accepted in self.in_lists:
+            values[f"filter_{field}_in"] = list(accepted)
+        return values
@@ -0,0 +1,62 @@
+"""Distribution statistics domain entity."""
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+# Cow columns the statistics endpoint describes
+STATISTICS_FIELDS = ["produccion_leche_ayer", "produccion_media_7dias", "dias_ordeno"]
+
+# Percentiles reported, as fractions (interpolated like percentile_cont)
+PERCENTILES = (0.10, 0.25, 0.50, 0.75, 0.90)
+
+
+@dataclass
+class DistributionStats:
+    """Summary and equal-width histogram of one cow column (NULLs excluded)."""
+    count: int
+    nulls: int
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    std: Optional[float] = None  # Population standard deviation
+    p10: Optional[float] = None
+    p25: Optional[float] = None
+    median: Optional[float] = None
+    p75: Optional[float] = None
+    p90: Optional[float] = None
+    bin_edges: List[float] = field(default_factory=list)  # len(counts) + 1 edges, last bin closed
+    counts: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_values(cls, values: Sequence[Optional[float]], bins: int) -> "DistributionStats":
+        """
+        Describe a column's values in a fixed-size result, vectorized with NumPy.
+
+        Args:
+            values: Column values, None for NULL
+            bins: Number of equal-width histogram bins between min and max
+        """
+        # Imported here to keep NumPy out of app startup
+        import numpy as np
+
+        array = np.array([value for value in values if value is not None], dtype=float)
+        nulls = len(values) - len(array)
+        if not len(array):
+            return cls(count=0, nulls=nulls)
+
+        p10, p25, median, p75, p90 = np.percentile(array, [p * 100 for p in PERCENTILES])
+        counts, edges = np.histogram(array, bins=bins)
+        return cls(
+            count=len(array),
+            nulls=nulls,
+            min=float(array.min()),
+            max=float(array.max()),
+            mean=round(float(array.mean()), 2),
+            std=round(float(array.std()), 2),
+            p10=float(p10),
+            p25=float(p25),
+            median=float(median),
+            p75=float(p75),
+            p90=float(p90),
+            bin_edges=[round(float(edge), 2) for edge in edges],
+            counts=[int(count) for count in counts],
+        )
@@ -15,3 +15,6 @@ class GlobalHato:
     grupos_detectados: int
     created_at: datetime
     blob_route: Optional[str] = None
+    status: str = "ready"
+    archive_route: Optional[str] = None
+    base_snapshot_id: Optional[int] = None
@@ -0,0 +1,13 @@
+"""Ranked cow entity (a cow's position within its corral by some metric)."""
+from dataclasses import dataclass
+from .cow import Cow
+
+# Metrics cows can be ranked by within their corral
+RANKING_FIELDS = ["produccion_leche_ayer", "produccion_media_7dias", "dias_ordeno"]
+
+
+@dataclass
+class RankedCow:
+    """Entity representing a cow and its 1-based rank within its corral."""
+    rank: int
+    cow: Cow
@@ -0,0 +1,16 @@
+"""Rescore report entity (outcome of a bulk re-scoring run)."""
+from dataclasses import dataclass
+
+
+@dataclass
+class RescoreReport:
+    """Entity summarizing a bulk re-scoring run."""
+    snapshots: int
+    rows: int
+    changed: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Throughput of the run (rows read, scored and written per second)."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
@@ -0,0 +1,52 @@
+"""Cross-snapshot search domain entities."""
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, List
+from utils.constants.search_kinds import SEARCH_KIND_FIELDS
+
+
+@dataclass
+class SearchTerm:
+    """A distinct animal number, selection number or group name present in one snapshot."""
+    global_hato_id: int
+    user_id: int
+    fecha_snapshot: date
+    kind: str  # One of SEARCH_KIND_FIELDS
+    term: str
+
+    @classmethod
+    def from_cows(cls, global_hato, cows: Iterable) -> List["SearchTerm"]:
+        """Distinct non-empty values of every searchable field of a snapshot's cows."""
+        seen = set()
+        for cow in cows:
+            for kind, field in SEARCH_KIND_FIELDS.items():
+                value = getattr(cow, field)
+                if value:
+                    seen.add((kind, str(value)))
+        return [
+            cls(
+                global_hato_id=global_hato.id,
+                user_id=global_hato.user_id,
+                fecha_snapshot=global_hato.fecha_snapshot,
+                kind=kind,
+                term=term
+            )
+            for kind, term in sorted(seen)
+        ]
+
+
+@dataclass
+class SearchMatch:
+    """A term found in a user's snapshots."""
+    kind: str
+    term: str
+    snapshots: int  # Snapshots the term appears in
+    last_fecha_snapshot: date  # Most recent of them
+
+
+@dataclass
+class SearchOccurrence:
+    """A snapshot a term appears in."""
+    global_hato_id: int
+    nombre: str
+    fecha_snapshot: date
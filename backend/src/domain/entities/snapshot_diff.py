@@ -0,0 +1,16 @@
+"""Snapshot diff entity (outcome of re-uploading a snapshot)."""
+from dataclasses import dataclass
+
+
+@dataclass
+class SnapshotDiff:
+    """Entity counting how a re-upload changed a snapshot's cows (matched by numero_animal)."""
+    unchanged: int
+    changed: int
+    added: int
+    removed: int
+
+    @property
+    def rescored(self) -> int:
+        """Cows sent to the model (changed and added ones)."""
+        return self.changed + self.added
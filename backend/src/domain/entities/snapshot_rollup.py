@@ -0,0 +1,66 @@
+"""Snapshot rollup domain entity."""
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, Optional
+from utils.constants.recomendaciones import (
+    RECOMENDACION_EN_MONITOREO,
+    RECOMENDACION_EN_PRODUCCION,
+    RECOMENDACION_PREVIO_SECADO,
+)
+
+
+def summarize_cows(cows: Iterable) -> Dict[str, Any]:
+    """Headcount, production totals/means and recommendation mix of some cows, in one pass."""
+    total = 0
+    leche_sum, leche_count = 0.0, 0
+    media_sum, media_count = 0.0, 0
+    recomendaciones = {}
+    for cow in cows:
+        total += 1
+        if cow.produccion_leche_ayer is not None:
+            leche_sum += cow.produccion_leche_ayer
+            leche_count += 1
+        if cow.produccion_media_7dias is not None:
+            media_sum += cow.produccion_media_7dias
+            media_count += 1
+        recomendaciones[cow.recomendacion] = recomendaciones.get(cow.recomendacion, 0) + 1
+
+    known = (RECOMENDACION_EN_PRODUCCION, RECOMENDACION_EN_MONITOREO, RECOMENDACION_PREVIO_SECADO)
+    return {
+        "total_animales": total,
+        "produccion_total": round(leche_sum, 2),
+        "produccion_promedio": round(leche_sum / leche_count, 2) if leche_count else None,
+        "produccion_promedio_7dias": round(media_sum / media_count, 2) if media_count else None,
+        "en_produccion": recomendaciones.get(RECOMENDACION_EN_PRODUCCION, 0),
+        "en_monitoreo": recomendaciones.get(RECOMENDACION_EN_MONITOREO, 0),
+        "previo_secado": recomendaciones.get(RECOMENDACION_PREVIO_SECADO, 0),
+        "sin_recomendacion": sum(count for value, count in recomendaciones.items() if value not in known),
+    }
+
+
+@dataclass
+class SnapshotRollup:
+    """Herd totals of one Global Hato snapshot, kept for trend charts."""
+    global_hato_id: int
+    user_id: int
+    fecha_snapshot: date
+    total_animales: int
+    grupos_detectados: int
+    produccion_total: float  # Sum of produccion_leche_ayer
+    produccion_promedio: Optional[float]  # Average of produccion_leche_ayer
+    produccion_promedio_7dias: Optional[float]  # Average of produccion_media_7dias
+    en_produccion: int = 0
+    en_monitoreo: int = 0
+    previo_secado: int = 0
+    sin_recomendacion: int = 0
+
+    @classmethod
+    def from_cows(cls, global_hato, cows: Iterable) -> "SnapshotRollup":
+        """Summarize a snapshot's cows."""
+        return cls(
+            global_hato_id=global_hato.id,
+            user_id=global_hato.user_id,
+            fecha_snapshot=global_hato.fecha_snapshot,
+            grupos_detectados=global_hato.grupos_detectados,
+            **summarize_cows(cows)
+        )
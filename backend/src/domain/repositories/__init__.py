@@ -3,6 +3,8 @@ from .i_user_repository import IUserRepository
 from .i_cow_repository import ICowRepository
 from .i_dataset_repository import IDatasetRepository
 from .i_global_hato_repository import IGlobalHatoRepository
+from .i_snapshot_rollup_repository import ISnapshotRollupRepository
+from .i_search_index_repository import ISearchIndexRepository
 
 __all__ = [
     "IAuthRepository",
@@ -10,4 +12,6 @@ __all__ = [
     "ICowRepository",
     "IDatasetRepository",
     "IGlobalHatoRepository",
+    "ISnapshotRollupRepository",
+    "ISearchIndexRepository",
 ]
@@ -1,6 +1,7 @@
 """Global Hato repository interface."""
-from typing import Protocol, Optional, List, Dict, Any
-from domain.entities import GlobalHato, Cow
+from datetime import date, datetime
+from typing import Protocol, Optional, List, Dict, Any, Tuple
+from domain.entities import GlobalHato, Cow, CowFilter, RankedCow
 
 
 class IGlobalHatoRepository(Protocol):
@@ -11,7 +12,30 @@ class IGlobalHatoRepository(Protocol):
         global_hato: GlobalHato,
         cows: List[Cow]
     ) -> GlobalHato:
-        """Create a new Global Hato snapshot with associated cows."""
+        """
+        Create a new Global Hato snapshot with associated cows.
+
+        The snapshot must only become visible to reads once all cows are stored.
+        """
+        ...
+
+    async def cleanup_abandoned_loads(self, older_than: datetime) -> int:
+        """Remove snapshots still loading whose last progress (committed chunk) is before `older_than`."""
+        ...
+
+    async def find_archive_candidates(self, older_than: date, limit: Optional[int] = None) -> List[int]:
+        """Get IDs of ready snapshots taken before `older_than`, oldest first."""
+        ...
+
+    async def archive_snapshot(self, global_hato_id: int) -> bool:
+        """
+        Move a snapshot's cows to cold storage and mark it archived.
+
+        Archived snapshots must keep being served by the read methods.
+
+        Returns:
+            True if archived, False if the snapshot was not eligible
+        """
         ...
 
     async def find_all_by_user(
@@ -37,6 +61,73 @@ class IGlobalHatoRepository(Protocol):
         """Find Global Hato snapshot by ID."""
         ...
 
+    async def find_latest_by_fecha(self, user_id: int, fecha_snapshot: date) -> Optional[GlobalHato]:
+        """Find the user's newest ready snapshot taken on a date."""
+        ...
+
+    async def get_cow_hashes(
+        self,
+        global_hato_id: int,
+        user_id: int
+    ) -> Optional[Dict[str, Tuple[Optional[str], Optional[int]]]]:
+        """
+        Get the content hash and recomendacion of each cow of a ready snapshot.
+
+        Returns:
+            Dict of numero_animal -> (content_hash, recomendacion), or None if the
+            snapshot is not ready (hash is None for cows stored without one)
+
+        Raises:
+            ValueError: If animal numbers are missing or repeated (cows cannot be matched)
+        """
+        ...
+
+    async def replace_cows(
+        self,
+        global_hato: GlobalHato,
+        upserts: List[Cow],
+        removed: List[str]
+    ) -> Optional[GlobalHato]:
+        """
+        Replace part of a ready snapshot's cows in one transaction.
+
+        Args:
+            global_hato: Snapshot with the new header values (nombre, totals, blob_route)
+            upserts: Changed or new cows, matched by numero_animal
+            removed: numero_animal of the cows to delete
+
+        Returns:
+            Updated GlobalHato, or None if the snapshot is no longer ready
+        """
+        ...
+
+    async def find_ready_ids(self, user_id: Optional[int] = None) -> List[int]:
+        """Get IDs of ready snapshots (optionally one user's), oldest first."""
+        ...
+
+    async def get_feature_batch(
+        self,
+        global_hato_id: int,
+        after_id: int = 0,
+        limit: int = 5000
+    ) -> List[Tuple[int, List[Optional[float]]]]:
+        """
+        Get the next cows stored in a snapshot, by row ID, with their model features.
+
+        Returns:
+            List of (row ID, features in PredictionService order), at most `limit`
+            rows with an ID above `after_id`; empty once the snapshot is exhausted
+        """
+        ...
+
+    async def update_recomendaciones(self, global_hato_id: int, recomendaciones: Dict[int, Optional[int]]) -> int:
+        """Set the recomendacion of stored cows by row ID; returns the number of rows that changed."""
+        ...
+
+    async def mark_updated(self, global_hato_id: int) -> List[int]:
+        """Mark a snapshot and its delta snapshots as updated; returns their IDs."""
+        ...
+
     async def get_corrales_by_snapshot(self, global_hato_id: int, user_id: int) -> List[Any]:
         """Get aggregated corral data for a snapshot."""
         ...
@@ -54,16 +145,55 @@ class IGlobalHatoRepository(Protocol):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         search: Optional[str] = None,
-        nombre_grupo: Optional[str] = None
+        nombre_grupo: Optional[str] = None,
+        recomendacion: Optional[int] = None,
+        cow_filter: Optional[CowFilter] = None
     ) -> Dict[str, Any]:
         """
         Get all cows for a snapshot with pagination, sorting, and filtering.
 
+        `cow_filter` conditions are combined with the other filters (AND).
+
         Returns:
             Dict with 'cows', 'pagination' (total, page, limit, pages)
         """
         ...
 
+    async def get_column_values(
+        self,
+        global_hato_id: int,
+        user_id: int,
+        columns: List[str],
+        nombre_grupo: Optional[str] = None
+    ) -> Optional[Dict[str, List[Any]]]:
+        """
+        Get the raw values of some cow columns in a snapshot, optionally for one group.
+
+        Returns:
+            Dict of column -> values (None for NULL), or None if the snapshot is not visible
+        """
+        ...
+
+    async def get_ranked_cows_by_group(
+        self,
+        global_hato_id: int,
+        user_id: int,
+        sort_by: str,
+        descending: bool = False,
+        limit: int = 10,
+        nombre_grupos: Optional[List[str]] = None
+    ) -> Optional[List[RankedCow]]:
+        """
+        Get the first `limit` cows of every corral ranked by one column, in one query.
+
+        Cows without a group or without a value for the column are not ranked;
+        ties are broken by cow id.
+
+        Returns:
+            Ranked cows ordered by nombre_grupo then rank, or None if the snapshot is not visible
+        """
+        ...
+
     async def delete(self, global_hato_id: int, user_id: int) -> None:
         """Delete Global Hato snapshot and all associated cows (with user ownership check)."""
         ...
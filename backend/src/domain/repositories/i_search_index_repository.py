@@ -0,0 +1,43 @@
+"""Search index repository interface."""
+from typing import Protocol, Optional, List
+from domain.entities import SearchTerm, SearchMatch, SearchOccurrence
+
+
+class ISearchIndexRepository(Protocol):
+    """Repository of the per-snapshot search terms used by cross-snapshot search."""
+
+    async def save(self, global_hato_id: int, terms: List[SearchTerm]) -> None:
+        """Replace the search terms of a snapshot."""
+        ...
+
+    async def delete(self, global_hato_id: int) -> None:
+        """Delete the search terms of a snapshot."""
+        ...
+
+    async def find_missing(self) -> List[int]:
+        """Get IDs of visible snapshots that have no search terms."""
+        ...
+
+    async def find_by_prefix(
+        self,
+        user_id: int,
+        prefix: str,
+        kind: Optional[str] = None,
+        limit: int = 10
+    ) -> List[SearchMatch]:
+        """Get a user's terms starting with `prefix` (case-insensitive), alphabetically."""
+        ...
+
+    async def find_containing(
+        self,
+        user_id: int,
+        text: str,
+        kind: Optional[str] = None,
+        limit: int = 10
+    ) -> List[SearchMatch]:
+        """Get a user's terms containing `text` (case-insensitive), alphabetically."""
+        ...
+
+    async def find_occurrences(self, user_id: int, kind: str, term: str) -> List[SearchOccurrence]:
+        """Get the user's snapshots a term appears in, newest first."""
+        ...
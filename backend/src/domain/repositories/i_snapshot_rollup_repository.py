@@ -0,0 +1,39 @@
+"""Snapshot rollup repository interface."""
+from datetime import date
+from typing import Protocol, Optional, List
+from domain.entities import SnapshotRollup, CorralRollup
+
+
+class ISnapshotRollupRepository(Protocol):
+    """Snapshot rollup repository interface following the Repository pattern."""
+
+    async def save(self, rollup: SnapshotRollup, corrales: Optional[List[CorralRollup]] = None) -> None:
+        """Insert or replace the rollup of a snapshot and its per-corral rows."""
+        ...
+
+    async def delete(self, global_hato_id: int) -> None:
+        """Delete the rollup of a snapshot and its per-corral rows."""
+        ...
+
+    async def find_missing(self) -> List[int]:
+        """Get IDs of visible snapshots without a rollup (or without their per-corral rows)."""
+        ...
+
+    async def find_by_user(
+        self,
+        user_id: int,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None
+    ) -> List[SnapshotRollup]:
+        """Get a user's rollups within a date window, oldest first."""
+        ...
+
+    async def find_corral_series(
+        self,
+        user_id: int,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None,
+        nombre_grupo: Optional[str] = None
+    ) -> List[CorralRollup]:
+        """Get a user's per-corral rows within a date window, ordered by date then corral."""
+        ...
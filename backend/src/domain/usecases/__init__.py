@@ -7,6 +7,7 @@ from .upload_dataset import UploadDataset
 from .get_all_users import GetAllUsers
 from .update_user_role import UpdateUserRole
 from .create_global_hato import CreateGlobalHato
+from .replace_global_hato import ReplaceGlobalHato
 from .get_all_global_hatos import GetAllGlobalHatos
 from .delete_global_hato import DeleteGlobalHato
 from .password_recovery import RequestPasswordReset, ResetPassword
@@ -14,6 +15,17 @@ from .verify_reset_code import VerifyResetCode
 from .get_corrales_by_snapshot import GetCorralesBySnapshot
 from .get_cows_by_group import GetCowsByGroup
 from .get_all_cows_by_snapshot import GetAllCowsBySnapshot
+from .cleanup_abandoned_loads import CleanupAbandonedLoads
+from .archive_old_snapshots import ArchiveOldSnapshots
+from .get_hato_trends import GetHatoTrends
+from .get_corral_series import GetCorralSeries
+from .get_snapshot_statistics import GetSnapshotStatistics
+from .get_corral_ranking import GetCorralRanking
+from .search_cows import SearchCows
+from .find_term_snapshots import FindTermSnapshots
+from .rebuild_search_index import RebuildSearchIndex
+from .rebuild_snapshot_rollups import RebuildSnapshotRollups
+from .rescore_snapshots import RescoreSnapshots
 
 __all__ = [
     "LoginUser",
@@ -25,6 +37,7 @@ __all__ = [
     "GetAllUsers",
     "UpdateUserRole",
     "CreateGlobalHato",
+    "ReplaceGlobalHato",
     "GetAllGlobalHatos",
     "DeleteGlobalHato",
     "RequestPasswordReset",
@@ -33,4 +46,15 @@ __all__ = [
     "GetCorralesBySnapshot",
     "GetCowsByGroup",
     "GetAllCowsBySnapshot",
+    "CleanupAbandonedLoads",
+    "ArchiveOldSnapshots",
+    "GetHatoTrends",
+    "GetCorralSeries",
+    "GetSnapshotStatistics",
+    "GetCorralRanking",
+    "SearchCows",
+    "FindTermSnapshots",
+    "RebuildSearchIndex",
+    "RebuildSnapshotRollups",
+    "RescoreSnapshots",
 ]
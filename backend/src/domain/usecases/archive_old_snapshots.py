@@ -0,0 +1,48 @@
+"""Use case for moving old Global Hato snapshots to cold storage."""
+import logging
+from datetime import date, timedelta
+from typing import List, Optional
+from domain.repositories import IGlobalHatoRepository
+from utils.constants import app_config
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveOldSnapshots:
+    """Use case for archiving snapshots older than a cutoff, so hot storage tracks recent activity."""
+
+    def __init__(self, global_hato_repository: IGlobalHatoRepository):
+        self.global_hato_repository = global_hato_repository
+
+    async def execute(self, older_than_days: Optional[int] = None, limit: Optional[int] = None) -> List[int]:
+        """
+        Execute the archival use case.
+
+        Snapshots are archived one at a time, so a failure only affects that
+        snapshot (it stays ready) and the rest are still processed.
+
+        Args:
+            older_than_days: Snapshots taken more than this many days ago are archived
+                (default: ARCHIVE_AFTER_DAYS)
+            limit: Maximum number of snapshots to archive in this run
+
+        Returns:
+            IDs of the archived snapshots
+        """
+        if older_than_days is None:
+            older_than_days = app_config.ARCHIVE_AFTER_DAYS
+
+        older_than = date.today() - timedelta(days=older_than_days)
+        candidates = await self.global_hato_repository.find_archive_candidates(older_than, limit)
+
+        archived = []
+        for global_hato_id in candidates:
+            try:
+                if await self.global_hato_repository.archive_snapshot(global_hato_id):
+                    archived.append(global_hato_id)
+            except Exception:
+                logger.exception("Could not archive Global Hato %s", global_hato_id)
+
+        if archived:
+            logger.info("Archived snapshots", extra={"archived": len(archived), "candidates": len(candidates)})
+        return archived
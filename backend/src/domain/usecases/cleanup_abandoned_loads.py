@@ -0,0 +1,35 @@
+"""Use case for removing Global Hato snapshots whose staged load never finished."""
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from domain.repositories import IGlobalHatoRepository
+from utils.constants import app_config
+
+logger = logging.getLogger(__name__)
+
+
+class CleanupAbandonedLoads:
+    """Use case for removing snapshots left in 'loading' status (e.g., the worker died mid-ingest)."""
+
+    def __init__(self, global_hato_repository: IGlobalHatoRepository):
+        self.global_hato_repository = global_hato_repository
+
+    async def execute(self, max_age_minutes: Optional[int] = None) -> int:
+        """
+        Execute the cleanup use case.
+
+        Args:
+            max_age_minutes: Loads without progress for this long are abandoned
+                (default: INGEST_ABANDONED_LOAD_MINUTES)
+
+        Returns:
+            Number of abandoned snapshots removed
+        """
+        if max_age_minutes is None:
+            max_age_minutes = app_config.INGEST_ABANDONED_LOAD_MINUTES
+
+        older_than = datetime.now() - timedelta(minutes=max_age_minutes)
+        removed = await self.global_hato_repository.cleanup_abandoned_loads(older_than)
+        if removed:
+            logger.warning("Removed abandoned snapshot loads", extra={"removed": removed})
+        return removed
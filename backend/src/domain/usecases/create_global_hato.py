@@ -1,17 +1,61 @@
 """Use case for creating a new Global Hato snapshot."""
-from typing import List, Dict, Any, Optional
+import time
+import logging
+from collections import Counter
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from datetime import date, datetime
-from domain.repositories import IGlobalHatoRepository
-from domain.entities import GlobalHato, Cow
+from domain.repositories import IGlobalHatoRepository, ISnapshotRollupRepository, ISearchIndexRepository
+from domain.entities import GlobalHato, Cow, SnapshotRollup, CorralRollup, SearchTerm
+from domain.entities.cow import STORED_FEATURE_FIELDS
 from infrastructure.ml.services import PredictionService
+from infrastructure.monitoring import ingest_stage
+from utils.content_hash import row_content_hash
+
+if TYPE_CHECKING:
+    from domain.usecases.cleanup_abandoned_loads import CleanupAbandonedLoads
+
+logger = logging.getLogger(__name__)
+
+
+def build_cow(cow_data: Dict[str, Any], recomendacion: Optional[int]) -> Cow:
+    """Cow entity (not yet stored) from a parsed row and its predicted category."""
+    return Cow(
+        id=0,  # Will be set by database
+        global_hato_id=0,  # Will be set after global_hato creation
+        numero_animal=str(cow_data.get('numero_animal', '')),
+        nombre_grupo=str(cow_data.get('nombre_grupo', '')),
+        produccion_leche_ayer=float(cow_data['produccion_leche_ayer']) if cow_data.get('produccion_leche_ayer') is not None else None,
+        produccion_media_7dias=float(cow_data['produccion_media_7dias']) if cow_data.get('produccion_media_7dias') is not None else None,
+        estado_reproduccion=str(cow_data.get('estado_reproduccion', '')),
+        dias_ordeno=int(cow_data['dias_ordeno']) if cow_data.get('dias_ordeno') is not None else None,
+        numero_seleccion=str(cow_data['numero_seleccion']) if cow_data.get('numero_seleccion') else None,
+        recomendacion=recomendacion,
+        content_hash=row_content_hash(cow_data),
+        **{field: _feature(cow_data, field) for field in STORED_FEATURE_FIELDS}
+    )
+
+
+def _feature(cow_data: Dict[str, Any], field: str) -> Optional[float]:
+    value = cow_data.get(field)
+    return float(value) if value is not None else None
 
 
 class CreateGlobalHato:
     """Use case for creating a new Global Hato snapshot with cows."""
 
-    def __init__(self, global_hato_repository: IGlobalHatoRepository, prediction_service: PredictionService):
+    def __init__(
+        self,
+        global_hato_repository: IGlobalHatoRepository,
+        prediction_service: PredictionService,
+        cleanup_abandoned_loads: Optional['CleanupAbandonedLoads'] = None,
+        snapshot_rollup_repository: Optional[ISnapshotRollupRepository] = None,
+        search_index_repository: Optional[ISearchIndexRepository] = None
+    ):
         self.global_hato_repository = global_hato_repository
         self.prediction_service = prediction_service
+        self.cleanup_abandoned_loads = cleanup_abandoned_loads
+        self.snapshot_rollup_repository = snapshot_rollup_repository
+        self.search_index_repository = search_index_repository
 
     async def execute(
         self,
@@ -66,24 +110,59 @@ class CreateGlobalHato:
 
         # Create Cow entities
         cows = []
-        for cow_data in cows_data:
-            # Predict category
-            recomendacion = self.prediction_service.predict_cow_category(cow_data)
-            
-            cows.append(
-                Cow(
-                    id=0,  # Will be set by database
-                    global_hato_id=0,  # Will be set after global_hato creation
-                    numero_animal=str(cow_data.get('numero_animal', '')),
-                    nombre_grupo=str(cow_data.get('nombre_grupo', '')),
-                    produccion_leche_ayer=float(cow_data['produccion_leche_ayer']) if cow_data.get('produccion_leche_ayer') is not None else None,
-                    produccion_media_7dias=float(cow_data['produccion_media_7dias']) if cow_data.get('produccion_media_7dias') is not None else None,
-                    estado_reproduccion=str(cow_data.get('estado_reproduccion', '')),
-                    dias_ordeno=int(cow_data['dias_ordeno']) if cow_data.get('dias_ordeno') is not None else None,
-                    numero_seleccion=str(cow_data['numero_seleccion']) if cow_data.get('numero_seleccion') else None,
-                    recomendacion=recomendacion
+        predict_start = time.perf_counter()
+        with ingest_stage('predict', rows=len(cows_data)):
+            # One model call for the whole upload
+            recomendaciones = self.prediction_service.predict_cows(cows_data)
+            for cow_data, recomendacion in zip(cows_data, recomendaciones):
+                cows.append(build_cow(cow_data, recomendacion))
+
+        # One summary record per batch instead of per-row logs
+        recomendaciones = Counter(cow.recomendacion for cow in cows)
+        unscored = recomendaciones.pop(None, 0)
+        logger.log(
+            logging.WARNING if unscored and self.prediction_service.is_available() else logging.INFO,
+            "Prediction batch finished",
+            extra={
+                "rows": len(cows),
+                "unscored": unscored,
+                "recomendaciones": dict(recomendaciones),
+                "seconds": round(time.perf_counter() - predict_start, 3),
+            }
+        )
+
+        # Sweep loads abandoned by crashed workers; never fail this upload because of it
+        if self.cleanup_abandoned_loads is not None:
+            try:
+                await self.cleanup_abandoned_loads.execute()
+            except Exception:
+                logger.exception("Abandoned load cleanup failed")
+
+        # Save to repository (staged: chunked inserts, then atomic publish)
+        with ingest_stage('persist', rows=len(cows)):
+            created = await self.global_hato_repository.create_global_hato(global_hato, cows)
+
+        await self.save_summaries(created, cows)
+        return created
+
+    async def save_summaries(self, global_hato: GlobalHato, cows: List[Cow]) -> None:
+        """
+        Save a snapshot's trend rollups and search terms from the cows already in memory.
+
+        Failures are logged, never raised: missing rollups and search terms are
+        rebuilt later by their scripts.
+        """
+        if self.snapshot_rollup_repository is not None:
+            try:
+                await self.snapshot_rollup_repository.save(
+                    SnapshotRollup.from_cows(global_hato, cows), CorralRollup.from_cows(global_hato, cows)
                 )
-            )
+            except Exception:
+                logger.exception("Could not save trend rollup for Global Hato %s", global_hato.id)
 
-        # Save to repository
-        return await self.global_hato_repository.create_global_hato(global_hato, cows)
+        # Cross-snapshot search terms, same policy
+        if self.search_index_repository is not None:
+            try:
+                await self.search_index_repository.save(global_hato.id, SearchTerm.from_cows(global_hato, cows))
+            except Exception:
+                logger.exception("Could not index Global Hato %s for search", global_hato.id)
@@ -1,13 +1,24 @@
 """Use case for deleting a Global Hato snapshot."""
-from domain.repositories import IGlobalHatoRepository
-from infrastructure.storage import local_storage_service
+import logging
+from typing import Optional
+from domain.repositories import IGlobalHatoRepository, ISnapshotRollupRepository, ISearchIndexRepository
+from infrastructure.storage import storage_service
+
+logger = logging.getLogger(__name__)
 
 
 class DeleteGlobalHato:
     """Use case for deleting a Global Hato snapshot and its cows."""
 
-    def __init__(self, global_hato_repository: IGlobalHatoRepository):
+    def __init__(
+        self,
+        global_hato_repository: IGlobalHatoRepository,
+        snapshot_rollup_repository: Optional[ISnapshotRollupRepository] = None,
+        search_index_repository: Optional[ISearchIndexRepository] = None
+    ):
         self.global_hato_repository = global_hato_repository
+        self.snapshot_rollup_repository = snapshot_rollup_repository
+        self.search_index_repository = search_index_repository
 
     async def execute(self, global_hato_id: int, user_id: int) -> None:
         """
@@ -32,12 +43,28 @@ class DeleteGlobalHato:
         # Delete file from disk if it exists
         if global_hato.blob_route:
             try:
-                deleted = local_storage_service.delete_file(global_hato.blob_route)
+                deleted = storage_service.delete_file(global_hato.blob_route)
                 if not deleted:
-                    print(f"Warning: Could not delete file {global_hato.blob_route}")
+                    logger.warning("Could not delete file %s", global_hato.blob_route)
             except Exception as e:
                 # Log but don't fail - database cleanup more important
-                print(f"Error deleting file {global_hato.blob_route}: {str(e)}")
+                logger.error("Error deleting file %s: %s", global_hato.blob_route, e)
+
+        # Archived snapshots keep their cows in a separate file
+        if global_hato.archive_route:
+            try:
+                if not storage_service.delete_file(global_hato.archive_route):
+                    logger.warning("Could not delete archive %s", global_hato.archive_route)
+            except Exception as e:
+                logger.error("Error deleting archive %s: %s", global_hato.archive_route, e)
+
+        # Drop the snapshot from the trend rollups
+        if self.snapshot_rollup_repository is not None:
+            await self.snapshot_rollup_repository.delete(global_hato_id)
+
+        # And from the cross-snapshot search
+        if self.search_index_repository is not None:
+            await self.search_index_repository.delete(global_hato_id)
 
         # Delete Global Hato (CASCADE will delete cows)
         await self.global_hato_repository.delete(global_hato_id, user_id)
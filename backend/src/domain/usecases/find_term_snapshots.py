@@ -0,0 +1,33 @@
+"""Use case for listing the snapshots an animal, selection number or group appears in."""
+from typing import List
+from domain.entities import SearchOccurrence
+from domain.repositories import ISearchIndexRepository
+from utils.constants.search_kinds import SEARCH_KIND_FIELDS
+
+
+class FindTermSnapshots:
+    """Use case for following one term across a user's snapshots."""
+
+    def __init__(self, search_index_repository: ISearchIndexRepository):
+        self.search_index_repository = search_index_repository
+
+    async def execute(self, user_id: int, kind: str, term: str) -> List[SearchOccurrence]:
+        """
+        Execute the use case.
+
+        Args:
+            user_id: ID of the user
+            kind: Kind of term (animal, seleccion, grupo)
+            term: Exact term, as returned by the search
+
+        Returns:
+            Snapshots containing the term, newest first
+
+        Raises:
+            ValueError: If kind is unknown or term is empty
+        """
+        if kind not in SEARCH_KIND_FIELDS:
+            raise ValueError(f"kind must be one of: {', '.join(SEARCH_KIND_FIELDS)}")
+        if not term:
+            raise ValueError("term is required")
+        return await self.search_index_repository.find_occurrences(user_id, kind, term)
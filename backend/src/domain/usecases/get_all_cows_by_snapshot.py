@@ -1,5 +1,6 @@
 """Use case for retrieving all cows from a snapshot with pagination and filtering."""
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Mapping, Optional
+from domain.entities import CowFilter
 from domain.repositories import IGlobalHatoRepository
 
 
@@ -19,7 +20,8 @@ class GetAllCowsBySnapshot:
         sort_order: Optional[str] = None,
         search: Optional[str] = None,
         nombre_grupo: Optional[str] = None,
-        recomendacion: Optional[int] = None
+        recomendacion: Optional[int] = None,
+        filters: Optional[Mapping[str, List[str]]] = None
     ) -> Dict[str, Any]:
         """
         Execute the use case to get all cows for a snapshot.
@@ -34,10 +36,16 @@ class GetAllCowsBySnapshot:
             search: Search query for partial matching
             nombre_grupo: Filter by group name
             recomendacion: Filter by recommendation category
+            filters: Raw range / IN-list filter parameters (see CowFilter.from_params)
 
         Returns:
             Dict with 'cows' (list) and 'pagination' (metadata)
+
+        Raises:
+            ValueError: If the filter parameters are invalid
         """
+        cow_filter = CowFilter.from_params(filters) if filters else None
+
         return await self.global_hato_repository.get_all_cows_by_snapshot(
             global_hato_id,
             user_id,
@@ -47,5 +55,6 @@ class GetAllCowsBySnapshot:
             sort_order,
             search,
             nombre_grupo,
-            recomendacion
+            recomendacion,
+            cow_filter
         )
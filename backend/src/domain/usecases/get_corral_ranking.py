@@ -0,0 +1,60 @@
+"""Use case for ranking cows within each corral of a snapshot."""
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from domain.entities import RankedCow
+from domain.entities.ranked_cow import RANKING_FIELDS
+from domain.repositories import IGlobalHatoRepository
+from utils.constants import app_config
+
+
+class GetCorralRanking:
+    """Use case for retrieving the top or bottom N cows of every corral by one metric."""
+
+    def __init__(self, global_hato_repository: IGlobalHatoRepository):
+        self.global_hato_repository = global_hato_repository
+
+    async def execute(
+        self,
+        global_hato_id: int,
+        user_id: int,
+        sort_by: str,
+        sort_order: str = 'desc',
+        limit: Optional[int] = None,
+        nombre_grupos: Optional[List[str]] = None
+    ) -> Optional[Dict[str, List[RankedCow]]]:
+        """
+        Execute the use case to rank each corral's cows.
+
+        Args:
+            global_hato_id: The snapshot ID
+            user_id: User ID for ownership verification
+            sort_by: Metric to rank by (one of RANKING_FIELDS)
+            sort_order: 'desc' for the highest values first (top N), 'asc' for the lowest (bottom N)
+            limit: Cows per corral (defaults to RANKING_DEFAULT_LIMIT)
+            nombre_grupos: Optional corrales to restrict the ranking to
+
+        Returns:
+            Dict of nombre_grupo -> ranked cows (corrales sorted by name), or None if
+            the snapshot was not found
+
+        Raises:
+            ValueError: If the metric, order or limit is invalid
+        """
+        if sort_by not in RANKING_FIELDS:
+            raise ValueError(f"sort_by must be one of: {', '.join(RANKING_FIELDS)}")
+        if sort_order not in ('asc', 'desc'):
+            raise ValueError("sort_order must be 'asc' or 'desc'")
+        limit = app_config.RANKING_DEFAULT_LIMIT if limit is None else limit
+        if not 1 <= limit <= app_config.RANKING_MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {app_config.RANKING_MAX_LIMIT}")
+
+        ranked = await self.global_hato_repository.get_ranked_cows_by_group(
+            global_hato_id, user_id, sort_by, sort_order == 'desc', limit, nombre_grupos
+        )
+        if ranked is None:
+            return None
+
+        ranking = OrderedDict()
+        for ranked_cow in ranked:  # already ordered by corral, then rank
+            ranking.setdefault(ranked_cow.cow.nombre_grupo, []).append(ranked_cow)
+        return ranking
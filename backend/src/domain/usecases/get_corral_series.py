@@ -0,0 +1,47 @@
+"""Use case for retrieving per-corral time series across a user's snapshots."""
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, List, Optional
+from domain.entities import CorralRollup
+from domain.repositories import ISnapshotRollupRepository
+
+
+class GetCorralSeries:
+    """Use case for retrieving each corral's totals per snapshot over a date window."""
+
+    def __init__(self, snapshot_rollup_repository: ISnapshotRollupRepository):
+        self.snapshot_rollup_repository = snapshot_rollup_repository
+
+    async def execute(
+        self,
+        user_id: int,
+        fecha_desde: Optional[str] = None,
+        fecha_hasta: Optional[str] = None,
+        nombre_grupo: Optional[str] = None
+    ) -> Dict[str, List[CorralRollup]]:
+        """
+        Execute the use case to get one series per corral.
+
+        Args:
+            user_id: ID of the user
+            fecha_desde: Optional start date (YYYY-MM-DD, inclusive)
+            fecha_hasta: Optional end date (YYYY-MM-DD, inclusive)
+            nombre_grupo: Optional corral to restrict the result to
+
+        Returns:
+            Dict of nombre_grupo -> CorralRollup entities, oldest first (corrales sorted by name)
+
+        Raises:
+            ValueError: If a date is malformed or the window is reversed
+        """
+        desde = date.fromisoformat(fecha_desde) if fecha_desde else None
+        hasta = date.fromisoformat(fecha_hasta) if fecha_hasta else None
+        if desde and hasta and desde > hasta:
+            raise ValueError("fecha_desde must be before fecha_hasta")
+
+        rows = await self.snapshot_rollup_repository.find_corral_series(user_id, desde, hasta, nombre_grupo)
+
+        series = OrderedDict()
+        for row in sorted(rows, key=lambda r: r.nombre_grupo):  # stable: dates stay in order
+            series.setdefault(row.nombre_grupo, []).append(row)
+        return series
@@ -0,0 +1,39 @@
+"""Use case for retrieving herd trends across a user's snapshots."""
+from datetime import date
+from typing import List, Optional
+from domain.entities import SnapshotRollup
+from domain.repositories import ISnapshotRollupRepository
+
+
+class GetHatoTrends:
+    """Use case for retrieving per-snapshot herd totals over a date window."""
+
+    def __init__(self, snapshot_rollup_repository: ISnapshotRollupRepository):
+        self.snapshot_rollup_repository = snapshot_rollup_repository
+
+    async def execute(
+        self,
+        user_id: int,
+        fecha_desde: Optional[str] = None,
+        fecha_hasta: Optional[str] = None
+    ) -> List[SnapshotRollup]:
+        """
+        Execute the use case to get trend points, oldest first.
+
+        Args:
+            user_id: ID of the user
+            fecha_desde: Optional start date (YYYY-MM-DD, inclusive)
+            fecha_hasta: Optional end date (YYYY-MM-DD, inclusive)
+
+        Returns:
+            List of SnapshotRollup entities
+
+        Raises:
+            ValueError: If a date is malformed or the window is reversed
+        """
+        desde = date.fromisoformat(fecha_desde) if fecha_desde else None
+        hasta = date.fromisoformat(fecha_hasta) if fecha_hasta else None
+        if desde and hasta and desde > hasta:
+            raise ValueError("fecha_desde must be before fecha_hasta")
+
+        return await self.snapshot_rollup_repository.find_by_user(user_id, desde, hasta)
@@ -0,0 +1,46 @@
+"""Use case for retrieving production distribution statistics of a snapshot."""
+from typing import Dict, Optional
+from domain.entities import DistributionStats
+from domain.entities.distribution_stats import STATISTICS_FIELDS
+from domain.repositories import IGlobalHatoRepository
+from utils.constants import app_config
+
+
+class GetSnapshotStatistics:
+    """Use case for retrieving histograms and percentiles of a snapshot's cows."""
+
+    def __init__(self, global_hato_repository: IGlobalHatoRepository):
+        self.global_hato_repository = global_hato_repository
+
+    async def execute(
+        self,
+        global_hato_id: int,
+        user_id: int,
+        nombre_grupo: Optional[str] = None,
+        bins: Optional[int] = None
+    ) -> Optional[Dict[str, DistributionStats]]:
+        """
+        Execute the use case to describe the snapshot's production columns.
+
+        Args:
+            global_hato_id: The snapshot ID
+            user_id: User ID for ownership verification
+            nombre_grupo: Optional corral to restrict the statistics to
+            bins: Number of histogram bins (defaults to STATISTICS_DEFAULT_BINS)
+
+        Returns:
+            Dict of column -> DistributionStats, or None if the snapshot was not found
+
+        Raises:
+            ValueError: If bins is outside 1..STATISTICS_MAX_BINS
+        """
+        bins = app_config.STATISTICS_DEFAULT_BINS if bins is None else bins
+        if not 1 <= bins <= app_config.STATISTICS_MAX_BINS:
+            raise ValueError(f"bins must be between 1 and {app_config.STATISTICS_MAX_BINS}")
+
+        values = await self.global_hato_repository.get_column_values(
+            global_hato_id, user_id, STATISTICS_FIELDS, nombre_grupo
+        )
+        if values is None:
+            return None
+        return {column: DistributionStats.from_values(values[column], bins) for column in STATISTICS_FIELDS}
@@ -0,0 +1,41 @@
+"""Use case for rebuilding missing search index entries."""
+import logging
+from typing import List
+from domain.entities import SearchTerm
+from domain.repositories import IGlobalHatoRepository, ISearchIndexRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RebuildSearchIndex:
+    """Use case for indexing every snapshot that has no search terms (e.g., after upgrading)."""
+
+    def __init__(
+        self,
+        global_hato_repository: IGlobalHatoRepository,
+        search_index_repository: ISearchIndexRepository
+    ):
+        self.global_hato_repository = global_hato_repository
+        self.search_index_repository = search_index_repository
+
+    async def execute(self) -> List[int]:
+        """
+        Execute the rebuild use case.
+
+        Returns:
+            IDs of the snapshots that were indexed
+        """
+        rebuilt = []
+        for global_hato_id in await self.search_index_repository.find_missing():
+            global_hato = await self.global_hato_repository.find_by_id(global_hato_id)
+            if not global_hato:
+                continue
+            result = await self.global_hato_repository.get_all_cows_by_snapshot(
+                global_hato_id, global_hato.user_id, page=1, limit=max(global_hato.total_animales, 1)
+            )
+            await self.search_index_repository.save(global_hato_id, SearchTerm.from_cows(global_hato, result['cows']))
+            rebuilt.append(global_hato_id)
+
+        if rebuilt:
+            logger.info("Rebuilt search index", extra={"rebuilt": len(rebuilt)})
+        return rebuilt
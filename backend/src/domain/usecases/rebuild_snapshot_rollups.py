@@ -0,0 +1,57 @@
+"""Use case for rebuilding missing trend rollups."""
+import logging
+from typing import List
+from domain.entities import SnapshotRollup, CorralRollup
+from domain.repositories import IGlobalHatoRepository, ISnapshotRollupRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RebuildSnapshotRollups:
+    """Use case for computing the rollup of every snapshot that lacks one (e.g., after upgrading)."""
+
+    def __init__(
+        self,
+        global_hato_repository: IGlobalHatoRepository,
+        snapshot_rollup_repository: ISnapshotRollupRepository
+    ):
+        self.global_hato_repository = global_hato_repository
+        self.snapshot_rollup_repository = snapshot_rollup_repository
+
+    async def execute(self) -> List[int]:
+        """
+        Execute the rebuild use case.
+
+        Cows are read through the Global Hato repository, so delta-encoded and
+        archived snapshots are summarized like any other.
+
+        Returns:
+            IDs of the snapshots whose rollup was rebuilt
+        """
+        rebuilt = []
+        for global_hato_id in await self.snapshot_rollup_repository.find_missing():
+            if await self.rebuild(global_hato_id):
+                rebuilt.append(global_hato_id)
+
+        if rebuilt:
+            logger.info("Rebuilt trend rollups", extra={"rebuilt": len(rebuilt)})
+        return rebuilt
+
+    async def rebuild(self, global_hato_id: int) -> bool:
+        """
+        Recompute and save the rollup of one snapshot.
+
+        Returns:
+            False if the snapshot does not exist
+        """
+        global_hato = await self.global_hato_repository.find_by_id(global_hato_id)
+        if not global_hato:
+            return False
+        result = await self.global_hato_repository.get_all_cows_by_snapshot(
+            global_hato_id, global_hato.user_id, page=1, limit=max(global_hato.total_animales, 1)
+        )
+        cows = result['cows']
+        await self.snapshot_rollup_repository.save(
+            SnapshotRollup.from_cows(global_hato, cows), CorralRollup.from_cows(global_hato, cows)
+        )
+        return True
@@ -0,0 +1,137 @@
+"""Use case for replacing a Global Hato snapshot with a corrected re-upload."""
+import time
+import logging
+from dataclasses import replace
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple
+from domain.repositories import IGlobalHatoRepository
+from domain.entities import GlobalHato, Cow, SnapshotDiff
+from domain.usecases.create_global_hato import CreateGlobalHato, build_cow
+from infrastructure.monitoring import ingest_stage
+from infrastructure.storage import storage_service
+
+logger = logging.getLogger(__name__)
+
+
+class ReplaceGlobalHato:
+    """Use case for re-uploading a snapshot's date, re-scoring only the cows that changed."""
+
+    def __init__(
+        self,
+        global_hato_repository: IGlobalHatoRepository,
+        create_global_hato: CreateGlobalHato
+    ):
+        self.global_hato_repository = global_hato_repository
+        self.create_global_hato = create_global_hato
+
+    async def execute(
+        self,
+        user_id: int,
+        nombre: str,
+        fecha_snapshot: date,
+        cows_data: List[Dict[str, Any]],
+        blob_route: Optional[str] = None
+    ) -> Tuple[GlobalHato, Optional[SnapshotDiff]]:
+        """
+        Execute the replace use case.
+
+        Rows are matched by numero_animal against the user's newest ready
+        snapshot of the same date. Rows whose content hash is unchanged keep
+        their stored recomendacion; changed and new rows are predicted, and
+        only those plus the removed cows are written. Without a snapshot to
+        replace, a new one is created.
+
+        Args:
+            user_id: ID of the user uploading the snapshot
+            nombre: Name of the snapshot
+            fecha_snapshot: Date of the snapshot
+            cows_data: List of cow dictionaries with parsed CSV data
+            blob_route: Optional path to uploaded CSV file (replaces the previous one)
+
+        Returns:
+            Tuple of (GlobalHato, SnapshotDiff), the diff being None if the snapshot was created
+
+        Raises:
+            ValueError: If required data is missing or animal numbers are missing or repeated
+        """
+        if not nombre:
+            raise ValueError("Nombre is required")
+
+        if not fecha_snapshot:
+            raise ValueError("Fecha de snapshot is required")
+
+        if not cows_data or len(cows_data) == 0:
+            raise ValueError("At least one cow is required")
+
+        keys = [str(cow_data.get('numero_animal') or '') for cow_data in cows_data]
+        if '' in keys or len(set(keys)) != len(keys):
+            raise ValueError("Replacing a snapshot requires a unique numero_animal on every row")
+
+        target = await self.global_hato_repository.find_latest_by_fecha(user_id, fecha_snapshot)
+        existing = await self.global_hato_repository.get_cow_hashes(target.id, user_id) if target else None
+        if existing is None:
+            created = await self.create_global_hato.execute(user_id, nombre, fecha_snapshot, cows_data, blob_route)
+            return created, None
+
+        # Predict only the rows that are new or whose content changed
+        cows: List[Cow] = []
+        upserts: List[Cow] = []
+        unchanged = 0
+        predict_start = time.perf_counter()
+        with ingest_stage('predict', rows=len(cows_data)):
+            rescore_data = []
+            for cow_data in cows_data:
+                cow = build_cow(cow_data, None)
+                stored = existing.get(cow.numero_animal)
+                if stored is not None and stored[0] == cow.content_hash:
+                    cow.recomendacion = stored[1]
+                    unchanged += 1
+                else:
+                    rescore_data.append(cow_data)
+                    upserts.append(cow)
+                cows.append(cow)
+
+            if rescore_data:
+                recomendaciones = self.create_global_hato.prediction_service.predict_cows(rescore_data)
+                for cow, recomendacion in zip(upserts, recomendaciones):
+                    cow.recomendacion = recomendacion
+
+        current = set(keys)
+        removed = [numero_animal for numero_animal in existing if numero_animal not in current]
+        added = sum(1 for cow in upserts if cow.numero_animal not in existing)
+        diff = SnapshotDiff(unchanged=unchanged, changed=len(upserts) - added, added=added, removed=len(removed))
+
+        header = replace(
+            target,
+            nombre=nombre,
+            total_animales=len(cows),
+            grupos_detectados=len({cow.nombre_grupo for cow in cows if cow.nombre_grupo}),
+            blob_route=blob_route or target.blob_route
+        )
+        with ingest_stage('persist', rows=len(upserts) + len(removed)):
+            updated = await self.global_hato_repository.replace_cows(header, upserts, removed)
+        if updated is None:
+            raise ValueError("Global Hato is no longer available to replace")
+
+        logger.info(
+            "Global Hato replaced",
+            extra={
+                "global_hato_id": updated.id,
+                "unchanged": diff.unchanged,
+                "changed": diff.changed,
+                "added": diff.added,
+                "removed": diff.removed,
+                "seconds": round(time.perf_counter() - predict_start, 3),
+            }
+        )
+
+        # The previous upload's file is superseded
+        if blob_route and target.blob_route and target.blob_route != blob_route:
+            try:
+                if not storage_service.delete_file(target.blob_route):
+                    logger.warning("Could not delete file %s", target.blob_route)
+            except Exception as e:
+                logger.error("Error deleting file %s: %s", target.blob_route, e)
+
+        await self.create_global_hato.save_summaries(updated, cows)
+        return updated, diff
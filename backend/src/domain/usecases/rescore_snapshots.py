@@ -0,0 +1,80 @@
+"""Use case for re-scoring stored cows with the current model."""
+import time
+import logging
+from typing import Optional
+from domain.entities import RescoreReport
+from domain.repositories import IGlobalHatoRepository
+from domain.usecases.rebuild_snapshot_rollups import RebuildSnapshotRollups
+from infrastructure.ml.services import PredictionService
+from utils.constants import app_config
+
+logger = logging.getLogger(__name__)
+
+
+class RescoreSnapshots:
+    """Use case for recomputing every stored cow's recomendacion from its persisted features (e.g., after a model update)."""
+
+    def __init__(
+        self,
+        global_hato_repository: IGlobalHatoRepository,
+        prediction_service: PredictionService,
+        rebuild_snapshot_rollups: Optional[RebuildSnapshotRollups] = None
+    ):
+        self.global_hato_repository = global_hato_repository
+        self.prediction_service = prediction_service
+        self.rebuild_snapshot_rollups = rebuild_snapshot_rollups
+
+    async def execute(self, user_id: Optional[int] = None, batch_size: Optional[int] = None) -> RescoreReport:
+        """
+        Execute the rescore use case.
+
+        Features are streamed from the cows table in batches, each batch is
+        scored with one model call and written back with one UPDATE per
+        predicted category. Only rows whose category changed are written, and
+        rows the model fails on keep their stored recomendacion. Archived
+        snapshots and cows stored without features are left as they are.
+
+        Args:
+            user_id: Only re-score this user's snapshots (all users if None)
+            batch_size: Cows per model call (defaults to RESCORE_BATCH_SIZE)
+
+        Returns:
+            RescoreReport with the rows scored, rows changed and throughput
+        """
+        batch_size = batch_size or app_config.RESCORE_BATCH_SIZE
+        start = time.perf_counter()
+        snapshot_ids = await self.global_hato_repository.find_ready_ids(user_id)
+
+        rows = changed = 0
+        for global_hato_id in snapshot_ids:
+            snapshot_changed = 0
+            after_id = 0
+            while True:
+                batch = await self.global_hato_repository.get_feature_batch(global_hato_id, after_id, batch_size)
+                if not batch:
+                    break
+                after_id = batch[-1][0]
+                predictions = self.prediction_service.predict_batch([features for _, features in batch])
+                snapshot_changed += await self.global_hato_repository.update_recomendaciones(
+                    global_hato_id,
+                    {row_id: prediction for (row_id, _), prediction in zip(batch, predictions) if prediction is not None}
+                )
+                rows += len(batch)
+
+            if snapshot_changed:
+                changed += snapshot_changed
+                # Delta snapshots inherit these rows: their cached reads and rollups are stale too
+                for marked_id in await self.global_hato_repository.mark_updated(global_hato_id):
+                    if self.rebuild_snapshot_rollups:
+                        await self.rebuild_snapshot_rollups.rebuild(marked_id)
+
+        report = RescoreReport(
+            snapshots=len(snapshot_ids), rows=rows, changed=changed, seconds=time.perf_counter() - start
+        )
+        logger.info("Re-scored snapshots", extra={
+            "snapshots": report.snapshots,
+            "rows": report.rows,
+            "changed": report.changed,
+            "rows_per_second": round(report.rows_per_second, 1),
+        })
+        return report
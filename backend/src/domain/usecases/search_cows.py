@@ -0,0 +1,54 @@
+"""Use case for searching animals, selection numbers and groups across snapshots."""
+from typing import List, Optional
+from domain.entities import SearchMatch
+from domain.repositories import ISearchIndexRepository
+from utils.constants import app_config
+from utils.constants.search_kinds import SEARCH_KIND_FIELDS
+
+# Shorter substrings have no trigrams to look up; they are matched as prefixes
+TRIGRAM_MIN_LENGTH = 3
+
+
+class SearchCows:
+    """Use case for finding terms in all of a user's snapshots (search and autocomplete)."""
+
+    def __init__(self, search_index_repository: ISearchIndexRepository):
+        self.search_index_repository = search_index_repository
+
+    async def execute(
+        self,
+        user_id: int,
+        q: Optional[str],
+        kind: Optional[str] = None,
+        limit: Optional[int] = None,
+        autocomplete: bool = False
+    ) -> List[SearchMatch]:
+        """
+        Execute the search use case.
+
+        Args:
+            user_id: ID of the user whose snapshots are searched
+            q: Text to look for (case-insensitive)
+            kind: Optional kind to restrict to (animal, seleccion, grupo)
+            limit: Maximum number of terms (defaults to SEARCH_DEFAULT_LIMIT, capped at SEARCH_MAX_LIMIT)
+            autocomplete: Match terms starting with q instead of containing it
+
+        Returns:
+            Matching terms, alphabetically
+
+        Raises:
+            ValueError: If q is empty, kind is unknown or limit is not positive
+        """
+        q = (q or "").strip()
+        if not q:
+            raise ValueError("q is required")
+        if kind and kind not in SEARCH_KIND_FIELDS:
+            raise ValueError(f"kind must be one of: {', '.join(SEARCH_KIND_FIELDS)}")
+        limit = app_config.SEARCH_DEFAULT_LIMIT if limit is None else limit
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        limit = min(limit, app_config.SEARCH_MAX_LIMIT)
+
+        if autocomplete or len(q) < TRIGRAM_MIN_LENGTH:
+            return await self.search_index_repository.find_by_prefix(user_id, q, kind, limit)
+        return await self.search_index_repository.find_containing(user_id, q, kind, limit)
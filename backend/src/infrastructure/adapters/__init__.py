@@ -3,6 +3,8 @@ from .user_repository_adapter import UserRepositoryAdapter
 from .cow_repository_adapter import CowRepositoryAdapter
 from .dataset_repository_adapter import DatasetRepositoryAdapter
 from .global_hato_repository_adapter import GlobalHatoRepositoryAdapter
+from .snapshot_rollup_repository_adapter import SnapshotRollupRepositoryAdapter
+from .search_index_repository_adapter import SearchIndexRepositoryAdapter
 
 __all__ = [
     "AuthRepositoryAdapter",
@@ -10,4 +12,6 @@ __all__ = [
     "CowRepositoryAdapter",
     "DatasetRepositoryAdapter",
     "GlobalHatoRepositoryAdapter",
+    "SnapshotRollupRepositoryAdapter",
+    "SearchIndexRepositoryAdapter",
 ]
@@ -1,10 +1,60 @@
 """Global Hato repository adapter using SQLAlchemy."""
-from typing import Optional, List, Dict, Any
-from sqlalchemy import func
-from domain.entities import GlobalHato, Cow, CorralGroup
+import logging
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import Integer, and_, bindparam, delete, exists, func, insert, literal, or_, select, union_all, update
+from sqlalchemy.orm import aliased
+from domain.entities import GlobalHato, Cow, CorralGroup, CowFilter, RankedCow
+from domain.entities.cow import STORED_FEATURE_FIELDS
 from domain.repositories import IGlobalHatoRepository
+from infrastructure.cache import SnapshotColumns, snapshot_cache
 from infrastructure.database import GlobalHatoModel, CowModel
+from infrastructure.database.collation import code_point
 from infrastructure.database.db_config import db_config
+from infrastructure.ml.services import FEATURE_FIELDS
+from infrastructure.monitoring import observe_snapshot_storage, record_cache_lookup
+from infrastructure.storage import snapshot_archive
+from infrastructure.storage.snapshot_archive import ARCHIVE_COLUMNS, COW_COLUMNS
+from utils.constants import app_config
+from utils.constants.snapshot_status import (
+    SNAPSHOT_STATUS_LOADING,
+    SNAPSHOT_STATUS_READY,
+    SNAPSHOT_STATUS_ARCHIVED,
+    SNAPSHOT_VISIBLE_STATUSES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cow fields copied between snapshots (everything but the keys)
+COW_FIELDS = [
+    "numero_animal",
+    "nombre_grupo",
+    "produccion_leche_ayer",
+    "produccion_media_7dias",
+    "estado_reproduccion",
+    "dias_ordeno",
+    "numero_seleccion",
+    "recomendacion",
+    "content_hash",
+    *STORED_FEATURE_FIELDS,
+]
+# Fields compared to decide whether a cow changed since the base snapshot
+DELTA_COMPARED_FIELDS = [
+    "nombre_grupo",
+    "produccion_leche_ayer",
+    "produccion_media_7dias",
+    "estado_reproduccion",
+    "dias_ordeno",
+    "numero_seleccion",
+    "recomendacion",
+    *STORED_FEATURE_FIELDS,
+]
+# Text columns /vacas can sort by (compared by code point, like the cache and archive)
+STRING_SORT_COLUMNS = {"numero_animal", "nombre_grupo", "estado_reproduccion", "numero_seleccion"}
+# Model inputs in PredictionService order, as stored columns
+FEATURE_COLUMNS = [getattr(CowModel, field) for field in FEATURE_FIELDS]
 
 
 class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
@@ -12,16 +62,46 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
 
     def __init__(self):
         self.db = db_config
+        self.chunk_size = app_config.INGEST_CHUNK_SIZE
+        self.archive = snapshot_archive
+        self.delta_encoding = app_config.SNAPSHOT_DELTA_ENCODING
+        self.delta_max_ratio = app_config.SNAPSHOT_DELTA_MAX_RATIO
+        self.delta_keyframe_interval = app_config.SNAPSHOT_DELTA_KEYFRAME_INTERVAL
+        # Filter predicates by shape; values are bound at execution
+        self.filter_shape_cache_size = app_config.COW_FILTER_SHAPE_CACHE_SIZE
+        self._filter_shapes: "OrderedDict[tuple, Any]" = OrderedDict()
+        # Hot snapshots kept as column arrays for /vacas browsing
+        self.cache = snapshot_cache
 
     async def create_global_hato(
         self,
         global_hato: GlobalHato,
         cows: List[Cow]
     ) -> GlobalHato:
-        """Create a new Global Hato snapshot with associated cows."""
+        """
+        Create a new Global Hato snapshot with associated cows using staged ingestion.
+
+        The header is committed first with status 'loading' (hidden from reads),
+        cows are inserted in separately committed chunks, and the snapshot is then
+        published by flipping its status to 'ready' in one single-row update. If a
+        chunk fails the partial snapshot is removed; if the process dies instead,
+        cleanup_abandoned_loads removes it later. Every committed chunk bumps the
+        header's updated_at, so a slow load still making progress is not swept.
+
+        With delta encoding enabled, only cows that differ from the user's latest
+        full snapshot are stored (plus tombstones for animals that left) and the
+        rest is inherited from it at read time.
+        """
         session = self.db.get_session()
+        global_hato_id = None
         try:
-            # Create Global Hato model
+            base_snapshot_id, stored_cows, removed = None, cows, []
+            if self.delta_encoding:
+                plan = self._plan_delta(session, global_hato.user_id, cows)
+                if plan:
+                    base_snapshot_id, stored_cows, removed = plan
+
+            # Stage the header
             global_hato_model = GlobalHatoModel(
                 user_id=global_hato.user_id,
                 nombre=global_hato.nombre,
@@ -29,35 +109,343 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
                 total_animales=global_hato.total_animales,
                 grupos_detectados=global_hato.grupos_detectados,
                 blob_route=global_hato.blob_route,
-                created_at=global_hato.created_at
+                created_at=global_hato.created_at,
+                updated_at=datetime.now(),
+                status=SNAPSHOT_STATUS_LOADING,
+                base_snapshot_id=base_snapshot_id
             )
-
             session.add(global_hato_model)
-            session.flush()  # Get global_hato ID before creating cows
+            session.commit()
+            global_hato_id = global_hato_model.id
 
-            # Create cow models
-            cow_models = [
-                CowModel(
-                    global_hato_id=global_hato_model.id,
-                    numero_animal=cow.numero_animal,
-                    nombre_grupo=cow.nombre_grupo,
-                    produccion_leche_ayer=cow.produccion_leche_ayer,
-                    produccion_media_7dias=cow.produccion_media_7dias,
-                    estado_reproduccion=cow.estado_reproduccion,
-                    dias_ordeno=cow.dias_ordeno,
-                    numero_seleccion=cow.numero_seleccion,
-                    recomendacion=cow.recomendacion
-                )
-                for cow in cows
-            ]
+            # Insert cows in chunks, one short transaction each (with a liveness heartbeat)
+            for start in range(0, len(stored_cows), self.chunk_size):
+                session.execute(insert(CowModel), [
+                    {"global_hato_id": global_hato_id, **{field: getattr(cow, field) for field in COW_FIELDS}}
+                    for cow in stored_cows[start:start + self.chunk_size]
+                ])
+                self._heartbeat(session, global_hato_id)
+                session.commit()
+            for start in range(0, len(removed), self.chunk_size):
+                session.execute(insert(CowModel), [
+                    {"global_hato_id": global_hato_id, "numero_animal": numero_animal, "removed": True}
+                    for numero_animal in removed[start:start + self.chunk_size]
+                ])
+                self._heartbeat(session, global_hato_id)
+                session.commit()
 
-            session.add_all(cow_models)
+            # Publish atomically (updated_at only tracks replacements from here on)
+            session.execute(
+                update(GlobalHatoModel)
+                .where(GlobalHatoModel.id == global_hato_id)
+                .values(status=SNAPSHOT_STATUS_READY, updated_at=None)
+            )
             session.commit()
-            session.refresh(global_hato_model)
 
+            stored_rows = len(stored_cows) + len(removed)
+            observe_snapshot_storage(
+                "delta" if base_snapshot_id else "full", stored_rows, len(cows) - stored_rows
+            )
+
+            session.refresh(global_hato_model)
             return self._model_to_entity(global_hato_model)
         except Exception as e:
             session.rollback()
+            if global_hato_id is not None:
+                self._discard_snapshot(session, global_hato_id)
+            raise e
+        finally:
+            session.close()
+
+    def _heartbeat(self, session, global_hato_id: int) -> None:
+        """Record progress of a staged load (caller's transaction)."""
+        session.execute(
+            update(GlobalHatoModel)
+            .where(GlobalHatoModel.id == global_hato_id)
+            .values(updated_at=datetime.now())
+        )
+
+    async def cleanup_abandoned_loads(self, older_than: datetime) -> int:
+        """Remove snapshots still loading with no progress since `older_than` (e.g., the worker died)."""
+        session = self.db.get_session()
+        try:
+            abandoned_ids = [
+                row.id for row in session.query(GlobalHatoModel.id).filter(
+                    GlobalHatoModel.status == SNAPSHOT_STATUS_LOADING,
+                    func.coalesce(GlobalHatoModel.updated_at, GlobalHatoModel.created_at) < older_than
+                ).all()
+            ]
+            for global_hato_id in abandoned_ids:
+                self._discard_snapshot(session, global_hato_id)
+            return len(abandoned_ids)
+        finally:
+            session.close()
+
+    def _discard_snapshot(self, session, global_hato_id: int) -> None:
+        """Delete a staged snapshot and its cows with bulk deletes (best effort)."""
+        try:
+            session.query(CowModel).filter(
+                CowModel.global_hato_id == global_hato_id
+            ).delete(synchronize_session=False)
+            session.query(GlobalHatoModel).filter(
+                GlobalHatoModel.id == global_hato_id,
+                GlobalHatoModel.status == SNAPSHOT_STATUS_LOADING
+            ).delete(synchronize_session=False)
+            session.commit()
+        except Exception:
+            session.rollback()
+            logger.exception("Could not discard staged Global Hato %s", global_hato_id)
+
+    def _plan_delta(self, session, user_id: int, cows: List[Cow]) -> Optional[Tuple[int, List[Cow], List[str]]]:
+        """
+        Pick a base snapshot and the cows that differ from it.
+
+        Cows are matched by numero_animal, so both herds need unique, non-null
+        animal numbers. The base row is locked FOR SHARE until the caller
+        commits the new header, so a concurrent delete or archive of the base
+        (which lock it FOR UPDATE) waits and then materializes this delta too.
+
+        Returns:
+            Tuple of (base snapshot ID, changed or new cows, numero_animal of
+            removed cows), or None to store a full copy
+        """
+        keys = [cow.numero_animal for cow in cows]
+        if not cows or None in keys or len(set(keys)) != len(keys):
+            return None
+
+        base = session.query(GlobalHatoModel.id).filter(
+            GlobalHatoModel.user_id == user_id,
+            GlobalHatoModel.status == SNAPSHOT_STATUS_READY,
+            GlobalHatoModel.base_snapshot_id.is_(None)
+        ).order_by(GlobalHatoModel.id.desc()).with_for_update(read=True).first()
+        if not base:
+            return None
+
+        dependents = session.query(func.count(GlobalHatoModel.id)).filter(
+            GlobalHatoModel.base_snapshot_id == base.id
+        ).scalar()
+        if dependents >= self.delta_keyframe_interval:
+            return None
+
+        base_rows = {}
+        compared = [getattr(CowModel, field) for field in DELTA_COMPARED_FIELDS]
+        for row in session.execute(
+            select(CowModel.numero_animal, *compared).where(CowModel.global_hato_id == base.id)
+        ):
+            if row[0] is None or row[0] in base_rows:
+                return None
+            base_rows[row[0]] = self._delta_values(row[1:])
+
+        changed = [
+            cow for cow in cows
+            if base_rows.get(cow.numero_animal) != self._delta_values(
+                [getattr(cow, field) for field in DELTA_COMPARED_FIELDS]
+            )
+        ]
+        current = set(keys)
+        removed = [numero_animal for numero_animal in base_rows if numero_animal not in current]
+
+        if len(changed) + len(removed) > self.delta_max_ratio * len(cows):
+            return None
+        return base.id, changed, removed
+
+    def _delta_values(self, values) -> tuple:
+        """Normalize compared values (cow production is stored as NUMERIC(10, 2))."""
+        return tuple(
+            round(float(value), 2) if isinstance(value, (float, Decimal)) else value
+            for value in values
+        )
+
+    def _inherited_cows(self, global_hato_id: int, base_snapshot_id: int):
+        """Select the base snapshot's cows that a delta snapshot neither changed nor removed."""
+        override = aliased(CowModel)
+        return select(
+            CowModel.id,
+            literal(global_hato_id, Integer).label("global_hato_id"),
+            *[getattr(CowModel, field) for field in COW_FIELDS],
+            CowModel.removed
+        ).where(
+            CowModel.global_hato_id == base_snapshot_id,
+            ~exists().where(
+                override.global_hato_id == global_hato_id,
+                override.numero_animal == CowModel.numero_animal
+            )
+        )
+
+    def _cows_source(self, global_hato: GlobalHatoModel, predicate=None):
+        """
+        Entity to query a snapshot's cows from.
+
+        Full snapshots read the cows table; delta snapshots read their own rows
+        plus the rows inherited from their base, materialized as one subquery
+        that exposes the same columns (global_hato_id is the delta's ID).
+
+        Args:
+            global_hato: Snapshot to read
+            predicate: Optional condition on CowModel, pushed into both branches
+                of a delta's subquery (full snapshots apply it themselves)
+        """
+        if global_hato.base_snapshot_id is None:
+            return CowModel
+
+        own = select(
+            CowModel.id,
+            CowModel.global_hato_id,
+            *[getattr(CowModel, field) for field in COW_FIELDS],
+            CowModel.removed
+        ).where(
+            CowModel.global_hato_id == global_hato.id,
+            CowModel.removed.is_(False)
+        )
+        inherited = self._inherited_cows(global_hato.id, global_hato.base_snapshot_id)
+        if predicate is not None:
+            own = own.where(predicate)
+            inherited = inherited.where(predicate)
+        rows = union_all(own, inherited)
+        return aliased(CowModel, rows.subquery("snapshot_cows"))
+
+    def _filter_predicate(self, cow_filter: CowFilter):
+        """
+        Condition on CowModel for a filter, with named bind parameters.
+
+        Predicates are cached by the filter's shape (fields and operators), so
+        repeated filters reuse the same expression and hit SQLAlchemy's compiled
+        statement cache; the values are supplied with cow_filter.bind_values().
+        """
+        shape = cow_filter.shape
+        predicate = self._filter_shapes.get(shape)
+        record_cache_lookup("cow_filter_shapes", predicate is not None)
+        if predicate is not None:
+            self._filter_shapes.move_to_end(shape)
+            return predicate
+
+        conditions = []
+        for field, operator in shape:
+            column = getattr(CowModel, field)
+            name = f"filter_{field}_{operator}"
+            if operator == "min":
+                conditions.append(column >= bindparam(name))
+            elif operator == "max":
+                conditions.append(column <= bindparam(name))
+            else:
+                conditions.append(column.in_(bindparam(name, expanding=True)))
+        predicate = and_(*conditions)
+
+        self._filter_shapes[shape] = predicate
+        while len(self._filter_shapes) > self.filter_shape_cache_size:
+            self._filter_shapes.popitem(last=False)
+        return predicate
+
+    def _materialize_dependents(self, session, base_snapshot_id: int) -> int:
+        """
+        Turn the delta snapshots of a base into full copies (before the base goes away).
+
+        Runs in the caller's transaction. Inherited cows get new row IDs.
+
+        Returns:
+            Number of snapshots materialized
+        """
+        dependent_ids = [
+            row.id for row in session.query(GlobalHatoModel.id).filter(
+                GlobalHatoModel.base_snapshot_id == base_snapshot_id
+            ).all()
+        ]
+        for global_hato_id in dependent_ids:
+            self._materialize(session, global_hato_id, base_snapshot_id)
+        return len(dependent_ids)
+
+    def _materialize(self, session, global_hato_id: int, base_snapshot_id: int) -> None:
+        """Copy a delta snapshot's inherited cows into it and drop its tombstones (caller's transaction)."""
+        inherited = self._inherited_cows(global_hato_id, base_snapshot_id).with_only_columns(
+            literal(global_hato_id, Integer), *[getattr(CowModel, field) for field in COW_FIELDS]
+        )
+        session.execute(insert(CowModel).from_select(["global_hato_id", *COW_FIELDS], inherited))
+        session.execute(
+            delete(CowModel).where(
+                CowModel.global_hato_id == global_hato_id,
+                CowModel.removed.is_(True)
+            )
+        )
+        session.execute(
+            update(GlobalHatoModel)
+            .where(GlobalHatoModel.id == global_hato_id)
+            .values(base_snapshot_id=None)
+        )
+
+    async def find_archive_candidates(self, older_than: date, limit: Optional[int] = None) -> List[int]:
+        """Get IDs of ready snapshots taken before `older_than`, oldest first."""
+        session = self.db.get_session()
+        try:
+            query = session.query(GlobalHatoModel.id).filter(
+                GlobalHatoModel.status == SNAPSHOT_STATUS_READY,
+                GlobalHatoModel.fecha_snapshot < older_than
+            ).order_by(GlobalHatoModel.fecha_snapshot.asc(), GlobalHatoModel.id.asc())
+            if limit:
+                query = query.limit(limit)
+            return [row.id for row in query.all()]
+        finally:
+            session.close()
+
+    async def archive_snapshot(self, global_hato_id: int) -> bool:
+        """
+        Move a ready snapshot's cows to a Parquet file and delete them from the table.
+
+        The file is written first; the status flip to 'archived' and the row
+        delete then commit in one transaction, so readers see either the rows
+        or the file. If the transaction fails the file is removed again. Delta
+        snapshots are archived with all their inherited cows, and deltas based
+        on this snapshot are materialized first.
+
+        Returns:
+            True if archived, False if the snapshot is not (or no longer) ready
+        """
+        session = self.db.get_session()
+        archive_route = None
+        try:
+            global_hato = session.query(GlobalHatoModel).filter(
+                GlobalHatoModel.id == global_hato_id,
+                GlobalHatoModel.status == SNAPSHOT_STATUS_READY
+            ).first()
+            if not global_hato:
+                return False
+
+            snapshot_cows = self._cows_source(global_hato)
+            columns = [getattr(snapshot_cows, column) for column in ARCHIVE_COLUMNS]
+            rows = session.execute(
+                select(*columns)
+                .where(snapshot_cows.global_hato_id == global_hato_id)
+                .order_by(snapshot_cows.id.asc())
+            ).mappings().all()
+            archive_route = self.archive.write(global_hato_id, rows)
+
+            # Lock the snapshot before looking for its dependents (uploads planning a
+            # delta on it hold it FOR SHARE until their header is committed), and only
+            # archive if nobody deleted or archived it meanwhile
+            locked = session.query(GlobalHatoModel.id).filter(
+                GlobalHatoModel.id == global_hato_id,
+                GlobalHatoModel.status == SNAPSHOT_STATUS_READY
+            ).with_for_update().first()
+            if not locked:
+                session.rollback()
+                self.archive.delete(archive_route)
+                return False
+
+            session.execute(
+                update(GlobalHatoModel)
+                .where(GlobalHatoModel.id == global_hato_id)
+                .values(status=SNAPSHOT_STATUS_ARCHIVED, archive_route=archive_route, base_snapshot_id=None)
+            )
+            self._materialize_dependents(session, global_hato_id)
+            session.query(CowModel).filter(
+                CowModel.global_hato_id == global_hato_id
+            ).delete(synchronize_session=False)
+            session.commit()
+            self.cache.discard(global_hato_id)
+            return True
+        except Exception as e:
+            session.rollback()
+            if archive_route:
+                self.archive.delete(archive_route)
             raise e
         finally:
             session.close()
@@ -77,7 +465,8 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
         session = self.db.get_session()
         try:
             query = session.query(GlobalHatoModel).filter(
-                GlobalHatoModel.user_id == user_id
+                GlobalHatoModel.user_id == user_id,
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES)
             )
 
             # Apply search filter
@@ -135,24 +524,261 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
         session = self.db.get_session()
         try:
             global_hato_model = session.query(GlobalHatoModel).filter(
-                GlobalHatoModel.id == global_hato_id
+                GlobalHatoModel.id == global_hato_id,
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES)
             ).first()
             return self._model_to_entity(global_hato_model) if global_hato_model else None
         finally:
             session.close()
 
+    async def find_latest_by_fecha(self, user_id: int, fecha_snapshot: date) -> Optional[GlobalHato]:
+        """Find the user's newest ready snapshot taken on a date."""
+        session = self.db.get_session()
+        try:
+            # fecha_snapshot is a timestamp column; match the whole day
+            start = datetime.combine(fecha_snapshot, time.min)
+            global_hato_model = session.query(GlobalHatoModel).filter(
+                GlobalHatoModel.user_id == user_id,
+                GlobalHatoModel.status == SNAPSHOT_STATUS_READY,
+                GlobalHatoModel.fecha_snapshot >= start,
+                GlobalHatoModel.fecha_snapshot < start + timedelta(days=1)
+            ).order_by(GlobalHatoModel.id.desc()).first()
+            return self._model_to_entity(global_hato_model) if global_hato_model else None
+        finally:
+            session.close()
+
+    async def get_cow_hashes(
+        self,
+        global_hato_id: int,
+        user_id: int
+    ) -> Optional[Dict[str, Tuple[Optional[str], Optional[int]]]]:
+        """Get numero_animal -> (content_hash, recomendacion) of a ready snapshot's cows."""
+        session = self.db.get_session()
+        try:
+            global_hato = session.query(GlobalHatoModel).filter(
+                GlobalHatoModel.id == global_hato_id,
+                GlobalHatoModel.user_id == user_id,
+                GlobalHatoModel.status == SNAPSHOT_STATUS_READY
+            ).first()
+            if not global_hato:
+                return None
+
+            snapshot_cows = self._cows_source(global_hato)
+            hashes = {}
+            for numero_animal, content_hash, recomendacion in session.execute(
+                select(snapshot_cows.numero_animal, snapshot_cows.content_hash, snapshot_cows.recomendacion)
+                .where(snapshot_cows.global_hato_id == global_hato_id)
+            ):
+                if numero_animal is None or numero_animal in hashes:
+                    raise ValueError(
+                        f"Global Hato {global_hato_id} has missing or repeated animal numbers and cannot be replaced"
+                    )
+                hashes[numero_animal] = (content_hash, recomendacion)
+            return hashes
+        finally:
+            session.close()
+
+    async def replace_cows(
+        self,
+        global_hato: GlobalHato,
+        upserts: List[Cow],
+        removed: List[str]
+    ) -> Optional[GlobalHato]:
+        """
+        Apply a re-upload to a ready snapshot in one transaction.
+
+        Cows are matched by numero_animal: existing ones are updated in place
+        (keeping their row IDs), new ones inserted and removed ones deleted,
+        each as chunked executemany batches. A delta snapshot is materialized
+        first, and so are the deltas based on this snapshot, since its rows are
+        about to change under them. The header (nombre, totals, blob_route) is
+        updated and updated_at set.
+
+        Returns:
+            Updated GlobalHato, or None if the snapshot is no longer ready
+        """
+        session = self.db.get_session()
+        try:
+            # Lock the header so concurrent replacements and archival serialize
+            global_hato_model = session.query(GlobalHatoModel).filter(
+                GlobalHatoModel.id == global_hato.id,
+                GlobalHatoModel.user_id == global_hato.user_id,
+                GlobalHatoModel.status == SNAPSHOT_STATUS_READY
+            ).with_for_update().first()
+            if not global_hato_model:
+                return None
+
+            global_hato_id = global_hato_model.id
+            if global_hato_model.base_snapshot_id is not None:
+                self._materialize(session, global_hato_id, global_hato_model.base_snapshot_id)
+            self._materialize_dependents(session, global_hato_id)
+
+            row_ids = dict(session.execute(
+                select(CowModel.numero_animal, CowModel.id).where(CowModel.global_hato_id == global_hato_id)
+            ).all())
+            updates, inserts = [], []
+            for cow in upserts:
+                if cow.numero_animal in row_ids:
+                    updates.append({
+                        "row_id": row_ids[cow.numero_animal],
+                        **{f"new_{field}": getattr(cow, field) for field in COW_FIELDS}
+                    })
+                else:
+                    inserts.append({
+                        "global_hato_id": global_hato_id,
+                        **{field: getattr(cow, field) for field in COW_FIELDS}
+                    })
+
+            # Batched UPDATE by row ID, pruned to the snapshot's partition
+            cows_table = CowModel.__table__
+            update_rows = (
+                update(cows_table)
+                .where(cows_table.c.id == bindparam("row_id"), cows_table.c.global_hato_id == global_hato_id)
+                .values({field: bindparam(f"new_{field}") for field in COW_FIELDS})
+            )
+            for start in range(0, len(updates), self.chunk_size):
+                session.execute(update_rows, updates[start:start + self.chunk_size])
+            for start in range(0, len(inserts), self.chunk_size):
+                session.execute(insert(CowModel), inserts[start:start + self.chunk_size])
+            for start in range(0, len(removed), self.chunk_size):
+                session.execute(
+                    delete(CowModel).where(
+                        CowModel.global_hato_id == global_hato_id,
+                        CowModel.numero_animal.in_(removed[start:start + self.chunk_size])
+                    )
+                )
+
+            global_hato_model.nombre = global_hato.nombre
+            global_hato_model.total_animales = global_hato.total_animales
+            global_hato_model.grupos_detectados = global_hato.grupos_detectados
+            global_hato_model.blob_route = global_hato.blob_route
+            global_hato_model.updated_at = datetime.now(timezone.utc)
+            session.commit()
+            self.cache.discard(global_hato_id)
+
+            session.refresh(global_hato_model)
+            return self._model_to_entity(global_hato_model)
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    async def find_ready_ids(self, user_id: Optional[int] = None) -> List[int]:
+        """Get IDs of ready snapshots (optionally one user's), oldest first."""
+        session = self.db.get_session()
+        try:
+            query = session.query(GlobalHatoModel.id).filter(GlobalHatoModel.status == SNAPSHOT_STATUS_READY)
+            if user_id is not None:
+                query = query.filter(GlobalHatoModel.user_id == user_id)
+            return [row.id for row in query.order_by(GlobalHatoModel.id.asc()).all()]
+        finally:
+            session.close()
+
+    async def get_feature_batch(
+        self,
+        global_hato_id: int,
+        after_id: int = 0,
+        limit: int = 5000
+    ) -> List[Tuple[int, List[Optional[float]]]]:
+        """
+        Get the next stored cows of a snapshot with their model features (keyset by row ID).
+
+        Only rows stored in this snapshot are read (a delta's inherited cows
+        belong to its base); rows stored without features are skipped.
+        """
+        session = self.db.get_session()
+        try:
+            rows = session.execute(
+                select(CowModel.id, *FEATURE_COLUMNS)
+                .where(
+                    CowModel.global_hato_id == global_hato_id,
+                    CowModel.id > after_id,
+                    CowModel.removed.is_(False),
+                    or_(*[getattr(CowModel, field).isnot(None) for field in STORED_FEATURE_FIELDS])
+                )
+                .order_by(CowModel.id.asc())
+                .limit(limit)
+            ).all()
+            return [(row[0], [None if value is None else float(value) for value in row[1:]]) for row in rows]
+        finally:
+            session.close()
+
+    async def update_recomendaciones(self, global_hato_id: int, recomendaciones: Dict[int, Optional[int]]) -> int:
+        """
+        Set the recomendacion of stored cows by row ID, one UPDATE per predicted class.
+
+        Returns:
+            Number of rows whose recomendacion changed
+        """
+        by_class: Dict[Optional[int], List[int]] = {}
+        for row_id, recomendacion in recomendaciones.items():
+            by_class.setdefault(recomendacion, []).append(row_id)
+
+        session = self.db.get_session()
+        try:
+            changed = 0
+            for recomendacion, row_ids in by_class.items():
+                changed += session.execute(
+                    update(CowModel)
+                    .where(
+                        CowModel.global_hato_id == global_hato_id,
+                        CowModel.id.in_(row_ids),
+                        CowModel.recomendacion.is_distinct_from(recomendacion)
+                    )
+                    .values(recomendacion=recomendacion)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+            session.commit()
+            return changed
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    async def mark_updated(self, global_hato_id: int) -> List[int]:
+        """
+        Set updated_at on a snapshot and the delta snapshots inheriting its cows.
+
+        Returns:
+            IDs of the snapshots marked
+        """
+        session = self.db.get_session()
+        try:
+            marked = [global_hato_id] + [
+                row.id for row in session.query(GlobalHatoModel.id).filter(
+                    GlobalHatoModel.base_snapshot_id == global_hato_id
+                ).all()
+            ]
+            session.execute(
+                update(GlobalHatoModel)
+                .where(GlobalHatoModel.id.in_(marked))
+                .values(updated_at=datetime.now(timezone.utc))
+            )
+            session.commit()
+            for snapshot_id in marked:
+                self.cache.discard(snapshot_id)
+            return marked
+        finally:
+            session.close()
+
     async def delete(self, global_hato_id: int, user_id: int) -> None:
         """Delete Global Hato snapshot and all associated cows (with user ownership check)."""
         session = self.db.get_session()
         try:
+            # Locked so no upload can base a new delta on it meanwhile (see _plan_delta)
             global_hato_model = session.query(GlobalHatoModel).filter(
                 GlobalHatoModel.id == global_hato_id,
                 GlobalHatoModel.user_id == user_id
-            ).first()
+            ).with_for_update().first()
 
             if global_hato_model:
+                # Deltas based on this snapshot need their inherited cows first
+                self._materialize_dependents(session, global_hato_id)
                 session.delete(global_hato_model)
                 session.commit()
+                self.cache.discard(global_hato_id)
         finally:
             session.close()
 
@@ -160,40 +786,40 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
         """Get aggregated corral data for a snapshot with user ownership verification."""
         session = self.db.get_session()
         try:
-            # Verify ownership
+            # Verify ownership (snapshots still loading are not visible)
             global_hato = session.query(GlobalHatoModel).filter(
                 GlobalHatoModel.id == global_hato_id,
-                GlobalHatoModel.user_id == user_id
+                GlobalHatoModel.user_id == user_id,
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES)
             ).first()
 
             if not global_hato:
                 return []
 
+            if global_hato.status == SNAPSHOT_STATUS_ARCHIVED:
+                return [
+                    self._row_to_corral_group(row)
+                    for row in self.archive.corrales(global_hato.archive_route)
+                ]
+
+            snapshot_cows = self._cows_source(global_hato)
+
             # Aggregate query
             results = session.query(
-                CowModel.nombre_grupo,
-                func.count(CowModel.id).label('total_animales'),
-                func.avg(CowModel.produccion_leche_ayer).label('produccion_promedio'),
-                func.sum(CowModel.produccion_leche_ayer).label('produccion_total'),
-                func.avg(CowModel.produccion_media_7dias).label('produccion_promedio_7dias')
+                snapshot_cows.nombre_grupo,
+                func.count(snapshot_cows.id).label('total_animales'),
+                func.avg(snapshot_cows.produccion_leche_ayer).label('produccion_promedio'),
+                func.sum(snapshot_cows.produccion_leche_ayer).label('produccion_total'),
+                func.avg(snapshot_cows.produccion_media_7dias).label('produccion_promedio_7dias')
             ).filter(
-                CowModel.global_hato_id == global_hato_id,
-                CowModel.nombre_grupo.isnot(None),
-                CowModel.nombre_grupo != ''
+                snapshot_cows.global_hato_id == global_hato_id,
+                snapshot_cows.nombre_grupo.isnot(None),
+                snapshot_cows.nombre_grupo != ''
             ).group_by(
-                CowModel.nombre_grupo
+                snapshot_cows.nombre_grupo
             ).all()
 
-            return [
-                CorralGroup(
-                    nombre_grupo=row.nombre_grupo,
-                    total_animales=row.total_animales,
-                    produccion_promedio=round(float(row.produccion_promedio or 0), 2),
-                    produccion_total=round(float(row.produccion_total or 0), 2),
-                    produccion_promedio_7dias=round(float(row.produccion_promedio_7dias or 0), 2)
-                )
-                for row in results
-            ]
+            return [self._row_to_corral_group(row._asdict()) for row in results]
         finally:
             session.close()
 
@@ -201,20 +827,26 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
         """Get cows for a specific group in a snapshot with user ownership verification."""
         session = self.db.get_session()
         try:
-            # Verify ownership
+            # Verify ownership (snapshots still loading are not visible)
             global_hato = session.query(GlobalHatoModel).filter(
                 GlobalHatoModel.id == global_hato_id,
-                GlobalHatoModel.user_id == user_id
+                GlobalHatoModel.user_id == user_id,
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES)
             ).first()
 
             if not global_hato:
                 return []
 
-            # Query cows by group
-            cow_models = session.query(CowModel).filter(
-                CowModel.global_hato_id == global_hato_id,
-                CowModel.nombre_grupo == nombre_grupo
-            ).all()
+            if global_hato.status == SNAPSHOT_STATUS_ARCHIVED:
+                return [Cow(**row) for row in self.archive.cows_by_group(global_hato.archive_route, nombre_grupo)]
+
+            snapshot_cows = self._cows_source(global_hato)
+
+            # Query cows by group (ordered by id, like archived snapshots)
+            cow_models = session.query(snapshot_cows).filter(
+                snapshot_cows.global_hato_id == global_hato_id,
+                snapshot_cows.nombre_grupo == nombre_grupo
+            ).order_by(snapshot_cows.id.asc()).all()
 
             return [
                 Cow(
@@ -234,6 +866,33 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
         finally:
             session.close()
 
+    def _cached_columns(self, session, global_hato: GlobalHatoModel) -> Optional[SnapshotColumns]:
+        """
+        Column arrays of a snapshot if cached, loading them once it is hot.
+
+        Returns:
+            None if the cache is disabled, the snapshot is still cold or too large (use SQL)
+        """
+        if not self.cache.enabled:
+            return None
+
+        # Replacing a snapshot's cows bumps updated_at, which retires old entries
+        key = (global_hato.id, global_hato.updated_at or global_hato.created_at)
+        columns = self.cache.get(key)
+        if columns is not None or not self.cache.is_hot(key):
+            return columns
+
+        snapshot_cows = self._cows_source(global_hato)
+        rows = session.execute(
+            select(*[getattr(snapshot_cows, column) for column in COW_COLUMNS])
+            .where(snapshot_cows.global_hato_id == global_hato.id)
+            .order_by(snapshot_cows.id.asc())
+        ).mappings().all()
+        columns = SnapshotColumns.from_rows(global_hato.id, rows)
+        # Too large for the budget: still serve this read, later ones use SQL
+        self.cache.put(key, columns)
+        return columns
+
     async def get_all_cows_by_snapshot(
         self,
         global_hato_id: int,
@@ -244,15 +903,17 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
         sort_order: Optional[str] = None,
         search: Optional[str] = None,
         nombre_grupo: Optional[str] = None,
-        recomendacion: Optional[int] = None
+        recomendacion: Optional[int] = None,
+        cow_filter: Optional[CowFilter] = None
     ) -> Dict[str, Any]:
         """Get all cows for a snapshot with pagination, sorting, and filtering."""
         session = self.db.get_session()
         try:
-            # Verify ownership
+            # Verify ownership (snapshots still loading are not visible)
             global_hato = session.query(GlobalHatoModel).filter(
                 GlobalHatoModel.id == global_hato_id,
-                GlobalHatoModel.user_id == user_id
+                GlobalHatoModel.user_id == user_id,
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES)
             ).first()
 
             if not global_hato:
@@ -264,51 +925,109 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
                     'pages': 0
                 }
 
+            if global_hato.status == SNAPSHOT_STATUS_ARCHIVED:
+                result = self.archive.query(
+                    global_hato.archive_route,
+                    page=page,
+                    limit=limit,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    search=search,
+                    nombre_grupo=nombre_grupo,
+                    recomendacion=recomendacion,
+                    cow_filter=cow_filter
+                )
+                total = result['total']
+                return {
+                    'cows': [Cow(**row) for row in result['cows']],
+                    'total': total,
+                    'page': page,
+                    'limit': limit,
+                    'pages': (total + limit - 1) // limit if total > 0 else 0
+                }
+
+            # Hot snapshots are filtered, sorted and paginated in memory
+            columns = self._cached_columns(session, global_hato)
+            if columns is not None:
+                result = columns.query(
+                    page=page,
+                    limit=limit,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    search=search,
+                    nombre_grupo=nombre_grupo,
+                    recomendacion=recomendacion,
+                    cow_filter=cow_filter
+                )
+                total = result['total']
+                return {
+                    'cows': [Cow(**row) for row in result['cows']],
+                    'total': total,
+                    'page': page,
+                    'limit': limit,
+                    'pages': (total + limit - 1) // limit if total > 0 else 0
+                }
+
+            # Range / IN-list filters, compiled once per shape
+            predicate = None
+            if cow_filter is not None and not cow_filter.is_empty:
+                predicate = self._filter_predicate(cow_filter)
+
+            snapshot_cows = self._cows_source(global_hato, predicate)
+
             # Base query
-            query = session.query(CowModel).filter(
-                CowModel.global_hato_id == global_hato_id
+            query = session.query(snapshot_cows).filter(
+                snapshot_cows.global_hato_id == global_hato_id
             )
+            if predicate is not None:
+                if snapshot_cows is CowModel:
+                    query = query.filter(predicate)
+                query = query.params(**cow_filter.bind_values())
 
             # Apply search filter (partial match on multiple columns)
             if search:
                 search_pattern = f'%{search}%'
                 query = query.filter(
-                    (CowModel.numero_animal.ilike(search_pattern)) |
-                    (CowModel.nombre_grupo.ilike(search_pattern)) |
-                    (CowModel.estado_reproduccion.ilike(search_pattern))
+                    (snapshot_cows.numero_animal.ilike(search_pattern)) |
+                    (snapshot_cows.nombre_grupo.ilike(search_pattern)) |
+                    (snapshot_cows.estado_reproduccion.ilike(search_pattern))
                 )
 
             # Apply group filter (exact match)
             if nombre_grupo:
-                query = query.filter(CowModel.nombre_grupo == nombre_grupo)
+                query = query.filter(snapshot_cows.nombre_grupo == nombre_grupo)
 
             # Apply recommendation filter (exact match)
             if recomendacion is not None:
-                query = query.filter(CowModel.recomendacion == recomendacion)
+                query = query.filter(snapshot_cows.recomendacion == recomendacion)
 
             # Apply sorting
             if sort_by and sort_order:
                 column_map = {
-                    'id': CowModel.id,
-                    'numero_animal': CowModel.numero_animal,
-                    'nombre_grupo': CowModel.nombre_grupo,
-                    'produccion_leche_ayer': CowModel.produccion_leche_ayer,
-                    'produccion_media_7dias': CowModel.produccion_media_7dias,
-                    'estado_reproduccion': CowModel.estado_reproduccion,
-                    'estado_reproduccion': CowModel.estado_reproduccion,
-                    'dias_ordeno': CowModel.dias_ordeno,
-                    'numero_seleccion': CowModel.numero_seleccion,
-                    'recomendacion': CowModel.recomendacion
+                    'id': snapshot_cows.id,
+                    'numero_animal': snapshot_cows.numero_animal,
+                    'nombre_grupo': snapshot_cows.nombre_grupo,
+                    'produccion_leche_ayer': snapshot_cows.produccion_leche_ayer,
+                    'produccion_media_7dias': snapshot_cows.produccion_media_7dias,
+                    'estado_reproduccion': snapshot_cows.estado_reproduccion,
+                    'estado_reproduccion': snapshot_cows.estado_reproduccion,
+                    'dias_ordeno': snapshot_cows.dias_ordeno,
+                    'numero_seleccion': snapshot_cows.numero_seleccion,
+                    'recomendacion': snapshot_cows.recomendacion
                 }
                 if sort_by in column_map:
                     column = column_map[sort_by]
+                    if sort_by in STRING_SORT_COLUMNS:
+                        column = code_point(column)
+                    # Same order as the cache and archive reads: NULLs last ascending and
+                    # first descending (PostgreSQL's default, not SQLite's), ties by id
                     if sort_order.lower() == 'desc':
-                        query = query.order_by(column.desc())
+                        query = query.order_by(column.desc().nulls_first(), snapshot_cows.id.asc())
                     else:
-                        query = query.order_by(column.asc())
+                        query = query.order_by(column.asc().nulls_last(), snapshot_cows.id.asc())
             else:
                 # Default sorting by id ascending
-                query = query.order_by(CowModel.id.asc())
+                query = query.order_by(snapshot_cows.id.asc())
 
             # Get total count
             total = query.count()
@@ -347,6 +1066,99 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
         finally:
             session.close()
 
+    async def get_column_values(
+        self,
+        global_hato_id: int,
+        user_id: int,
+        columns: List[str],
+        nombre_grupo: Optional[str] = None
+    ) -> Optional[Dict[str, List[Any]]]:
+        """Get the raw values of some cow columns in a snapshot (only those columns are read)."""
+        session = self.db.get_session()
+        try:
+            # Verify ownership (snapshots still loading are not visible)
+            global_hato = session.query(GlobalHatoModel).filter(
+                GlobalHatoModel.id == global_hato_id,
+                GlobalHatoModel.user_id == user_id,
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES)
+            ).first()
+
+            if not global_hato:
+                return None
+
+            if global_hato.status == SNAPSHOT_STATUS_ARCHIVED:
+                return self.archive.column_values(global_hato.archive_route, columns, nombre_grupo)
+
+            snapshot_cows = self._cows_source(global_hato)
+            query = select(*[getattr(snapshot_cows, column) for column in columns]).where(
+                snapshot_cows.global_hato_id == global_hato_id
+            )
+            if nombre_grupo:
+                query = query.where(snapshot_cows.nombre_grupo == nombre_grupo)
+
+            rows = session.execute(query).all()
+            return {column: [row[i] for row in rows] for i, column in enumerate(columns)}
+        finally:
+            session.close()
+
+    async def get_ranked_cows_by_group(
+        self,
+        global_hato_id: int,
+        user_id: int,
+        sort_by: str,
+        descending: bool = False,
+        limit: int = 10,
+        nombre_grupos: Optional[List[str]] = None
+    ) -> Optional[List[RankedCow]]:
+        """Get the top `limit` cows of every corral by one column (ROW_NUMBER per group)."""
+        session = self.db.get_session()
+        try:
+            # Verify ownership (snapshots still loading are not visible)
+            global_hato = session.query(GlobalHatoModel).filter(
+                GlobalHatoModel.id == global_hato_id,
+                GlobalHatoModel.user_id == user_id,
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES)
+            ).first()
+
+            if not global_hato:
+                return None
+
+            if global_hato.status == SNAPSHOT_STATUS_ARCHIVED:
+                rows = self.archive.ranked_by_group(
+                    global_hato.archive_route, sort_by, descending, limit, nombre_grupos
+                )
+                return [RankedCow(rank=row.pop('rank'), cow=Cow(**row)) for row in rows]
+
+            snapshot_cows = self._cows_source(global_hato)
+            metric = getattr(snapshot_cows, sort_by)
+            rank = func.row_number().over(
+                partition_by=snapshot_cows.nombre_grupo,
+                order_by=(metric.desc() if descending else metric.asc(), snapshot_cows.id.asc())
+            ).label('rank')
+            query = select(*[getattr(snapshot_cows, column) for column in COW_COLUMNS], rank).where(
+                snapshot_cows.global_hato_id == global_hato_id,
+                snapshot_cows.nombre_grupo.isnot(None),
+                snapshot_cows.nombre_grupo != '',
+                metric.isnot(None)
+            )
+            if nombre_grupos:
+                query = query.where(snapshot_cows.nombre_grupo.in_(nombre_grupos))
+
+            # Filtering on the window result needs a subquery; PostgreSQL stops
+            # numbering each group once the rank passes the limit
+            ranked = query.subquery('ranked_cows')
+            rows = session.execute(
+                select(ranked)
+                .where(ranked.c.rank <= limit)
+                .order_by(ranked.c.nombre_grupo, ranked.c.rank)
+            ).mappings().all()
+            return [
+                RankedCow(rank=row['rank'], cow=Cow(**{column: row[column] for column in COW_COLUMNS}))
+                for row in rows
+            ]
+        finally:
+            session.close()
+
     def _model_to_entity(self, model: GlobalHatoModel) -> GlobalHato:
         """Convert ORM model to domain entity."""
         return GlobalHato(
@@ -357,5 +1169,18 @@ class GlobalHatoRepositoryAdapter(IGlobalHatoRepository):
             total_animales=model.total_animales,
             grupos_detectados=model.grupos_detectados,
             created_at=model.created_at,
-            blob_route=model.blob_route
+            blob_route=model.blob_route,
+            status=model.status,
+            archive_route=model.archive_route,
+            base_snapshot_id=model.base_snapshot_id
+        )
+
+    def _row_to_corral_group(self, row: Dict[str, Any]) -> CorralGroup:
+        """Build a CorralGroup from an aggregate row (SQL or archive)."""
+        return CorralGroup(
+            nombre_grupo=row['nombre_grupo'],
+            total_animales=int(row['total_animales']),
+            produccion_promedio=round(float(row['produccion_promedio'] or 0), 2),
+            produccion_total=round(float(row['produccion_total'] or 0), 2),
+            produccion_promedio_7dias=round(float(row['produccion_promedio_7dias'] or 0), 2)
         )
@@ -0,0 +1,157 @@
+"""Search index repository adapter using SQLAlchemy."""
+from typing import Optional, List
+from sqlalchemy import exists, func, insert
+from domain.entities import SearchTerm, SearchMatch, SearchOccurrence
+from domain.repositories import ISearchIndexRepository
+from infrastructure.database import GlobalHatoModel, SearchTermModel
+from infrastructure.database.collation import code_point
+from infrastructure.database.db_config import db_config
+from utils.constants import app_config
+from utils.constants.snapshot_status import SNAPSHOT_VISIBLE_STATUSES
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input only matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class SearchIndexRepositoryAdapter(ISearchIndexRepository):
+    """Search index repository adapter using SQLAlchemy."""
+
+    def __init__(self):
+        self.db = db_config
+        self.chunk_size = app_config.INGEST_CHUNK_SIZE
+
+    async def save(self, global_hato_id: int, terms: List[SearchTerm]) -> None:
+        """Replace the search terms of a snapshot, in one transaction."""
+        session = self.db.get_session()
+        try:
+            session.query(SearchTermModel).filter(
+                SearchTermModel.global_hato_id == global_hato_id
+            ).delete(synchronize_session=False)
+
+            rows = [
+                {
+                    "global_hato_id": global_hato_id,
+                    "kind": term.kind,
+                    "term": term.term,
+                    "user_id": term.user_id,
+                    "fecha_snapshot": term.fecha_snapshot.date() if hasattr(term.fecha_snapshot, "date") else term.fecha_snapshot,
+                    "search_key": term.term.lower(),
+                }
+                for term in terms
+            ]
+            for start in range(0, len(rows), self.chunk_size):
+                session.execute(insert(SearchTermModel), rows[start:start + self.chunk_size])
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    async def delete(self, global_hato_id: int) -> None:
+        """Delete the search terms of a snapshot."""
+        session = self.db.get_session()
+        try:
+            session.query(SearchTermModel).filter(
+                SearchTermModel.global_hato_id == global_hato_id
+            ).delete(synchronize_session=False)
+            session.commit()
+        finally:
+            session.close()
+
+    async def find_missing(self) -> List[int]:
+        """Get IDs of visible snapshots that have no search terms."""
+        session = self.db.get_session()
+        try:
+            has_terms = exists().where(SearchTermModel.global_hato_id == GlobalHatoModel.id)
+            rows = session.query(GlobalHatoModel.id).filter(
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES),
+                ~has_terms
+            ).order_by(GlobalHatoModel.id.asc()).all()
+            return [row.id for row in rows]
+        finally:
+            session.close()
+
+    async def find_by_prefix(
+        self,
+        user_id: int,
+        prefix: str,
+        kind: Optional[str] = None,
+        limit: int = 10
+    ) -> List[SearchMatch]:
+        """
+        Get a user's terms starting with `prefix`, by code point.
+
+        The (user_id, search_key COLLATE "C") index returns rows already in
+        result order, so the scan stops after the rows of the first `limit`
+        terms (one row per snapshot a term appears in), however many other
+        terms share the prefix.
+        """
+        pattern = _escape_like(prefix.lower()) + "%"
+        # Compared by code point, like the index, so the range scan applies
+        condition = code_point(SearchTermModel.search_key).like(pattern, escape="\\")
+        return self._find_matches(user_id, condition, kind, limit)
+
+    async def find_containing(
+        self,
+        user_id: int,
+        text: str,
+        kind: Optional[str] = None,
+        limit: int = 10
+    ) -> List[SearchMatch]:
+        """Get a user's terms containing `text`, by code point (trigram index on PostgreSQL)."""
+        pattern = "%" + _escape_like(text.lower()) + "%"
+        # The trigram index uses the column's own collation
+        condition = SearchTermModel.search_key.like(pattern, escape="\\")
+        return self._find_matches(user_id, condition, kind, limit)
+
+    def _find_matches(self, user_id: int, condition, kind: Optional[str], limit: int) -> List[SearchMatch]:
+        session = self.db.get_session()
+        try:
+            query = session.query(
+                SearchTermModel.kind,
+                SearchTermModel.term,
+                func.count().label('snapshots'),
+                func.max(SearchTermModel.fecha_snapshot).label('last_fecha_snapshot')
+            ).filter(
+                SearchTermModel.user_id == user_id,
+                condition
+            )
+            if kind:
+                query = query.filter(SearchTermModel.kind == kind)
+            # Grouped and ordered by the index key, so groups come out of the scan in order
+            search_key = code_point(SearchTermModel.search_key)
+            query = query.group_by(
+                search_key, SearchTermModel.term, SearchTermModel.kind
+            ).order_by(
+                search_key.asc(), code_point(SearchTermModel.term).asc(), SearchTermModel.kind.asc()
+            ).limit(limit)
+            return [SearchMatch(**row._asdict()) for row in query.all()]
+        finally:
+            session.close()
+
+    async def find_occurrences(self, user_id: int, kind: str, term: str) -> List[SearchOccurrence]:
+        """Get the user's snapshots a term appears in, newest first."""
+        session = self.db.get_session()
+        try:
+            rows = session.query(
+                GlobalHatoModel.id.label('global_hato_id'),
+                GlobalHatoModel.nombre,
+                SearchTermModel.fecha_snapshot
+            ).join(
+                GlobalHatoModel, GlobalHatoModel.id == SearchTermModel.global_hato_id
+            ).filter(
+                SearchTermModel.user_id == user_id,
+                # Collated like the index, which only serves comparisons in its collation
+                code_point(SearchTermModel.search_key) == term.lower(),
+                SearchTermModel.kind == kind,
+                SearchTermModel.term == term,
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES)
+            ).order_by(
+                SearchTermModel.fecha_snapshot.desc(), GlobalHatoModel.id.desc()
+            ).all()
+            return [SearchOccurrence(**row._asdict()) for row in rows]
+        finally:
+            session.close()
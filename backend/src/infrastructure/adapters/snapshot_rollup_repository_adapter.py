@@ -0,0 +1,137 @@
+"""Snapshot rollup repository adapter using SQLAlchemy."""
+from datetime import date
+from typing import Optional, List
+from sqlalchemy import exists, insert, or_
+from domain.entities import SnapshotRollup, CorralRollup
+from domain.repositories import ISnapshotRollupRepository
+from infrastructure.database import GlobalHatoModel, SnapshotRollupModel, CorralRollupModel
+from infrastructure.database.db_config import db_config
+from utils.constants.snapshot_status import SNAPSHOT_VISIBLE_STATUSES
+
+# Totals shared by snapshot and corral rollups
+TOTAL_FIELDS = [
+    "total_animales",
+    "produccion_total",
+    "produccion_promedio",
+    "produccion_promedio_7dias",
+    "en_produccion",
+    "en_monitoreo",
+    "previo_secado",
+    "sin_recomendacion",
+]
+ROLLUP_FIELDS = ["global_hato_id", "user_id", "fecha_snapshot", "grupos_detectados", *TOTAL_FIELDS]
+CORRAL_ROLLUP_FIELDS = ["global_hato_id", "user_id", "fecha_snapshot", "nombre_grupo", *TOTAL_FIELDS]
+
+
+def _as_date(value):
+    """Snapshot dates may arrive as datetimes."""
+    return value.date() if hasattr(value, "date") else value
+
+
+class SnapshotRollupRepositoryAdapter(ISnapshotRollupRepository):
+    """Snapshot rollup repository adapter using SQLAlchemy."""
+
+    def __init__(self):
+        self.db = db_config
+
+    async def save(self, rollup: SnapshotRollup, corrales: Optional[List[CorralRollup]] = None) -> None:
+        """Insert or replace the rollup of a snapshot and its per-corral rows, in one transaction."""
+        session = self.db.get_session()
+        try:
+            values = {field: getattr(rollup, field) for field in ROLLUP_FIELDS}
+            values["fecha_snapshot"] = _as_date(values["fecha_snapshot"])
+            session.merge(SnapshotRollupModel(**values))
+
+            session.query(CorralRollupModel).filter(
+                CorralRollupModel.global_hato_id == rollup.global_hato_id
+            ).delete(synchronize_session=False)
+            if corrales:
+                rows = [{field: getattr(corral, field) for field in CORRAL_ROLLUP_FIELDS} for corral in corrales]
+                for row in rows:
+                    row["fecha_snapshot"] = _as_date(row["fecha_snapshot"])
+                session.execute(insert(CorralRollupModel), rows)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    async def delete(self, global_hato_id: int) -> None:
+        """Delete the rollup of a snapshot and its per-corral rows."""
+        session = self.db.get_session()
+        try:
+            session.query(CorralRollupModel).filter(
+                CorralRollupModel.global_hato_id == global_hato_id
+            ).delete(synchronize_session=False)
+            session.query(SnapshotRollupModel).filter(
+                SnapshotRollupModel.global_hato_id == global_hato_id
+            ).delete(synchronize_session=False)
+            session.commit()
+        finally:
+            session.close()
+
+    async def find_missing(self) -> List[int]:
+        """Get IDs of visible snapshots without a rollup (or without their per-corral rows)."""
+        session = self.db.get_session()
+        try:
+            has_rollup = exists().where(SnapshotRollupModel.global_hato_id == GlobalHatoModel.id)
+            has_corrales = exists().where(CorralRollupModel.global_hato_id == GlobalHatoModel.id)
+            rows = session.query(GlobalHatoModel.id).filter(
+                GlobalHatoModel.status.in_(SNAPSHOT_VISIBLE_STATUSES),
+                or_(~has_rollup, (GlobalHatoModel.grupos_detectados > 0) & ~has_corrales)
+            ).order_by(GlobalHatoModel.id.asc()).all()
+            return [row.id for row in rows]
+        finally:
+            session.close()
+
+    async def find_by_user(
+        self,
+        user_id: int,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None
+    ) -> List[SnapshotRollup]:
+        """Get a user's rollups within a date window, oldest first (one index range scan)."""
+        session = self.db.get_session()
+        try:
+            query = session.query(SnapshotRollupModel).filter(SnapshotRollupModel.user_id == user_id)
+            if fecha_desde:
+                query = query.filter(SnapshotRollupModel.fecha_snapshot >= fecha_desde)
+            if fecha_hasta:
+                query = query.filter(SnapshotRollupModel.fecha_snapshot <= fecha_hasta)
+            query = query.order_by(SnapshotRollupModel.fecha_snapshot.asc(), SnapshotRollupModel.global_hato_id.asc())
+            return [
+                SnapshotRollup(**{field: getattr(model, field) for field in ROLLUP_FIELDS})
+                for model in query.all()
+            ]
+        finally:
+            session.close()
+
+    async def find_corral_series(
+        self,
+        user_id: int,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None,
+        nombre_grupo: Optional[str] = None
+    ) -> List[CorralRollup]:
+        """Get a user's per-corral rows within a date window (one index range scan), by date then corral."""
+        session = self.db.get_session()
+        try:
+            query = session.query(CorralRollupModel).filter(CorralRollupModel.user_id == user_id)
+            if fecha_desde:
+                query = query.filter(CorralRollupModel.fecha_snapshot >= fecha_desde)
+            if fecha_hasta:
+                query = query.filter(CorralRollupModel.fecha_snapshot <= fecha_hasta)
+            if nombre_grupo:
+                query = query.filter(CorralRollupModel.nombre_grupo == nombre_grupo)
+            query = query.order_by(
+                CorralRollupModel.fecha_snapshot.asc(),
+                CorralRollupModel.nombre_grupo.asc(),
+                CorralRollupModel.global_hato_id.asc()
+            )
+            return [
+                CorralRollup(**{field: getattr(model, field) for field in CORRAL_ROLLUP_FIELDS})
+                for model in query.all()
+            ]
+        finally:
+            session.close()
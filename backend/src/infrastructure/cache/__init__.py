@@ -0,0 +1,7 @@
+from .snapshot_cache import SnapshotColumns, SnapshotCache, snapshot_cache
+
+__all__ = [
+    "SnapshotColumns",
+    "SnapshotCache",
+    "snapshot_cache",
+]
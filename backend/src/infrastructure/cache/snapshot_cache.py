@@ -0,0 +1,284 @@
+"""Per-worker in-memory columnar cache of hot snapshots for /vacas browsing.
+
+Browsing a snapshot issues many paginated reads with different sort and filter
+combinations, each a COUNT plus an OFFSET query. Once a snapshot has been read
+SNAPSHOT_CACHE_HOT_READS times, its cows are loaded once into NumPy arrays:
+numbers as typed arrays with a NULL mask, strings dictionary-encoded (categories
+sorted by code point, like the SQL sort, so codes sort like the strings).
+Ties are broken by id, as in SQL. Filtering, counting, sorting and
+slicing then run vectorized in memory. Entries are evicted least recently used
+to stay within SNAPSHOT_CACHE_MAX_BYTES; cold snapshots keep using SQL.
+
+Entries are keyed by (id, updated_at or created_at). Replace uploads and bulk
+re-scoring change a snapshot's cows in place and bump updated_at on it (and on
+the delta snapshots inheriting its rows), so every worker's next read misses
+and reloads; the worker that made the change also discards its entry. The
+creation time in the key keeps a database reset that reuses ids from serving
+stale rows. NumPy is imported lazily to keep it out of app startup.
+"""
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Sequence
+from infrastructure.monitoring import record_cache_lookup
+from utils.constants import app_config
+
+# Column -> NumPy dtype; NULLs are tracked in a separate mask
+_NUMERIC_COLUMNS = {
+    "produccion_leche_ayer": "float64",
+    "produccion_media_7dias": "float64",
+    "dias_ordeno": "int32",
+    "recomendacion": "int16",
+}
+_STRING_COLUMNS = ["numero_animal", "nombre_grupo", "estado_reproduccion", "numero_seleccion"]
+_SEARCH_COLUMNS = ["numero_animal", "nombre_grupo", "estado_reproduccion"]
+
+# Snapshots whose read count (or too-large flag) is tracked while they are not cached
+_MAX_TRACKED_READS = 1024
+
+
+class SnapshotColumns:
+    """One snapshot's cows as column arrays, ordered by id."""
+
+    def __init__(self, global_hato_id: int, ids, numeric: Dict[str, tuple], strings: Dict[str, tuple]):
+        self.global_hato_id = global_hato_id
+        self.ids = ids
+        self.numeric = numeric  # column -> (values, nulls)
+        self.strings = strings  # column -> (codes, categories, lowered categories or None)
+        self.nbytes = self._measure()
+
+    @classmethod
+    def from_rows(cls, global_hato_id: int, rows: Sequence[Dict[str, Any]]) -> "SnapshotColumns":
+        """
+        Build the arrays from cow rows.
+
+        Args:
+            global_hato_id: Snapshot ID
+            rows: Cow rows (id plus the cow fields), ordered by id
+        """
+        import numpy as np
+
+        count = len(rows)
+        ids = np.fromiter((row["id"] for row in rows), dtype=np.int64, count=count)
+
+        numeric = {}
+        for column, dtype in _NUMERIC_COLUMNS.items():
+            raw = [row[column] for row in rows]
+            nulls = np.fromiter((value is None for value in raw), dtype=bool, count=count)
+            values = np.fromiter((0 if value is None else value for value in raw), dtype=dtype, count=count)
+            numeric[column] = (values, nulls)
+
+        strings = {}
+        for column in _STRING_COLUMNS:
+            raw = [row[column] for row in rows]
+            categories = sorted({value for value in raw if value is not None})
+            position = {value: code for code, value in enumerate(categories)}
+            codes = np.fromiter(
+                (-1 if value is None else position[value] for value in raw), dtype=np.int32, count=count
+            )
+            lowered = np.char.lower(np.array(categories, dtype=str)) if column in _SEARCH_COLUMNS else None
+            strings[column] = (codes, categories, lowered)
+
+        return cls(global_hato_id, ids, numeric, strings)
+
+    def _measure(self) -> int:
+        """Approximate memory held by the arrays and the category strings."""
+        total = self.ids.nbytes
+        for values, nulls in self.numeric.values():
+            total += values.nbytes + nulls.nbytes
+        for codes, categories, lowered in self.strings.values():
+            total += codes.nbytes + sum(sys.getsizeof(value) for value in categories)
+            if lowered is not None:
+                total += lowered.nbytes
+        return total
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def query(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        search: Optional[str] = None,
+        nombre_grupo: Optional[str] = None,
+        recomendacion: Optional[int] = None,
+        cow_filter=None
+    ) -> Dict[str, Any]:
+        """
+        Filter, sort and paginate like get_all_cows_by_snapshot.
+
+        Returns:
+            Dict with 'cows' (row dicts) and 'total'
+        """
+        import numpy as np
+
+        mask = np.ones(len(self), dtype=bool)
+
+        # Search filter (case-insensitive partial match, like ILIKE)
+        if search:
+            term = search.lower()
+            found = np.zeros(len(self), dtype=bool)
+            for column in _SEARCH_COLUMNS:
+                codes, _, lowered = self.strings[column]
+                found |= self._by_code(np.char.find(lowered, term) >= 0, codes)
+            mask &= found
+
+        if nombre_grupo:
+            mask &= self._string_in("nombre_grupo", [nombre_grupo])
+
+        if recomendacion is not None:
+            mask &= self._numeric_in("recomendacion", [recomendacion])
+
+        # Range / IN-list filters; NULLs never match, as in SQL
+        if cow_filter is not None:
+            for column, low, high in cow_filter.ranges:
+                values, nulls = self.numeric[column]
+                if low is not None:
+                    mask &= ~nulls & (values >= low)
+                if high is not None:
+                    mask &= ~nulls & (values <= high)
+            for column, accepted in cow_filter.in_lists:
+                if column in self.strings:
+                    mask &= self._string_in(column, accepted)
+                else:
+                    mask &= self._numeric_in(column, accepted)
+
+        selected = np.flatnonzero(mask)  # id order, the default
+
+        # NULLs sort like PostgreSQL: last ascending, first descending; ties keep id order
+        if sort_by and sort_order and (sort_by in self.numeric or sort_by in self.strings or sort_by == "id"):
+            descending = sort_order.lower() == "desc"
+            if sort_by == "id":
+                key, nulls = self.ids[selected], np.zeros(len(selected), dtype=bool)
+            elif sort_by in self.numeric:
+                values, null_mask = self.numeric[sort_by]
+                key, nulls = values[selected], null_mask[selected]
+            else:
+                codes = self.strings[sort_by][0][selected]
+                key, nulls = codes, codes < 0
+            if descending:
+                order = np.lexsort((selected, -key.astype(np.float64), ~nulls))
+            else:
+                order = np.lexsort((selected, key, nulls))
+            selected = selected[order]
+
+        offset = (page - 1) * limit
+        return {
+            "cows": [self._row(index) for index in selected[offset:offset + limit]],
+            "total": len(selected),
+        }
+
+    def _by_code(self, category_mask, codes):
+        """Per-row mask from a per-category mask (NULL rows, code -1, never match)."""
+        import numpy as np
+
+        return np.append(category_mask, False)[codes]
+
+    def _string_in(self, column: str, accepted) -> Any:
+        import numpy as np
+
+        codes, categories, _ = self.strings[column]
+        accepted = set(accepted)
+        return self._by_code(np.array([value in accepted for value in categories], dtype=bool), codes)
+
+    def _numeric_in(self, column: str, accepted) -> Any:
+        import numpy as np
+
+        values, nulls = self.numeric[column]
+        return ~nulls & np.isin(values, list(accepted))
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        row = {"id": int(self.ids[index]), "global_hato_id": self.global_hato_id}
+        for column, (values, nulls) in self.numeric.items():
+            row[column] = None if nulls[index] else values[index].item()
+        for column, (codes, categories, _) in self.strings.items():
+            code = codes[index]
+            row[column] = None if code < 0 else categories[code]
+        return row
+
+
+class SnapshotCache:
+    """LRU of SnapshotColumns bounded by memory, loaded once a snapshot is hot."""
+
+    def __init__(self, max_bytes: Optional[int] = None, hot_reads: Optional[int] = None):
+        self.max_bytes = app_config.SNAPSHOT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.hot_reads = app_config.SNAPSHOT_CACHE_HOT_READS if hot_reads is None else hot_reads
+        self._entries: "OrderedDict[Hashable, SnapshotColumns]" = OrderedDict()
+        self._reads: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._too_large: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[SnapshotColumns]:
+        """Cached columns of a snapshot, if any (counts a hit or miss)."""
+        with self._lock:
+            columns = self._entries.get(key)
+            if columns is not None:
+                self._entries.move_to_end(key)
+        record_cache_lookup("snapshot_columns", columns is not None)
+        return columns
+
+    def is_hot(self, key: Hashable) -> bool:
+        """Count a read of an uncached snapshot; True once it should be loaded."""
+        with self._lock:
+            if key in self._too_large:
+                return False
+            reads = self._reads.pop(key, 0) + 1
+            self._reads[key] = reads
+            while len(self._reads) > _MAX_TRACKED_READS:
+                self._reads.popitem(last=False)
+            return reads >= self.hot_reads
+
+    def put(self, key: Hashable, columns: SnapshotColumns) -> bool:
+        """
+        Cache a snapshot's columns, evicting the least recently used ones to fit.
+
+        Returns:
+            False if the snapshot alone exceeds the memory budget (it is not retried)
+        """
+        with self._lock:
+            self._reads.pop(key, None)
+            if columns.nbytes > self.max_bytes:
+                self._too_large[key] = None
+                while len(self._too_large) > _MAX_TRACKED_READS:
+                    self._too_large.popitem(last=False)
+                return False
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = columns
+            self._bytes += columns.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+            return True
+
+    def discard(self, global_hato_id: int) -> None:
+        """Drop a snapshot (e.g., deleted) and its read bookkeeping to free memory early."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == global_hato_id]:
+                self._bytes -= self._entries.pop(key).nbytes
+            for tracked in (self._reads, self._too_large):
+                for key in [key for key in tracked if key[0] == global_hato_id]:
+                    del tracked[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._reads.clear()
+            self._too_large.clear()
+            self._bytes = 0
+
+
+# Singleton instance
+snapshot_cache = SnapshotCache()
@@ -1,5 +1,5 @@
 from .db_config import DatabaseConfig, db_config, Base
-from .models import UserModel, CowModel, DatasetModel, ModelModel, PredictionModel, GlobalHatoModel
+from .models import UserModel, CowModel, DatasetModel, ModelModel, PredictionModel, GlobalHatoModel, SnapshotRollupModel, CorralRollupModel, SearchTermModel
 
 __all__ = [
     "DatabaseConfig",
@@ -11,4 +11,7 @@ __all__ = [
     "ModelModel",
     "PredictionModel",
     "GlobalHatoModel",
+    "SnapshotRollupModel",
+    "CorralRollupModel",
+    "SearchTermModel",
 ]
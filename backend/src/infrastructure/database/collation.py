@@ -0,0 +1,32 @@
+"""Code-point ordering of text columns, the same on PostgreSQL and SQLite.
+
+PostgreSQL compares text by the database locale unless told otherwise, while
+the in-memory paths (snapshot cache, archive files) and SQLite compare code
+points. code_point(column) renders `column COLLATE "C"` on PostgreSQL and the
+bare column elsewhere (SQLite's default BINARY collation already compares
+UTF-8 bytes), so it can be used in queries and index definitions alike.
+"""
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+
+class code_point(ColumnElement):
+    """A text expression compared by code point (COLLATE "C" on PostgreSQL)."""
+
+    inherit_cache = True
+    _traverse_internals = [("element", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, element):
+        self.element = element
+        self.type = element.type
+
+
+@compiles(code_point)
+def _compile_code_point(element, compiler, **kw):
+    return compiler.process(element.element, **kw)
+
+
+@compiles(code_point, "postgresql")
+def _compile_code_point_postgresql(element, compiler, **kw):
+    return f'{compiler.process(element.element, **kw)} COLLATE "C"'
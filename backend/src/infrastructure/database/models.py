@@ -1,7 +1,9 @@
-from sqlalchemy import Column, String, DateTime, Integer, JSON, ForeignKey
+from sqlalchemy import Column, String, DateTime, Date, Integer, Float, REAL, Boolean, JSON, ForeignKey, Index, false
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
+from infrastructure.database.collation import code_point
 from infrastructure.database.db_config import Base
+from utils.constants.snapshot_status import SNAPSHOT_STATUS_LOADING, SNAPSHOT_STATUS_READY
 
 
 class UserModel(Base):
@@ -37,6 +39,32 @@ class GlobalHatoModel(Base):
     grupos_detectados = Column(Integer, nullable=False)
     blob_route = Column(String, nullable=True)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    status = Column(String, nullable=False, default=SNAPSHOT_STATUS_READY, server_default=SNAPSHOT_STATUS_READY)
+    # Parquet file holding the cows once the snapshot is archived
+    archive_route = Column(String, nullable=True)
+    # Delta-encoded snapshots only store cows that differ from this full snapshot.
+    # RESTRICT: a base can only be deleted once its deltas are materialized
+    base_snapshot_id = Column(Integer, ForeignKey("global_hato.id", ondelete="RESTRICT"), nullable=True)
+    # Set when the snapshot's cows are replaced by a re-upload; while loading,
+    # the time of the last committed chunk (abandoned-load cleanup)
+    updated_at = Column(DateTime, nullable=True)
+
+    # Only loading snapshots are indexed, for the abandoned-load cleanup;
+    # only delta snapshots, to find the dependents of a base
+    __table_args__ = (
+        Index(
+            "idx_global_hato_loading",
+            "created_at",
+            postgresql_where=(status == SNAPSHOT_STATUS_LOADING),
+            sqlite_where=(status == SNAPSHOT_STATUS_LOADING),
+        ),
+        Index(
+            "idx_global_hato_base_snapshot",
+            "base_snapshot_id",
+            postgresql_where=base_snapshot_id.isnot(None),
+            sqlite_where=base_snapshot_id.isnot(None),
+        ),
+    )
 
     # Relationships
     uploader = relationship("UserModel", back_populates="global_hatos")
@@ -58,6 +86,24 @@ class CowModel(Base):
     dias_ordeno = Column(Integer, nullable=True)
     numero_seleccion = Column(String, nullable=True)
     recomendacion = Column(Integer, nullable=True)
+    # Tombstone: the animal is in the base snapshot but not in this delta snapshot
+    removed = Column(Boolean, nullable=False, default=False, server_default=false())
+    # Hash of the uploaded row; re-uploads only re-score cows whose hash changed
+    content_hash = Column(String(32), nullable=True)
+    # Model inputs that are not API fields (float32), for re-scoring with a new model
+    numero_lactacion = Column(REAL, nullable=True)
+    numero_inseminaciones = Column(REAL, nullable=True)
+    dias_prenada = Column(REAL, nullable=True)
+    dias_para_parto = Column(REAL, nullable=True)
+    produccion_total_lactacion = Column(REAL, nullable=True)
+
+    # Anti-join of delta snapshots against their base; group filters (IN lists,
+    # cows by group) and per-corral rankings by production within a snapshot
+    __table_args__ = (
+        Index("idx_cows_snapshot_animal", "global_hato_id", "numero_animal"),
+        Index("idx_cows_snapshot_grupo_leche", "global_hato_id", "nombre_grupo", "produccion_leche_ayer"),
+        Index("idx_cows_snapshot_grupo_media7", "global_hato_id", "nombre_grupo", "produccion_media_7dias"),
+    )
 
     # Relationships
     global_hato = relationship("GlobalHatoModel", back_populates="cows")
@@ -120,3 +166,72 @@ class PredictionModel(Base):
     cow = relationship("CowModel", back_populates="predictions")
     model = relationship("ModelModel", back_populates="predictions")
     dataset = relationship("DatasetModel", back_populates="predictions")
+
+
+class SnapshotRollupModel(Base):
+    """SQLAlchemy ORM model for per-snapshot herd totals (trend charts)."""
+
+    __tablename__ = "global_hato_rollups"
+
+    global_hato_id = Column(Integer, ForeignKey("global_hato.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    fecha_snapshot = Column(Date, nullable=False)
+    total_animales = Column(Integer, nullable=False)
+    grupos_detectados = Column(Integer, nullable=False)
+    produccion_total = Column(Float, nullable=False)
+    produccion_promedio = Column(Float, nullable=True)
+    produccion_promedio_7dias = Column(Float, nullable=True)
+    en_produccion = Column(Integer, nullable=False, default=0)
+    en_monitoreo = Column(Integer, nullable=False, default=0)
+    previo_secado = Column(Integer, nullable=False, default=0)
+    sin_recomendacion = Column(Integer, nullable=False, default=0)
+
+    # Any date window of one user is a single range scan
+    __table_args__ = (
+        Index("idx_global_hato_rollups_user_fecha", "user_id", "fecha_snapshot"),
+    )
+
+
+class CorralRollupModel(Base):
+    """SQLAlchemy ORM model for per-snapshot corral totals (corral time series)."""
+
+    __tablename__ = "global_hato_corral_rollups"
+
+    global_hato_id = Column(Integer, ForeignKey("global_hato.id", ondelete="CASCADE"), primary_key=True)
+    nombre_grupo = Column(String, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    fecha_snapshot = Column(Date, nullable=False)
+    total_animales = Column(Integer, nullable=False)
+    produccion_total = Column(Float, nullable=False)
+    produccion_promedio = Column(Float, nullable=True)
+    produccion_promedio_7dias = Column(Float, nullable=True)
+    en_produccion = Column(Integer, nullable=False, default=0)
+    en_monitoreo = Column(Integer, nullable=False, default=0)
+    previo_secado = Column(Integer, nullable=False, default=0)
+    sin_recomendacion = Column(Integer, nullable=False, default=0)
+
+    # A date window of one user (optionally one corral) is a single range scan
+    __table_args__ = (
+        Index("idx_corral_rollups_user_fecha_grupo", "user_id", "fecha_snapshot", "nombre_grupo"),
+    )
+
+
+class SearchTermModel(Base):
+    """SQLAlchemy ORM model for the distinct searchable values of each snapshot."""
+
+    __tablename__ = "cow_search_terms"
+
+    global_hato_id = Column(Integer, ForeignKey("global_hato.id", ondelete="CASCADE"), primary_key=True)
+    kind = Column(String, primary_key=True)
+    term = Column(String, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    fecha_snapshot = Column(Date, nullable=False)
+    search_key = Column(String, nullable=False)  # lower(term)
+
+    # Prefix lookups are one index range scan per user, already in result order
+    # (keys compared by code point, see collation.py). Substring search also uses
+    # a trigram GIN index (pg_trgm), created by migration 007 since create_all
+    # cannot enable the extension.
+    __table_args__ = (
+        Index("idx_cow_search_terms_user_key", user_id, code_point(search_key), kind),
+    )
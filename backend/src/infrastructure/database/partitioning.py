@@ -0,0 +1,199 @@
+"""Declarative range partitioning of the cows table by global_hato_id (PostgreSQL).
+
+Every cow read filters by global_hato_id, so each query is pruned to a single
+partition. Snapshot ids grow with upload time, so partitions also hold
+contiguous upload periods: dropping old data is a DETACH + DROP of whole
+partitions instead of a huge DELETE, and vacuum only has to look at the
+partitions that receive writes.
+
+Layout:
+- cows                    partitioned table, PRIMARY KEY (id, global_hato_id)
+- cows_p<lower>           FOR VALUES FROM (lower) TO (lower + span)
+- cows_default            DEFAULT partition, safety net for ids past the last range
+
+The ORM model is unchanged (id is still unique, it comes from the same sequence).
+PostgreSQL cannot enforce a foreign key to a partitioned table unless it includes
+the partition key, so datasets.cow_id / predictions.cow_id lose their
+database-level foreign keys when the table is converted.
+"""
+import os
+import re
+import logging
+from typing import List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+# Snapshots per partition and partitions created ahead of the newest snapshot
+PARTITION_SPAN = int(os.getenv("COWS_PARTITION_SPAN", "1000"))
+PARTITIONS_AHEAD = int(os.getenv("COWS_PARTITIONS_AHEAD", "2"))
+
+DEFAULT_PARTITION = "cows_default"
+_BOUND_RE = re.compile(r"FROM \((-?\d+)\) TO \((-?\d+)\)")
+
+
+class CowsPartitionManager:
+    """Creates, lists and drops range partitions of the cows table."""
+
+    def __init__(self, span: int = PARTITION_SPAN, ahead: int = PARTITIONS_AHEAD):
+        self.span = span
+        self.ahead = ahead
+
+    def is_partitioned(self, conn: Connection) -> bool:
+        """Check whether cows is already a partitioned table."""
+        relkind = conn.execute(text(
+            "SELECT c.relkind FROM pg_class c "
+            "WHERE c.oid = to_regclass('cows')"
+        )).scalar()
+        return relkind == "p"
+
+    def list_partitions(self, conn: Connection) -> List[Tuple[str, Optional[int], Optional[int]]]:
+        """List partitions as (name, lower, upper); bounds are None for the default partition."""
+        rows = conn.execute(text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits i "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass('cows') "
+            "ORDER BY child.relname"
+        )).all()
+
+        partitions = []
+        for name, bound in rows:
+            match = _BOUND_RE.search(bound or "")
+            if match:
+                partitions.append((name, int(match.group(1)), int(match.group(2))))
+            else:
+                partitions.append((name, None, None))
+        partitions.sort(key=lambda p: (p[1] is None, p[1] or 0))
+        return partitions
+
+    def convert_to_partitioned(self, conn: Connection) -> bool:
+        """
+        Replace a plain cows table with a partitioned one, copying all rows.
+
+        Cows without a snapshot (global_hato_id IS NULL) cannot be routed to a
+        partition; they are kept in cows_orphaned instead of being deleted.
+
+        Args:
+            conn: Connection inside a transaction
+
+        Returns:
+            True if converted, False if cows was already partitioned
+        """
+        if self.is_partitioned(conn):
+            return False
+
+        sequence = conn.execute(text("SELECT pg_get_serial_sequence('cows', 'id')")).scalar()
+
+        # Foreign keys to cows(id) cannot point at a partitioned table
+        conn.execute(text("ALTER TABLE datasets DROP CONSTRAINT IF EXISTS datasets_cow_id_fkey"))
+        conn.execute(text("ALTER TABLE predictions DROP CONSTRAINT IF EXISTS predictions_cow_id_fkey"))
+
+        # Move the old table out of the way (index names are schema-wide)
+        conn.execute(text("ALTER TABLE cows RENAME TO cows_unpartitioned"))
+        conn.execute(text("ALTER TABLE cows_unpartitioned RENAME CONSTRAINT cows_pkey TO cows_unpartitioned_pkey"))
+        conn.execute(text("ALTER INDEX IF EXISTS idx_cows_global_hato_id RENAME TO idx_cows_unpartitioned_global_hato_id"))
+
+        conn.execute(text(
+            "CREATE TABLE cows (LIKE cows_unpartitioned INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (global_hato_id)"
+        ))
+        conn.execute(text("ALTER TABLE cows ALTER COLUMN global_hato_id SET NOT NULL"))
+        conn.execute(text("ALTER TABLE cows ADD PRIMARY KEY (id, global_hato_id)"))
+        conn.execute(text(
+            "ALTER TABLE cows ADD FOREIGN KEY (global_hato_id) REFERENCES global_hato(id) ON DELETE CASCADE"
+        ))
+        conn.execute(text("CREATE INDEX idx_cows_global_hato_id ON cows (global_hato_id)"))
+        if sequence:
+            conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY cows.id"))
+
+        conn.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF cows DEFAULT"))
+        self.ensure_partitions(conn)
+
+        conn.execute(text(
+            "INSERT INTO cows SELECT * FROM cows_unpartitioned WHERE global_hato_id IS NOT NULL"
+        ))
+        orphans = conn.execute(text(
+            "SELECT count(*) FROM cows_unpartitioned WHERE global_hato_id IS NULL"
+        )).scalar()
+        if orphans:
+            conn.execute(text("DELETE FROM cows_unpartitioned WHERE global_hato_id IS NOT NULL"))
+            conn.execute(text("ALTER TABLE cows_unpartitioned RENAME TO cows_orphaned"))
+            logger.warning("Kept %s cows without a snapshot in cows_orphaned", orphans)
+        else:
+            conn.execute(text("DROP TABLE cows_unpartitioned"))
+        return True
+
+    def ensure_partitions(self, conn: Connection) -> List[str]:
+        """
+        Create range partitions up to `ahead` spans past the newest snapshot.
+
+        Rows that already landed in the default partition for a new range are
+        moved into it.
+
+        Returns:
+            Names of the partitions created
+        """
+        max_id = conn.execute(text("SELECT COALESCE(max(id), 0) FROM global_hato")).scalar()
+        target = (max_id // self.span + 1 + self.ahead) * self.span
+
+        ranges = [(lower, upper) for _, lower, upper in self.list_partitions(conn) if lower is not None]
+        next_lower = max((upper for _, upper in ranges), default=0)
+
+        created = []
+        while next_lower < target:
+            created.append(self._create_partition(conn, next_lower, next_lower + self.span))
+            next_lower += self.span
+        return created
+
+    def _create_partition(self, conn: Connection, lower: int, upper: int) -> str:
+        name = f"cows_p{lower}"
+        has_default = conn.execute(text("SELECT to_regclass(:name)"), {"name": DEFAULT_PARTITION}).scalar()
+        stray_rows = has_default and conn.execute(text(
+            f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+            "WHERE global_hato_id >= :lower AND global_hato_id < :upper)"
+        ), {"lower": lower, "upper": upper}).scalar()
+
+        if not stray_rows:
+            conn.execute(text(
+                f"CREATE TABLE {name} PARTITION OF cows FOR VALUES FROM ({lower}) TO ({upper})"
+            ))
+            return name
+
+        # New range overlaps rows in the default partition: move them across
+        conn.execute(text(f"ALTER TABLE cows DETACH PARTITION {DEFAULT_PARTITION}"))
+        conn.execute(text(f"CREATE TABLE {name} PARTITION OF cows FOR VALUES FROM ({lower}) TO ({upper})"))
+        params = {"lower": lower, "upper": upper}
+        conn.execute(text(
+            f"INSERT INTO cows SELECT * FROM {DEFAULT_PARTITION} "
+            "WHERE global_hato_id >= :lower AND global_hato_id < :upper"
+        ), params)
+        conn.execute(text(
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE global_hato_id >= :lower AND global_hato_id < :upper"
+        ), params)
+        conn.execute(text(f"ALTER TABLE cows ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+        return name
+
+    def drop_partitions_before(self, conn: Connection, snapshot_id: int) -> List[str]:
+        """
+        Drop every partition whose whole range is below `snapshot_id`, with its snapshots.
+
+        Args:
+            conn: Connection inside a transaction
+            snapshot_id: Oldest snapshot id to keep
+
+        Returns:
+            Names of the dropped partitions
+        """
+        dropped = []
+        for name, lower, upper in self.list_partitions(conn):
+            if lower is None or upper > snapshot_id:
+                continue
+            conn.execute(text(f"ALTER TABLE cows DETACH PARTITION {name}"))
+            conn.execute(text(f"DROP TABLE {name}"))
+            conn.execute(text(
+                "DELETE FROM global_hato WHERE id >= :lower AND id < :upper"
+            ), {"lower": lower, "upper": upper})
+            dropped.append(name)
+        return dropped
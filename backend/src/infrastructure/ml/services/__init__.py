@@ -1 +1,2 @@
-from .prediction_service import PredictionService
+from .prediction_service import PredictionService, FEATURE_FIELDS, feature_vector
+from .inference_client import InferenceClient, InferenceUnavailableError
@@ -0,0 +1,65 @@
+"""Client of the shared inference server (see inference_server.py)."""
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from typing import List, Optional, Sequence
+
+
+class InferenceUnavailableError(ConnectionError):
+    """The inference server could not be reached or did not answer in time."""
+
+
+class InferenceClient:
+    """Sends feature rows to the inference server over its Unix socket (one connection per thread)."""
+
+    def __init__(self, socket_path: str, authkey: bytes, timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.authkey = authkey
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def predict_batch(self, features: Sequence[Sequence[float]]) -> List[Optional[int]]:
+        """
+        Predict the categories of feature rows on the server.
+
+        Args:
+            features: Feature rows in FEATURE_FIELDS order, without missing values
+
+        Returns:
+            Predicted category per row (None where prediction failed)
+
+        Raises:
+            InferenceUnavailableError: If the server cannot be reached, rejects
+                the authkey, closes the connection or does not answer in time
+        """
+        try:
+            connection = self._connection()
+            connection.send(("predict", [list(row) for row in features]))
+            if not connection.poll(self.timeout):
+                raise TimeoutError(f"No answer within {self.timeout}s")
+            status, payload = connection.recv()
+        except (OSError, EOFError, AuthenticationError) as e:
+            # TimeoutError is an OSError too; the connection may hold a late answer, drop it
+            self.close()
+            raise InferenceUnavailableError(f"Inference server at {self.socket_path} unavailable: {e}") from e
+
+        if status != "ok":
+            raise InferenceUnavailableError(f"Inference server error: {payload}")
+        return payload
+
+    def close(self) -> None:
+        """Close this thread's connection (the next call reconnects)."""
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except OSError:
+                pass
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = Client(self.socket_path, family="AF_UNIX", authkey=self.authkey)
+            self._local.connection = connection
+        return connection
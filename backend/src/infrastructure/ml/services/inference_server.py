@@ -0,0 +1,177 @@
+"""Local inference server: one model copy shared by every worker process.
+
+gunicorn workers and Celery tasks send feature rows over a Unix socket
+(multiprocessing.connection, one persistent connection per client thread).
+Requests that arrive within a short window are merged into one model call, so
+concurrent uploads share a batch instead of queueing for the model one by one.
+
+Requests are pickled, so every connection must first prove the shared authkey
+(the multiprocessing HMAC challenge, both ways) before anything is unpickled,
+and the socket is created readable and writable by the owner and group only.
+
+Each connection is served by its own thread, which authenticates the client,
+hands its rows to a single batcher thread and waits for its slice of the batch
+result.
+"""
+import os
+import queue
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener, answer_challenge, deliver_challenge
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceServer:
+    """Serves predict_batch of a prediction service to local clients, micro-batching their requests."""
+
+    def __init__(
+        self,
+        prediction_service,
+        socket_path: str,
+        authkey: bytes,
+        batch_window: float = 0.005,
+        max_batch_rows: int = 10000
+    ):
+        """
+        Args:
+            prediction_service: In-process service with predict_batch (holds the model)
+            socket_path: Unix socket to listen on
+            authkey: Shared secret clients must prove before sending requests
+            batch_window: Seconds to wait for more requests after the first one of a batch
+            max_batch_rows: Stop gathering once a batch has this many rows
+        """
+        self.prediction_service = prediction_service
+        self.socket_path = socket_path
+        self.authkey = authkey
+        self.batch_window = batch_window
+        self.max_batch_rows = max_batch_rows
+        self._requests: "queue.Queue[Optional[Tuple[list, Future]]]" = queue.Queue()
+        self._listener: Optional[Listener] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Bind the socket and start the batcher thread."""
+        # A previous server that did not shut down cleanly leaves its socket file behind
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        # Only the service user and its group may connect; the socket is created with
+        # these permissions (umask) instead of being opened up until a chmod
+        previous_umask = os.umask(0o117)
+        try:
+            # The authkey challenge runs in the connection thread, so a client that
+            # stalls mid-handshake cannot block accept()
+            self._listener = Listener(self.socket_path, family="AF_UNIX")
+        finally:
+            os.umask(previous_umask)
+        threading.Thread(target=self._batch_loop, name="inference-batcher", daemon=True).start()
+        logger.info("Inference server listening", extra={"socket": self.socket_path})
+
+    def serve_forever(self) -> None:
+        """Accept connections until stop() is called."""
+        if self._listener is None:
+            self.start()
+        while not self._stopped.is_set():
+            try:
+                connection = self._listener.accept()
+            except OSError:
+                if self._stopped.is_set():
+                    break
+                raise
+            if self._stopped.is_set():
+                connection.close()
+                break
+            threading.Thread(target=self._serve_connection, args=(connection,), daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop accepting connections and stop the batcher (removes the socket file)."""
+        self._stopped.set()
+        self._requests.put(None)
+        if self._listener is not None:
+            # Wake up a blocked accept() before closing the socket
+            try:
+                Client(self.socket_path, family="AF_UNIX").close()
+            except OSError:
+                pass
+            self._listener.close()
+
+    def predict(self, rows: list) -> List[Optional[int]]:
+        """Queue rows for the next batch and wait for their predictions."""
+        future: Future = Future()
+        self._requests.put((rows, future))
+        return future.result()
+
+    def _serve_connection(self, connection) -> None:
+        try:
+            # Same mutual challenge as Listener(authkey=...).accept()
+            deliver_challenge(connection, self.authkey)
+            answer_challenge(connection, self.authkey)
+        except (AuthenticationError, OSError, EOFError) as e:
+            logger.warning("Rejected inference client", extra={"error": str(e)})
+            connection.close()
+            return
+
+        try:
+            while True:
+                try:
+                    command, rows = connection.recv()
+                except EOFError:
+                    break
+                if command != "predict":
+                    connection.send(("error", f"Unknown command: {command}"))
+                    continue
+                try:
+                    connection.send(("ok", self.predict(rows)))
+                except Exception as e:
+                    logger.exception("Inference request failed")
+                    connection.send(("error", str(e)))
+        except OSError:
+            # Client went away mid-request
+            pass
+        finally:
+            connection.close()
+
+    def _batch_loop(self) -> None:
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            batch = [request]
+            rows = len(request[0])
+
+            # Gather the requests arriving within the window
+            deadline = time.monotonic() + self.batch_window
+            while rows < self.max_batch_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._requests.put(None)
+                    break
+                batch.append(request)
+                rows += len(request[0])
+
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: List[Tuple[list, Future]]) -> None:
+        features = [row for rows, _ in batch for row in rows]
+        try:
+            predictions = self.prediction_service.predict_batch(features)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        logger.debug("Inference batch", extra={"requests": len(batch), "rows": len(features)})
+        offset = 0
+        for rows, future in batch:
+            future.set_result(predictions[offset:offset + len(rows)])
+            offset += len(rows)
@@ -1,26 +1,91 @@
 import os
 import logging
-import numpy as np
-from typing import List, Dict, Any, Optional
-import joblib
+import threading
+import time
+from typing import List, Dict, Any, Optional, Sequence
+from infrastructure.ml.services.inference_client import InferenceClient, InferenceUnavailableError
+from infrastructure.monitoring import MODEL_INFERENCE_SECONDS
+from utils.logging_config import should_sample
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-try:
-    import tensorflow as tf
-except ImportError:
-    logger.warning("TensorFlow not installed. Keras models will be disabled.")
-    tf = None
+# Heavy ML dependencies (numpy, joblib, TensorFlow, xgboost via the pickle) are
+# imported on first prediction, not at import time, to keep worker startup cheap.
+
+# Model inputs, in the order the model expects them (from inspection):
+# Nº Lactación, Días en ordeño, Número de inseminaciones, Días preñada, Días para
+# el parto, Producción de leche ayer, Producción media diaria últimos 7 días,
+# Producción TOTAL en lactación
+FEATURE_FIELDS = [
+    'numero_lactacion',
+    'dias_ordeno',
+    'numero_inseminaciones',
+    'dias_prenada',
+    'dias_para_parto',
+    'produccion_leche_ayer',
+    'produccion_media_7dias',
+    'produccion_total_lactacion',
+]
+
+
+def feature_vector(cow_data: Dict[str, Any]) -> List[float]:
+    """Model input row for a cow (missing values count as 0)."""
+    return [float(cow_data.get(field, 0) or 0) for field in FEATURE_FIELDS]
+
 
 class PredictionService:
-    """Service for making predictions using a loaded Keras or Pickle model."""
+    """
+    Service for making predictions using a loaded Keras or Pickle model.
+
+    With an inference socket, predictions are sent to the shared inference
+    server (scripts/inference_server.py) and the model is only loaded in this
+    process if the server is unreachable; the server is retried after
+    `retry_after` seconds.
+    """
 
-    def __init__(self, model_dir: str):
+    def __init__(
+        self,
+        model_dir: str,
+        inference_socket: Optional[str] = None,
+        authkey: Optional[str] = None,
+        timeout: float = 30.0,
+        retry_after: float = 30.0
+    ):
         self.model_dir = model_dir
         self.model = None
         self.model_type = None  # 'keras' or 'sklearn'
-        self._load_model()
+        self._model_loaded = False
+        self._load_lock = threading.Lock()
+        self.client = None
+        if inference_socket and not authkey:
+            # The server rejects unauthenticated clients; predict in process instead of failing startup
+            logger.warning(
+                "INFERENCE_SOCKET is set without INFERENCE_AUTHKEY; predicting in process",
+                extra={"socket": inference_socket}
+            )
+        elif inference_socket:
+            self.client = InferenceClient(inference_socket, authkey.encode(), timeout=timeout)
+        self.retry_after = retry_after
+        self._remote_retry_at = 0.0
+
+    def load_model(self) -> bool:
+        """Load the model in this process now instead of on first use; returns whether one was found."""
+        self._ensure_model_loaded()
+        return self.model is not None
+
+    def is_available(self) -> bool:
+        """Whether predictions are being served: by the inference server, or by a model loaded in this process."""
+        return self._use_server() or self.model is not None
+
+    def _ensure_model_loaded(self):
+        """Load the model on first use (thread-safe)."""
+        if self._model_loaded:
+            return
+        with self._load_lock:
+            if not self._model_loaded:
+                self._load_model()
+                self._model_loaded = True
 
     def _load_model(self):
         """Loads the first .keras or .pkl model found in the model directory."""
@@ -32,7 +97,14 @@ class PredictionService:
         model_files = os.listdir(self.model_dir)
         keras_files = [f for f in model_files if f.endswith('.keras')]
         pkl_files = [f for f in model_files if f.endswith('.pkl')]
-        
+
+        tf = None
+        if keras_files:
+            try:
+                import tensorflow as tf
+            except ImportError:
+                logger.warning("TensorFlow not installed. Keras models will be disabled.")
+
         if keras_files and tf:
             model_path = os.path.join(self.model_dir, keras_files[0])
             try:
@@ -46,6 +118,8 @@ class PredictionService:
         if pkl_files:
             model_path = os.path.join(self.model_dir, pkl_files[0])
             try:
+                import joblib
+
                 self.model = joblib.load(model_path)
                 self.model_type = 'sklearn'
                 logger.info(f"Successfully loaded Pickle model from {model_path}")
@@ -66,57 +140,107 @@ class PredictionService:
         Returns:
             Predicted category (1: En Producción, 0: En Monitoreo, 2: Previo a Secado) or None if prediction fails.
         """
+        if self._use_server():
+            return self.predict_batch([feature_vector(cow_data)])[0]
+
+        self._ensure_model_loaded()
         if not self.model:
             return None
 
+        import numpy as np
+
         try:
-            # Extract features expected by the model
-            # Note: This needs to match the model's expected input shape and feature order.
-            # Assuming a simple array input for now based on available fields.
-            
-            # Extract features expected by the model
-            # Feature order from inspection:
-            # 1. Nº Lactación
-            # 2. Días en ordeño
-            # 3. Número de inseminaciones
-            # 4. Días preñada
-            # 5. Días para el parto
-            # 6. Producción de leche ayer
-            # 7. Producción media diaria últimos 7 días
-            # 8. Producción TOTAL en lactación
-            
-            features_list = [
-                float(cow_data.get('numero_lactacion', 0) or 0),
-                float(cow_data.get('dias_ordeno', 0) or 0),
-                float(cow_data.get('numero_inseminaciones', 0) or 0),
-                float(cow_data.get('dias_prenada', 0) or 0),
-                float(cow_data.get('dias_para_parto', 0) or 0),
-                float(cow_data.get('produccion_leche_ayer', 0) or 0),
-                float(cow_data.get('produccion_media_7dias', 0) or 0),
-                float(cow_data.get('produccion_total_lactacion', 0) or 0)
-            ]
-            
-            # Simple feature vector
-            features = np.array([features_list])
-            
-            logger.info(f"Predicting for cow with features: {features_list}")
-
-            # Make prediction based on model type
-            if self.model_type == 'keras':
-                prediction = self.model.predict(features, verbose=0)
-                predicted_class = np.argmax(prediction, axis=1)[0]
-                logger.info(f"Keras prediction: {predicted_class}")
-                return int(predicted_class)
-                
-            elif self.model_type == 'sklearn':
-                prediction = self.model.predict(features)
-                logger.info(f"Sklearn prediction raw: {prediction}")
-                return int(prediction[0])
-            
-            return None
-            
+            features_list = feature_vector(cow_data)
+            predicted_class = self._predict_matrix(np.array([features_list]))[0]
+            if predicted_class is not None:
+                self._log_sampled_prediction(features_list, predicted_class)
+            return predicted_class
+
         except Exception as e:
-            logger.error(f"Error making prediction for cow {cow_data.get('numero_animal')}: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            # Failures are summarized per batch by the caller; keep only a sample of tracebacks
+            if should_sample():
+                logger.debug(
+                    "Prediction failed",
+                    extra={"numero_animal": cow_data.get('numero_animal'), "error": str(e)},
+                    exc_info=True
+                )
             return None
+
+    def predict_cows(self, cows_data: Sequence[Dict[str, Any]]) -> List[Optional[int]]:
+        """Predicts the categories of parsed cow rows with one model call (see predict_batch)."""
+        return self.predict_batch([feature_vector(cow_data) for cow_data in cows_data])
+
+    def predict_batch(self, features: Sequence[Sequence[Optional[float]]]) -> List[Optional[int]]:
+        """
+        Predicts the categories of many cows with one model call.
+
+        Args:
+            features: Feature rows in FEATURE_FIELDS order (None counts as 0)
+
+        Returns:
+            Predicted category per row, None where prediction fails. If the
+            batch call fails, rows are retried one by one.
+        """
+        if len(features) == 0:
+            return []
+        rows = [[0.0 if value is None else float(value) for value in row] for row in features]
+
+        if self._use_server():
+            try:
+                return self.client.predict_batch(rows)
+            except InferenceUnavailableError as e:
+                self._remote_retry_at = time.monotonic() + self.retry_after
+                logger.warning(
+                    "Inference server unavailable, predicting in process",
+                    extra={"rows": len(rows), "error": str(e), "retry_after": self.retry_after}
+                )
+
+        self._ensure_model_loaded()
+        if not self.model:
+            return [None] * len(rows)
+
+        import numpy as np
+
+        matrix = np.array(rows, dtype=np.float32)
+        try:
+            return self._predict_matrix(matrix)
+        except Exception as e:
+            logger.warning("Batch prediction failed, retrying row by row", extra={"rows": len(matrix), "error": str(e)})
+
+        predictions = []
+        for row in matrix:
+            try:
+                predictions.append(self._predict_matrix(row.reshape(1, -1))[0])
+            except Exception:
+                predictions.append(None)
+        return predictions
+
+    def _use_server(self) -> bool:
+        return self.client is not None and time.monotonic() >= self._remote_retry_at
+
+    def _predict_matrix(self, features) -> List[Optional[int]]:
+        """Run the model on a (rows, features) array."""
+        import numpy as np
+
+        # Make prediction based on model type
+        if self.model_type == 'keras':
+            start = time.perf_counter()
+            prediction = self.model.predict(features, verbose=0)
+            MODEL_INFERENCE_SECONDS.labels(model_type='keras').observe(time.perf_counter() - start)
+            return [int(value) for value in np.argmax(prediction, axis=1)]
+
+        elif self.model_type == 'sklearn':
+            start = time.perf_counter()
+            prediction = self.model.predict(features)
+            MODEL_INFERENCE_SECONDS.labels(model_type='sklearn').observe(time.perf_counter() - start)
+            return [int(value) for value in prediction]
+
+        return [None] * len(features)
+
+    def _log_sampled_prediction(self, features: List[float], predicted_class: int) -> None:
+        """Emit a sampled per-row debug record (never at INFO on the hot path)."""
+        if logger.isEnabledFor(logging.DEBUG) and should_sample():
+            logger.debug(
+                "Cow prediction",
+                extra={"features": features, "prediction": predicted_class, "model_type": self.model_type}
+            )
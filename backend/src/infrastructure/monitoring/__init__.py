@@ -0,0 +1,75 @@
+from .metrics import (
+    REQUEST_LATENCY,
+    INGEST_STAGE_SECONDS,
+    INGEST_ROWS,
+    INGEST_ROWS_PER_SECOND,
+    INGEST_STAGE_PEAK_BYTES,
+    INGEST_STAGE_BYTES_PER_1K_ROWS,
+    MODEL_INFERENCE_SECONDS,
+    DB_QUERIES_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    DB_POOL_CONNECTIONS,
+    CACHE_LOOKUPS,
+    SNAPSHOT_ROWS_STORED,
+    SNAPSHOT_ROWS_SAVED,
+    observe_ingest_stage,
+    observe_ingest_stage_memory,
+    ingest_stage,
+    record_cache_lookup,
+    observe_snapshot_storage,
+    update_db_pool_metrics,
+    render_metrics,
+)
+from .sql_profiler import (
+    QueryStats,
+    install_sql_instrumentation,
+    start_query_stats,
+    stop_query_stats,
+    track_queries,
+    assert_max_queries,
+)
+from .memory_profiler import (
+    MemoryTracker,
+    current_memory_tracker,
+    start_memory_tracking,
+    stop_memory_tracking,
+    track_memory,
+)
+from .request_profiler import RequestProfiler, request_profiler, PROFILE_MODES
+
+__all__ = [
+    "REQUEST_LATENCY",
+    "INGEST_STAGE_SECONDS",
+    "INGEST_ROWS",
+    "INGEST_ROWS_PER_SECOND",
+    "INGEST_STAGE_PEAK_BYTES",
+    "INGEST_STAGE_BYTES_PER_1K_ROWS",
+    "MODEL_INFERENCE_SECONDS",
+    "DB_QUERIES_PER_REQUEST",
+    "DB_TIME_PER_REQUEST",
+    "DB_POOL_CONNECTIONS",
+    "CACHE_LOOKUPS",
+    "SNAPSHOT_ROWS_STORED",
+    "SNAPSHOT_ROWS_SAVED",
+    "observe_ingest_stage",
+    "observe_ingest_stage_memory",
+    "ingest_stage",
+    "record_cache_lookup",
+    "observe_snapshot_storage",
+    "update_db_pool_metrics",
+    "render_metrics",
+    "QueryStats",
+    "install_sql_instrumentation",
+    "start_query_stats",
+    "stop_query_stats",
+    "track_queries",
+    "assert_max_queries",
+    "MemoryTracker",
+    "current_memory_tracker",
+    "start_memory_tracking",
+    "stop_memory_tracking",
+    "track_memory",
+    "RequestProfiler",
+    "request_profiler",
+    "PROFILE_MODES",
+]
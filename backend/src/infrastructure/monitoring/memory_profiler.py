@@ -0,0 +1,131 @@
+"""tracemalloc-based memory instrumentation for the CSV ingest stages.
+
+When a MemoryTracker is active for the current context, every `ingest_stage`
+records the stage's peak memory (above what was allocated when it started), the
+memory it left allocated, and its top allocation sites. tracemalloc slows
+allocation-heavy code noticeably, so tracking is opt-in per upload.
+"""
+import os
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+# Stack depth recorded per allocation; 1 is enough to group by source line
+TRACEMALLOC_FRAMES = int(os.getenv("INGEST_MEMORY_FRAMES", "1"))
+TOP_ALLOCATION_SITES = int(os.getenv("INGEST_MEMORY_TOP_SITES", "5"))
+
+_current_tracker: ContextVar[Optional["MemoryTracker"]] = ContextVar("memory_tracker", default=None)
+
+
+class MemoryTracker:
+    """Memory statistics collected per ingest stage for one upload."""
+
+    def __init__(self, top_sites: int = TOP_ALLOCATION_SITES):
+        self.top_sites = top_sites
+        self.stages: List[Dict[str, Any]] = []
+        self.peak_bytes = 0
+        self._started_tracing = False
+        self._baseline = 0
+
+    def start(self) -> None:
+        """Start tracing allocations (unless something else already does)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def stop(self) -> None:
+        """Stop tracing if this tracker started it."""
+        if tracemalloc.is_tracing():
+            self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1] - self._baseline)
+            if self._started_tracing:
+                tracemalloc.stop()
+        self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0):
+        """Record peak memory and top allocation sites of one stage."""
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        # The overall peak must survive the per-stage reset below
+        self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1] - self._baseline)
+        before = tracemalloc.take_snapshot()
+        start_current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            self.peak_bytes = max(self.peak_bytes, peak - self._baseline)
+            self.stages.append({
+                "stage": name,
+                "rows": rows,
+                "peak_bytes": max(peak - start_current, 0),
+                "retained_bytes": current - start_current,
+                "top_allocations": self._top_allocations(before, after),
+            })
+
+    def _top_allocations(self, before, after) -> List[Dict[str, Any]]:
+        """Source lines that allocated the most memory during a stage."""
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+        sites = []
+        for stat in diff:
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            sites.append({
+                "site": f"{frame.filename}:{frame.lineno}",
+                "size_bytes": stat.size_diff,
+                "count": stat.count_diff,
+            })
+            if len(sites) >= self.top_sites:
+                break
+        return sites
+
+    def report(self) -> Dict[str, Any]:
+        """Summary suitable for the request result."""
+        stages = []
+        for stage in self.stages:
+            entry = dict(stage)
+            if stage["rows"]:
+                entry["peak_bytes_per_1k_rows"] = round(stage["peak_bytes"] * 1000 / stage["rows"])
+            stages.append(entry)
+        return {"peak_bytes": self.peak_bytes, "stages": stages}
+
+
+def current_memory_tracker() -> Optional[MemoryTracker]:
+    """Get the memory tracker active for the current context, if any."""
+    return _current_tracker.get()
+
+
+def start_memory_tracking() -> MemoryTracker:
+    """Start tracing ingest stage allocations for the current context (e.g., an upload)."""
+    tracker = MemoryTracker()
+    _current_tracker.set(tracker)
+    tracker.start()
+    return tracker
+
+
+def stop_memory_tracking() -> Optional[MemoryTracker]:
+    """Stop tracing and return the tracker of the current context (idempotent)."""
+    tracker = _current_tracker.get()
+    if tracker is not None:
+        tracker.stop()
+        _current_tracker.set(None)
+    return tracker
+
+
+@contextmanager
+def track_memory():
+    """Trace allocations of the ingest stages run inside the block."""
+    tracker = start_memory_tracking()
+    try:
+        yield tracker
+    finally:
+        stop_memory_tracking()
@@ -0,0 +1,185 @@
+"""Prometheus metrics shared by all layers.
+
+Works with several gunicorn workers: when PROMETHEUS_MULTIPROC_DIR is set each
+worker writes its samples to that directory and the /metrics endpoint merges
+them (see gunicorn.conf.py for dead-worker cleanup).
+"""
+import os
+import time
+from contextlib import contextmanager
+
+# The multiprocess directory must exist before the first metric is created
+if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    CONTENT_TYPE_LATEST,
+    generate_latest,
+    multiprocess,
+)
+from .memory_profiler import current_memory_tracker
+
+# Buckets tuned for API calls and for long-running CSV ingests
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+INFERENCE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+ROWS_PER_SECOND_BUCKETS = (100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+MIB = 1024 * 1024
+MEMORY_BUCKETS = tuple(n * MIB for n in (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2000))
+MEMORY_PER_1K_ROWS_BUCKETS = tuple(n * 1024 for n in (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384))
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by blueprint endpoint",
+    ["method", "endpoint", "status"],
+    buckets=REQUEST_BUCKETS,
+)
+
+INGEST_STAGE_SECONDS = Histogram(
+    "ingest_stage_duration_seconds",
+    "Duration of each CSV ingest stage (parse, clean, predict, persist)",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+
+INGEST_ROWS = Counter(
+    "ingest_rows_total",
+    "Rows processed by the CSV ingest pipeline",
+    ["stage"],
+)
+
+INGEST_ROWS_PER_SECOND = Histogram(
+    "ingest_rows_per_second",
+    "End-to-end ingest throughput per upload",
+    buckets=ROWS_PER_SECOND_BUCKETS,
+)
+
+INGEST_STAGE_PEAK_BYTES = Histogram(
+    "ingest_stage_peak_memory_bytes",
+    "Peak traced memory of each CSV ingest stage (only uploads with memory tracking)",
+    ["stage"],
+    buckets=MEMORY_BUCKETS,
+)
+
+INGEST_STAGE_BYTES_PER_1K_ROWS = Histogram(
+    "ingest_stage_peak_memory_bytes_per_1k_rows",
+    "Peak traced memory of each CSV ingest stage per 1000 rows",
+    ["stage"],
+    buckets=MEMORY_PER_1K_ROWS_BUCKETS,
+)
+
+MODEL_INFERENCE_SECONDS = Histogram(
+    "model_inference_duration_seconds",
+    "Latency of a single model inference call",
+    ["model_type"],
+    buckets=INFERENCE_BUCKETS,
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "SQL statements issued per request",
+    ["endpoint"],
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 100, 250),
+)
+
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Total time spent in SQL statements per request",
+    ["endpoint"],
+    buckets=REQUEST_BUCKETS,
+)
+
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "SQLAlchemy connection pool state per worker (summed across live workers)",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Cache lookups by cache name and result (hit/miss)",
+    ["cache", "result"],
+)
+
+SNAPSHOT_ROWS_STORED = Counter(
+    "snapshot_rows_stored_total",
+    "Cow rows written per snapshot storage mode (full copy or delta)",
+    ["mode"],
+)
+
+SNAPSHOT_ROWS_SAVED = Counter(
+    "snapshot_delta_rows_saved_total",
+    "Cow rows not written because delta snapshots inherit them from their base",
+)
+
+
+def observe_ingest_stage(stage: str, seconds: float, rows: int = 0) -> None:
+    """Record the duration of an ingest stage and the rows it handled."""
+    INGEST_STAGE_SECONDS.labels(stage=stage).observe(seconds)
+    if rows:
+        INGEST_ROWS.labels(stage=stage).inc(rows)
+
+
+def observe_ingest_stage_memory(stage: str, peak_bytes: int, rows: int = 0) -> None:
+    """Record the peak memory of an ingest stage, absolute and per 1000 rows."""
+    INGEST_STAGE_PEAK_BYTES.labels(stage=stage).observe(peak_bytes)
+    if rows:
+        INGEST_STAGE_BYTES_PER_1K_ROWS.labels(stage=stage).observe(peak_bytes * 1000 / rows)
+
+
+@contextmanager
+def ingest_stage(stage: str, rows: int = 0):
+    """Time an ingest stage, count the rows it handled and, if tracked, its memory."""
+    tracker = current_memory_tracker()
+    start = time.perf_counter()
+    try:
+        if tracker is None:
+            yield
+        else:
+            with tracker.stage(stage, rows):
+                yield
+    finally:
+        observe_ingest_stage(stage, time.perf_counter() - start, rows)
+        if tracker is not None and tracker.stages and tracker.stages[-1]["stage"] == stage:
+            observe_ingest_stage_memory(stage, tracker.stages[-1]["peak_bytes"], rows)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache hit or miss; hit rate = hits / (hits + misses)."""
+    CACHE_LOOKUPS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def observe_snapshot_storage(mode: str, stored_rows: int, saved_rows: int = 0) -> None:
+    """Record the rows a snapshot wrote and, for deltas, the rows it inherited."""
+    SNAPSHOT_ROWS_STORED.labels(mode=mode).inc(stored_rows)
+    if saved_rows > 0:
+        SNAPSHOT_ROWS_SAVED.inc(saved_rows)
+
+
+def update_db_pool_metrics(engine) -> None:
+    """Publish the current connection pool state of an engine."""
+    pool = engine.pool
+    for state, reader in (
+        ("size", "size"),
+        ("checked_out", "checkedout"),
+        ("checked_in", "checkedin"),
+        ("overflow", "overflow"),
+    ):
+        if hasattr(pool, reader):
+            DB_POOL_CONNECTIONS.labels(state=state).set(getattr(pool, reader)())
+
+
+def render_metrics():
+    """Render all metrics in the Prometheus text format (merging workers if needed)."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
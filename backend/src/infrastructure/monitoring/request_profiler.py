@@ -0,0 +1,149 @@
+"""On-demand profiling of single requests.
+
+Two modes are supported:
+- "sample": a background thread samples the request thread's stack every few
+  milliseconds and writes collapsed stacks (.folded), ready for flamegraph.pl,
+  speedscope or inferno.
+- "cprofile": deterministic cProfile run saved as pstats (.prof), ready for
+  snakeviz or flameprof.
+
+Nothing here runs unless a request explicitly asks to be profiled.
+"""
+import os
+import sys
+import time
+import cProfile
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from werkzeug.utils import secure_filename
+
+PROFILE_MODES = {"sample": ".folded", "cprofile": ".prof"}
+
+
+class StackSampler:
+    """Sample the stack of one thread at a fixed interval into collapsed-stack counts."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write_folded(self, path: str) -> None:
+        """Write collapsed stacks ("frame;frame;frame count" per line)."""
+        with open(path, "w") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class RequestProfiler:
+    """Runs a callable under a profiler and keeps the most recent profiles on disk."""
+
+    def __init__(self):
+        self.profile_dir = os.getenv("PROFILE_DIR", "/tmp/vacas_profiles")
+        self.max_files = int(os.getenv("PROFILE_MAX_FILES", "50"))
+        self.sample_interval = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "5")) / 1000
+
+    def profile(self, mode: str, label: str, fn: Callable, *args, **kwargs) -> Tuple[Any, str]:
+        """
+        Run `fn` under the requested profiler and save the result.
+
+        Args:
+            mode: "sample" or "cprofile"
+            label: Short description used in the file name (e.g., endpoint and user)
+            fn: Callable to profile
+
+        Returns:
+            Tuple of (fn's return value, saved profile name)
+        """
+        if mode not in PROFILE_MODES:
+            mode = "sample"
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        name = secure_filename(f"{timestamp}_{label}") + PROFILE_MODES[mode]
+        path = os.path.join(self.profile_dir, name)
+
+        start = time.perf_counter()
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            try:
+                result = profiler.runcall(fn, *args, **kwargs)
+            finally:
+                profiler.dump_stats(path)
+        else:
+            sampler = StackSampler(threading.get_ident(), self.sample_interval)
+            sampler.start()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                sampler.stop()
+                sampler.write_folded(path)
+
+        self._prune()
+        return result, name
+
+    def list_profiles(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """List the most recent saved profiles, newest first."""
+        if not os.path.isdir(self.profile_dir):
+            return []
+
+        entries = []
+        for name in os.listdir(self.profile_dir):
+            extension = os.path.splitext(name)[1]
+            if extension not in PROFILE_MODES.values():
+                continue
+            stat = os.stat(os.path.join(self.profile_dir, name))
+            entries.append({
+                "name": name,
+                "mode": "cprofile" if extension == ".prof" else "sample",
+                "size": stat.st_size,
+                "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            })
+        entries.sort(key=lambda entry: entry["created_at"], reverse=True)
+        return entries[:limit]
+
+    def get_profile_path(self, name: str) -> Optional[str]:
+        """Get the absolute path of a saved profile, or None if it does not exist."""
+        safe_name = secure_filename(name)
+        if not safe_name or safe_name != name:
+            return None
+        path = os.path.join(self.profile_dir, safe_name)
+        return path if os.path.isfile(path) else None
+
+    def _prune(self):
+        """Keep only the newest `max_files` profiles."""
+        names = sorted(
+            (n for n in os.listdir(self.profile_dir) if os.path.splitext(n)[1] in PROFILE_MODES.values()),
+            reverse=True
+        )
+        for name in names[self.max_files:]:
+            try:
+                os.remove(os.path.join(self.profile_dir, name))
+            except OSError:
+                pass
+
+
+# Singleton instance
+request_profiler = RequestProfiler()
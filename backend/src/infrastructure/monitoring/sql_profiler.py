@@ -0,0 +1,125 @@
+"""Per-request SQL instrumentation based on SQLAlchemy engine events.
+
+Records query count, total DB time, the slowest statement and repeated
+statements (N+1 patterns) for the current request or tracked block.
+"""
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, List, Tuple
+from sqlalchemy import event
+from utils.constants import app_config
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("sql_query_stats", default=None)
+
+
+class QueryStats:
+    """SQL statistics collected for one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.statements = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record one executed statement."""
+        self.count += 1
+        self.total_time += duration
+        self.statements[statement] += 1
+        if duration > self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+    def repeated_statements(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Statements executed at least `threshold` times (default SQL_N_PLUS_ONE_THRESHOLD; likely N+1 patterns)."""
+        if threshold is None:
+            threshold = app_config.SQL_N_PLUS_ONE_THRESHOLD
+        return [(stmt, n) for stmt, n in self.statements.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        """Format as a Server-Timing header value."""
+        return f'db;dur={self.total_time * 1000:.1f};desc="{self.count} queries"'
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - start)
+
+
+def install_sql_instrumentation(engine) -> None:
+    """Attach the timing listeners to an engine (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def start_query_stats() -> QueryStats:
+    """Start collecting statistics for the current context (e.g., a request)."""
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def stop_query_stats() -> Optional[QueryStats]:
+    """Stop collecting and return the statistics of the current context."""
+    stats = _current_stats.get()
+    _current_stats.set(None)
+    return stats
+
+
+@contextmanager
+def track_queries():
+    """Collect SQL statistics for the enclosed block."""
+    previous = _current_stats.get()
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        if previous is not None:
+            # Keep the outer (request) totals complete
+            for statement, n in stats.statements.items():
+                previous.statements[statement] += n
+            previous.count += stats.count
+            previous.total_time += stats.total_time
+            if stats.slowest_time > previous.slowest_time:
+                previous.slowest_time = stats.slowest_time
+                previous.slowest_statement = stats.slowest_statement
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, allow_repeated: bool = False):
+    """
+    Test helper: fail if the enclosed block issues more than `max_queries` statements.
+
+    Args:
+        max_queries: Maximum number of statements allowed
+        allow_repeated: Do not fail on repeated-statement (N+1) patterns
+
+    Raises:
+        AssertionError: If the budget is exceeded or an N+1 pattern is found
+    """
+    with track_queries() as stats:
+        yield stats
+
+    if stats.count > max_queries:
+        statements = "\n".join(f"  {n}x {stmt}" for stmt, n in stats.statements.most_common())
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {stats.count}:\n{statements}"
+        )
+    repeated = stats.repeated_statements()
+    if repeated and not allow_repeated:
+        raise AssertionError(
+            "Repeated statements (possible N+1): "
+            + "; ".join(f"{n}x {stmt}" for stmt, n in repeated)
+        )
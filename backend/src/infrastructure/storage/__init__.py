@@ -1,9 +1,17 @@
+import os
 from .s3_storage_service import S3StorageService, s3_storage_service
 from .local_storage_service import LocalStorageService, local_storage_service
+from .snapshot_archive import SnapshotArchive, snapshot_archive
+
+# Backend used for Global Hato files ("local" or "s3")
+storage_service = s3_storage_service if os.getenv("STORAGE_BACKEND", "local").lower() == "s3" else local_storage_service
 
 __all__ = [
     "S3StorageService",
     "s3_storage_service",
     "LocalStorageService",
     "local_storage_service",
+    "storage_service",
+    "SnapshotArchive",
+    "snapshot_archive",
 ]
@@ -1,9 +1,19 @@
 """Local file storage service following Singleton pattern."""
 import os
-from typing import Optional
+import uuid
+import gzip
+import logging
+from typing import Optional, BinaryIO, Tuple
 from datetime import datetime
 from werkzeug.utils import secure_filename
-import shutil
+
+logger = logging.getLogger(__name__)
+
+# Suffix appended to files stored compressed at rest
+GZIP_SUFFIX = ".gz"
+
+# Chunk size used when streaming files into storage
+COPY_CHUNK_SIZE = 1024 * 1024
 
 
 class LocalStorageService:
@@ -23,43 +33,90 @@ class LocalStorageService:
         self.base_path = os.getenv("UPLOAD_BASE_PATH", "/app/uploads")
         self.global_hatos_path = os.path.join(self.base_path, "global_hatos")
 
+        # At-rest compression for new uploads ("gzip" or "none").
+        # Existing uncompressed files keep working: the format is detected by suffix.
+        self.compression = os.getenv("STORAGE_COMPRESSION", "gzip").lower()
+        self.compression_level = int(os.getenv("STORAGE_COMPRESSION_LEVEL", "6"))
+
         # Create directories if they don't exist
         os.makedirs(self.global_hatos_path, exist_ok=True)
 
-    def upload_file(
+    def upload_stream(
         self,
-        file_path: str,
+        stream: BinaryIO,
         original_filename: str,
-        subfolder: str = "global_hatos"
-    ) -> str:
+        subfolder: str = "global_hatos",
+        compress: bool = True
+    ) -> Tuple[str, int]:
         """
-        Upload a file to local storage.
+        Stream a file-like object into local storage.
 
         Args:
-            file_path: Path to temporary file to upload
+            stream: Readable binary stream (e.g., the request's upload stream)
             original_filename: Original filename
             subfolder: Subfolder within uploads (default: global_hatos)
+            compress: Apply at-rest compression if enabled (False for formats
+                that are already compressed, e.g., Parquet)
 
         Returns:
-            Relative path to stored file (e.g., "/uploads/global_hatos/timestamp_file.csv")
+            Tuple of (relative path to stored file, number of bytes read from stream).
+            The path looks like "/uploads/global_hatos/timestamp_file.csv", with a
+            ".gz" suffix when stored compressed.
         """
         # Secure filename
         safe_filename = secure_filename(original_filename)
 
-        # Generate timestamp-based filename
+        # Generate timestamp-based filename; the random part keeps concurrent uploads of the same file apart
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename_with_timestamp = f"{timestamp}_{safe_filename}"
+        filename_with_timestamp = f"{timestamp}_{uuid.uuid4().hex[:8]}_{safe_filename}"
+        gzip_enabled = compress and self.compression == "gzip"
+        if gzip_enabled:
+            filename_with_timestamp += GZIP_SUFFIX
 
         # Destination path
         dest_folder = os.path.join(self.base_path, subfolder)
         os.makedirs(dest_folder, exist_ok=True)
         dest_path = os.path.join(dest_folder, filename_with_timestamp)
 
-        # Copy file (shutil.copy2 preserves metadata)
-        shutil.copy2(file_path, dest_path)
+        # Stream in chunks (through the compressor if enabled) without loading it in memory
+        if gzip_enabled:
+            dst = gzip.open(dest_path, "wb", compresslevel=self.compression_level)
+        else:
+            dst = open(dest_path, "wb")
+
+        bytes_read = 0
+        with dst:
+            while True:
+                chunk = stream.read(COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                dst.write(chunk)
+                bytes_read += len(chunk)
 
         # Return relative path for database storage
-        return f"/uploads/{subfolder}/{filename_with_timestamp}"
+        return f"/uploads/{subfolder}/{filename_with_timestamp}", bytes_read
+
+    def upload_file(
+        self,
+        file_path: str,
+        original_filename: str,
+        subfolder: str = "global_hatos"
+    ) -> str:
+        """
+        Upload a file to local storage.
+
+        Args:
+            file_path: Path to temporary file to upload
+            original_filename: Original filename
+            subfolder: Subfolder within uploads (default: global_hatos)
+
+        Returns:
+            Relative path to stored file (e.g., "/uploads/global_hatos/timestamp_file.csv",
+            with a ".gz" suffix when stored compressed)
+        """
+        with open(file_path, "rb") as src:
+            blob_route, _ = self.upload_stream(src, original_filename, subfolder)
+        return blob_route
 
     def download_file(self, blob_route: str) -> Optional[str]:
         """
@@ -87,6 +144,74 @@ class LocalStorageService:
 
         return None
 
+    def is_compressed(self, blob_route: str) -> bool:
+        """
+        Check whether a stored file is gzip-compressed at rest.
+
+        Args:
+            blob_route: Relative path from database
+
+        Returns:
+            True if the stored bytes are gzip-compressed
+        """
+        return bool(blob_route) and blob_route.endswith(GZIP_SUFFIX)
+
+    def get_download_name(self, blob_route: str) -> str:
+        """
+        Get the filename clients should see, without the at-rest compression suffix.
+
+        Args:
+            blob_route: Relative path from database
+
+        Returns:
+            Original (uncompressed) filename
+        """
+        filename = os.path.basename(blob_route)
+        if self.is_compressed(blob_route):
+            filename = filename[:-len(GZIP_SUFFIX)]
+        return filename
+
+    def open_file(self, blob_route: str) -> Optional[BinaryIO]:
+        """
+        Open a stored file for streaming reads, decompressing transparently.
+
+        Suitable for passing straight to a CSV parser (e.g., pd.read_csv).
+
+        Args:
+            blob_route: Relative path from database
+
+        Returns:
+            Binary file object yielding the original bytes, or None if missing
+        """
+        absolute_path = self.download_file(blob_route)
+        if not absolute_path:
+            return None
+
+        if self.is_compressed(blob_route):
+            return gzip.open(absolute_path, "rb")
+        return open(absolute_path, "rb")
+
+    def get_internal_redirect_path(self, blob_route: str, prefix: str) -> Optional[str]:
+        """
+        Map a stored file to the internal nginx location that serves it.
+
+        Args:
+            blob_route: Relative path from database (e.g., "/uploads/global_hatos/file.csv")
+            prefix: Internal nginx location aliased to the uploads volume
+
+        Returns:
+            Internal URI (e.g., "/protected-uploads/global_hatos/file.csv") or None.
+            Compressed files map to their uncompressed name; nginx picks the ".gz"
+            sibling with gzip_static and inflates it for clients without gzip support.
+        """
+        if not blob_route or not blob_route.startswith("/uploads/"):
+            return None
+
+        relative_part = blob_route.replace("/uploads/", "", 1)
+        if self.is_compressed(blob_route):
+            relative_part = relative_part[:-len(GZIP_SUFFIX)]
+        return f"{prefix.rstrip('/')}/{relative_part}"
+
     def delete_file(self, blob_route: str) -> bool:
         """
         Delete a file from local storage.
@@ -104,7 +229,7 @@ class LocalStorageService:
                 os.remove(absolute_path)
                 return True
             except OSError as e:
-                print(f"Error deleting file {absolute_path}: {str(e)}")
+                logger.error("Error deleting file %s: %s", absolute_path, e)
                 return False
 
         return False
@@ -1,11 +1,38 @@
+"""S3 file storage service following Singleton pattern."""
 import os
-import boto3
-from typing import Optional
-from botocore.exceptions import ClientError
+import uuid
+import gzip
+import logging
+import threading
+from typing import Optional, BinaryIO, Tuple
+from datetime import datetime
+from werkzeug.utils import secure_filename
+
+logger = logging.getLogger(__name__)
+
+# Suffix of objects stored gzip-compressed at rest (same convention as local storage)
+GZIP_SUFFIX = ".gz"
+
+
+class _CountingReader:
+    """File-like wrapper that counts bytes as they are read, so the size is known after one pass."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._stream.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
 
 
 class S3StorageService:
-    """S3 Storage service following the Singleton pattern."""
+    """S3 Storage service following the Singleton pattern.
+
+    Exposes the same interface as LocalStorageService so Global Hato files can live
+    in S3 (STORAGE_BACKEND=s3). The boto3 client is only created on first use.
+    """
 
     _instance = None
 
@@ -16,100 +43,234 @@ class S3StorageService:
         return cls._instance
 
     def _initialize(self):
-        """Initialize S3 client."""
+        """Read S3 configuration. The client itself is created lazily."""
         self.bucket_name = os.getenv("S3_BUCKET_NAME", "vss-datasets")
         self.region = os.getenv("AWS_REGION", "us-east-1")
+        self.endpoint_url = os.getenv("S3_ENDPOINT_URL") or None
+
+        # Multipart upload tuning
+        self.part_size = int(os.getenv("S3_MULTIPART_PART_SIZE_MB", "8")) * 1024 * 1024
+        self.max_concurrency = int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))
+
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def s3_client(self):
+        """Get the boto3 S3 client, creating it on first access."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import boto3
 
-        # Initialize boto3 client
-        self.s3_client = boto3.client(
-            's3',
-            region_name=self.region,
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
+                    self._client = boto3.client(
+                        's3',
+                        region_name=self.region,
+                        endpoint_url=self.endpoint_url,
+                        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
+                    )
+        return self._client
+
+    def _transfer_config(self):
+        """Build the multipart transfer configuration."""
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=self.part_size,
+            multipart_chunksize=self.part_size,
+            max_concurrency=self.max_concurrency,
+            use_threads=self.max_concurrency > 1
         )
 
-    def upload_file(self, file_path: str, object_name: Optional[str] = None) -> str:
+    def _object_name(self, blob_route: str) -> Optional[str]:
+        """Extract the object key from a blob route ("s3://bucket/key")."""
+        prefix = f"s3://{self.bucket_name}/"
+        if not blob_route or not blob_route.startswith(prefix):
+            return None
+        return blob_route[len(prefix):]
+
+    def upload_stream(
+        self,
+        stream: BinaryIO,
+        original_filename: str,
+        subfolder: str = "global_hatos",
+        compress: bool = True
+    ) -> Tuple[str, int]:
         """
-        Upload a file to S3 bucket.
+        Stream a file-like object into S3 using concurrent multipart uploads.
 
         Args:
-            file_path: Path to file to upload
-            object_name: S3 object name. If not specified, file_path is used
+            stream: Readable binary stream (e.g., the request's upload stream)
+            original_filename: Original filename
+            subfolder: Key prefix within the bucket (default: global_hatos)
+            compress: Accepted for parity with local storage; objects are stored as-is
 
         Returns:
-            S3 object URL
+            Tuple of (blob route "s3://bucket/key", number of bytes uploaded)
         """
-        if object_name is None:
-            object_name = os.path.basename(file_path)
+        from botocore.exceptions import ClientError
 
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        object_name = f"{subfolder}/{timestamp}_{uuid.uuid4().hex[:8]}_{secure_filename(original_filename)}"
+
+        reader = _CountingReader(stream)
         try:
-            self.s3_client.upload_file(file_path, self.bucket_name, object_name)
-            return f"s3://{self.bucket_name}/{object_name}"
+            self.s3_client.upload_fileobj(
+                reader, self.bucket_name, object_name, Config=self._transfer_config()
+            )
         except ClientError as e:
             raise Exception(f"Failed to upload file to S3: {str(e)}")
 
-    def download_file(self, object_name: str, file_path: str) -> None:
+        return f"s3://{self.bucket_name}/{object_name}", reader.bytes_read
+
+    def upload_file(
+        self,
+        file_path: str,
+        original_filename: str,
+        subfolder: str = "global_hatos"
+    ) -> str:
         """
-        Download a file from S3 bucket.
+        Upload a file to S3 bucket.
 
         Args:
-            object_name: S3 object name
-            file_path: Path where file will be saved
+            file_path: Path to file to upload
+            original_filename: Original filename
+            subfolder: Key prefix within the bucket (default: global_hatos)
+
+        Returns:
+            Blob route of the stored object (e.g., "s3://bucket/global_hatos/timestamp_file.csv")
         """
-        try:
-            self.s3_client.download_file(self.bucket_name, object_name, file_path)
-        except ClientError as e:
-            raise Exception(f"Failed to download file from S3: {str(e)}")
+        with open(file_path, "rb") as f:
+            blob_route, _ = self.upload_stream(f, original_filename, subfolder)
+        return blob_route
 
-    def delete_file(self, object_name: str) -> None:
+    def download_file(self, blob_route: str) -> Optional[str]:
         """
-        Delete a file from S3 bucket.
+        Get absolute local path to a stored file.
+
+        Objects in S3 are never on local disk, so this always returns None;
+        use open_file to stream their contents.
 
         Args:
-            object_name: S3 object name
+            blob_route: Blob route from database
+
+        Returns:
+            None
         """
+        return None
+
+    def open_file(self, blob_route: str) -> Optional[BinaryIO]:
+        """
+        Open a stored object for streaming reads, decompressing transparently.
+
+        Args:
+            blob_route: Blob route from database
+
+        Returns:
+            Binary file object yielding the original bytes, or None if missing
+        """
+        from botocore.exceptions import ClientError
+
+        object_name = self._object_name(blob_route)
+        if not object_name:
+            return None
+
         try:
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=object_name)
-        except ClientError as e:
-            raise Exception(f"Failed to delete file from S3: {str(e)}")
+            body = self.s3_client.get_object(Bucket=self.bucket_name, Key=object_name)["Body"]
+        except ClientError:
+            return None
 
-    def generate_presigned_url(self, object_name: str, expiration: int = 3600) -> str:
+        if self.is_compressed(blob_route):
+            return gzip.GzipFile(fileobj=body, mode="rb")
+        return body
+
+    def is_compressed(self, blob_route: str) -> bool:
+        """Check whether a stored object is gzip-compressed at rest."""
+        return bool(blob_route) and blob_route.endswith(GZIP_SUFFIX)
+
+    def get_download_name(self, blob_route: str) -> str:
+        """Get the filename clients should see, without the compression suffix."""
+        filename = os.path.basename(blob_route)
+        if self.is_compressed(blob_route):
+            filename = filename[:-len(GZIP_SUFFIX)]
+        return filename
+
+    def get_internal_redirect_path(self, blob_route: str, prefix: str) -> Optional[str]:
+        """Objects in S3 cannot be served by the nginx internal location."""
+        return None
+
+    def delete_file(self, blob_route: str) -> bool:
         """
-        Generate a presigned URL for S3 object.
+        Delete an object from S3 bucket.
 
         Args:
-            object_name: S3 object name
-            expiration: Time in seconds for URL to remain valid
+            blob_route: Blob route from database
 
         Returns:
-            Presigned URL as string
+            True if deleted successfully, False otherwise
         """
+        from botocore.exceptions import ClientError
+
+        object_name = self._object_name(blob_route)
+        if not object_name:
+            return False
+
         try:
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': object_name},
-                ExpiresIn=expiration
-            )
-            return url
+            self.s3_client.delete_object(Bucket=self.bucket_name, Key=object_name)
+            return True
         except ClientError as e:
-            raise Exception(f"Failed to generate presigned URL: {str(e)}")
+            logger.error("Error deleting object %s: %s", object_name, e)
+            return False
 
-    def file_exists(self, object_name: str) -> bool:
+    def file_exists(self, blob_route: str) -> bool:
         """
-        Check if a file exists in S3 bucket.
+        Check if an object exists in S3 bucket.
 
         Args:
-            object_name: S3 object name
+            blob_route: Blob route from database
 
         Returns:
-            True if file exists, False otherwise
+            True if object exists, False otherwise
         """
+        from botocore.exceptions import ClientError
+
+        object_name = self._object_name(blob_route)
+        if not object_name:
+            return False
+
         try:
             self.s3_client.head_object(Bucket=self.bucket_name, Key=object_name)
             return True
         except ClientError:
             return False
 
+    def generate_presigned_url(self, blob_route: str, expiration: int = 3600) -> Optional[str]:
+        """
+        Generate a presigned URL for S3 object.
+
+        Args:
+            blob_route: Blob route from database
+            expiration: Time in seconds for URL to remain valid
+
+        Returns:
+            Presigned URL as string, or None for routes outside this bucket
+        """
+        from botocore.exceptions import ClientError
+
+        object_name = self._object_name(blob_route)
+        if not object_name:
+            return None
+
+        try:
+            return self.s3_client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': self.bucket_name, 'Key': object_name},
+                ExpiresIn=expiration
+            )
+        except ClientError as e:
+            raise Exception(f"Failed to generate presigned URL: {str(e)}")
+
 
-# Singleton instance
+# Singleton instance (no AWS connection is made until first use)
 s3_storage_service = S3StorageService()
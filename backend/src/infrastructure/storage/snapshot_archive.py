@@ -0,0 +1,255 @@
+"""Cold-tier storage of archived Global Hato snapshots as Parquet files.
+
+An archived snapshot's cows live in one compressed Parquet file in the storage
+backend instead of the cows table. Reads load the file into a DataFrame (a few
+recent ones are kept decoded in memory, since paginating re-reads the same
+snapshot) and apply the same filters, sorting and pagination as the SQL reads.
+
+pyarrow is imported lazily so the app still starts without it; only archiving
+and reading archived snapshots need it.
+"""
+import io
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+from domain.entities.cow import STORED_FEATURE_FIELDS
+from utils.constants import app_config
+
+ARCHIVE_SUBFOLDER = "archive"
+
+# Cow columns returned by reads, as in the SQL reads
+COW_COLUMNS = [
+    "id",
+    "global_hato_id",
+    "numero_animal",
+    "nombre_grupo",
+    "produccion_leche_ayer",
+    "produccion_media_7dias",
+    "estado_reproduccion",
+    "dias_ordeno",
+    "numero_seleccion",
+    "recomendacion",
+]
+# Columns stored per cow, in file order: everything in the cows table, so the
+# content hashes and the model inputs survive archiving
+ARCHIVE_COLUMNS = [*COW_COLUMNS, "content_hash", *STORED_FEATURE_FIELDS]
+_INTEGER_COLUMNS = ["id", "global_hato_id", "dias_ordeno", "recomendacion"]
+_FLOAT_COLUMNS = ["produccion_leche_ayer", "produccion_media_7dias", *STORED_FEATURE_FIELDS]
+_STRING_COLUMNS = ["numero_animal", "nombre_grupo", "estado_reproduccion", "numero_seleccion", "content_hash"]
+_SEARCH_COLUMNS = ["numero_animal", "nombre_grupo", "estado_reproduccion"]
+
+
+class SnapshotArchive:
+    """Writes, reads and queries archived snapshot files."""
+
+    def __init__(self, storage=None, compression: Optional[str] = None, cache_size: Optional[int] = None):
+        self._storage = storage
+        self.compression = compression or app_config.ARCHIVE_PARQUET_COMPRESSION
+        self.cache_size = app_config.ARCHIVE_CACHE_SIZE if cache_size is None else cache_size
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def storage(self):
+        """Storage backend (resolved lazily, the storage package imports this module)."""
+        if self._storage is None:
+            from infrastructure.storage import storage_service
+            self._storage = storage_service
+        return self._storage
+
+    def write(self, global_hato_id: int, rows: Sequence[Dict[str, Any]]) -> str:
+        """
+        Write a snapshot's cows to a Parquet file in storage.
+
+        Args:
+            global_hato_id: Snapshot ID (used in the file name)
+            rows: Cow rows with the ARCHIVE_COLUMNS keys, ordered by id
+
+        Returns:
+            Route of the stored file
+        """
+        import pandas as pd
+
+        df = self._normalize(pd.DataFrame(list(rows), columns=ARCHIVE_COLUMNS))
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, engine="pyarrow", compression=self.compression, index=False)
+        buffer.seek(0)
+
+        # Parquet is already compressed; skip the storage's at-rest gzip
+        archive_route, _ = self.storage.upload_stream(
+            buffer, f"global_hato_{global_hato_id}.parquet", subfolder=ARCHIVE_SUBFOLDER, compress=False
+        )
+        return archive_route
+
+    def delete(self, archive_route: str) -> bool:
+        """Delete an archive file and drop it from the cache."""
+        with self._lock:
+            self._cache.pop(archive_route, None)
+        return self.storage.delete_file(archive_route)
+
+    def load(self, archive_route: str):
+        """
+        Load an archived snapshot as a DataFrame (cached).
+
+        Raises:
+            FileNotFoundError: If the file is missing from storage
+        """
+        with self._lock:
+            if archive_route in self._cache:
+                self._cache.move_to_end(archive_route)
+                return self._cache[archive_route]
+
+        import pandas as pd
+
+        stream = self.storage.open_file(archive_route)
+        if stream is None:
+            raise FileNotFoundError(f"Archived snapshot file not found: {archive_route}")
+        try:
+            # Parquet needs a seekable file and S3 bodies are not
+            df = pd.read_parquet(io.BytesIO(stream.read()), engine="pyarrow")
+        finally:
+            stream.close()
+        # Files written before a column was archived read it as NULL
+        df = self._normalize(df.reindex(columns=ARCHIVE_COLUMNS))
+
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[archive_route] = df
+                self._cache.move_to_end(archive_route)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return df
+
+    def corrales(self, archive_route: str) -> List[Dict[str, Any]]:
+        """Per-group aggregates, as in the SQL corrales query (groups without a name excluded)."""
+        df = self.load(archive_route)
+        grouped = df[df["nombre_grupo"].notna() & (df["nombre_grupo"] != "")].groupby("nombre_grupo", sort=False)
+        summary = grouped.agg(
+            total_animales=("id", "count"),
+            produccion_promedio=("produccion_leche_ayer", "mean"),
+            produccion_total=("produccion_leche_ayer", "sum"),
+            produccion_promedio_7dias=("produccion_media_7dias", "mean"),
+        ).reset_index()
+        return self._records(summary)
+
+    def cows_by_group(self, archive_route: str, nombre_grupo: str) -> List[Dict[str, Any]]:
+        """Cows of one group."""
+        df = self.load(archive_route)
+        return self._records(df.loc[df["nombre_grupo"] == nombre_grupo, COW_COLUMNS])
+
+    def column_values(
+        self,
+        archive_route: str,
+        columns: Sequence[str],
+        nombre_grupo: Optional[str] = None
+    ) -> Dict[str, List[Any]]:
+        """Raw values of some columns (None for NULL), optionally for one group."""
+        df = self.load(archive_route)
+        if nombre_grupo:
+            df = df[df["nombre_grupo"] == nombre_grupo]
+        records = self._records(df[list(columns)])
+        return {column: [record[column] for record in records] for column in columns}
+
+    def ranked_by_group(
+        self,
+        archive_route: str,
+        sort_by: str,
+        descending: bool = False,
+        limit: int = 10,
+        nombre_grupos: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """First `limit` cows of every group by one column, as in the SQL ranking query (with 'rank')."""
+        df = self.load(archive_route)
+        df = df[df["nombre_grupo"].notna() & (df["nombre_grupo"] != "") & df[sort_by].notna()]
+        if nombre_grupos:
+            df = df[df["nombre_grupo"].isin(list(nombre_grupos))]
+
+        # Ties are broken by id, as in the SQL query
+        df = df.sort_values([sort_by, "id"], ascending=[not descending, True], kind="mergesort")
+        df = df.assign(rank=df.groupby("nombre_grupo").cumcount() + 1)
+        df = df[df["rank"] <= limit].sort_values(["nombre_grupo", "rank"], kind="mergesort")
+        return self._records(df[[*COW_COLUMNS, "rank"]])
+
+    def query(
+        self,
+        archive_route: str,
+        page: int = 1,
+        limit: int = 10,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        search: Optional[str] = None,
+        nombre_grupo: Optional[str] = None,
+        recomendacion: Optional[int] = None,
+        cow_filter=None
+    ) -> Dict[str, Any]:
+        """
+        Filter, sort and paginate an archived snapshot like get_all_cows_by_snapshot.
+
+        Returns:
+            Dict with 'cows' (row dicts) and 'total'
+        """
+        df = self.load(archive_route)
+
+        # Search filter (case-insensitive partial match, like ILIKE)
+        if search:
+            mask = None
+            for column in _SEARCH_COLUMNS:
+                matches = df[column].str.contains(search, case=False, regex=False, na=False)
+                mask = matches if mask is None else mask | matches
+            df = df[mask]
+
+        if nombre_grupo:
+            df = df[df["nombre_grupo"] == nombre_grupo]
+
+        if recomendacion is not None:
+            df = df[df["recomendacion"] == recomendacion]
+
+        # Range / IN-list filters; NULLs never match, as in SQL
+        if cow_filter is not None:
+            for column, low, high in cow_filter.ranges:
+                if low is not None:
+                    df = df[(df[column] >= low).fillna(False)]
+                if high is not None:
+                    df = df[(df[column] <= high).fillna(False)]
+            for column, values in cow_filter.in_lists:
+                df = df[df[column].isin(values).fillna(False)]
+
+        # Rows are stored by id, which is also the default order. NULLs sort like
+        # PostgreSQL: last ascending, first descending.
+        if sort_by and sort_order and sort_by in COW_COLUMNS and sort_by != "global_hato_id":
+            descending = sort_order.lower() == "desc"
+            df = df.sort_values(
+                sort_by, ascending=not descending, kind="mergesort",
+                na_position="first" if descending else "last"
+            )
+
+        offset = (page - 1) * limit
+        return {
+            "cows": self._records(df.iloc[offset:offset + limit][COW_COLUMNS]),
+            "total": len(df),
+        }
+
+    def _normalize(self, df):
+        """Nullable dtypes, so integer columns with NULLs stay integers."""
+        import pandas as pd
+
+        for column in _INTEGER_COLUMNS:
+            df[column] = pd.to_numeric(df[column]).astype("Int64")
+        for column in _FLOAT_COLUMNS:
+            df[column] = pd.to_numeric(df[column]).astype("Float64")
+        for column in _STRING_COLUMNS:
+            df[column] = df[column].astype("string")
+        return df
+
+    def _records(self, df) -> List[Dict[str, Any]]:
+        """DataFrame rows as dicts of plain Python values (NA becomes None)."""
+        records = df.astype(object).where(df.notna(), None).to_dict("records")
+        for record in records:
+            for key, value in record.items():
+                if hasattr(value, "item"):
+                    record[key] = value.item()
+        return records
+
+
+# Singleton instance
+snapshot_archive = SnapshotArchive()
@@ -3,6 +3,8 @@ from .cow_controller import CowController
 from .dataset_controller import DatasetController
 from .user_controller import UserController
 from .global_hato_controller import GlobalHatoController
+from .profile_controller import ProfileController
+from .search_controller import SearchController
 
 __all__ = [
     "AuthController",
@@ -10,4 +12,6 @@ __all__ = [
     "DatasetController",
     "UserController",
     "GlobalHatoController",
+    "ProfileController",
+    "SearchController",
 ]
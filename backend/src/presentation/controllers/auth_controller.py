@@ -1,6 +1,9 @@
+import logging
 from flask import jsonify, request
 from domain.usecases import LoginUser, RegisterUser, LogoutUser, GetCurrentUser, RefreshTokenUseCase
 
+logger = logging.getLogger(__name__)
+
 
 class AuthController:
     """Authentication controller with dependency injection."""
@@ -42,9 +45,7 @@ class AuthController:
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
-            print(f"Login error: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
+            logger.exception("Login error")
             return jsonify({"error": "Internal server error"}), 500
 
     async def register(self):
@@ -171,7 +172,5 @@ class AuthController:
 
             return jsonify({"message": "Code verified successfully"}), 200
         except Exception as e:
-            print(f"Verify code error: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
+            logger.exception("Verify code error")
             return jsonify({"error": "Internal server error"}), 500
@@ -5,8 +5,6 @@ from domain.entities import Dataset
 from infrastructure.storage import s3_storage_service
 from datetime import datetime
 from werkzeug.utils import secure_filename
-import os
-import uuid
 
 
 class DatasetController:
@@ -55,20 +53,13 @@ class DatasetController:
             # Get optional metadata from form
             name = request.form.get('name', file.filename)
 
-            # Secure filename and save temporarily
+            # Stream straight into a multipart S3 upload (size counted on the way)
             filename = secure_filename(file.filename)
-            temp_path = f"/tmp/{uuid.uuid4()}_{filename}"
-            file.save(temp_path)
-
-            # Upload to S3
-            s3_key = f"datasets/{user_id}/{uuid.uuid4()}_{filename}"
-            s3_path = s3_storage_service.upload_file(temp_path, s3_key)
-
-            # Get file size
-            file_size = os.path.getsize(temp_path)
-
-            # Clean up temp file
-            os.remove(temp_path)
+            s3_path, file_size = s3_storage_service.upload_stream(
+                file.stream,
+                filename,
+                subfolder=f"datasets/{user_id}"
+            )
 
             # Create dataset entity
             dataset = Dataset(
@@ -1,15 +1,20 @@
 """Global Hato controller with dependency injection."""
-from flask import jsonify, request, send_file
+import logging
+from flask import jsonify, request, send_file, Response
 from datetime import datetime
 from typing import Optional, Any
 from domain.usecases import CreateGlobalHato, GetAllGlobalHatos, DeleteGlobalHato
-from infrastructure.storage import local_storage_service
+from infrastructure.storage import storage_service
 from werkzeug.utils import secure_filename
 import os
+import time
 import uuid
 import csv
-import pandas as pd
-from utils.hato_data_cleaner import HatoDataCleaner
+from infrastructure.monitoring import ingest_stage, INGEST_ROWS_PER_SECOND, start_memory_tracking, stop_memory_tracking
+from utils.constants import app_config
+from utils.constants.roles import ROLE_ADMIN
+
+logger = logging.getLogger(__name__)
 
 
 class GlobalHatoController:
@@ -22,7 +27,12 @@ class GlobalHatoController:
         delete_global_hato: DeleteGlobalHato,
         get_corrales_by_snapshot: 'GetCorralesBySnapshot',
         get_cows_by_group: 'GetCowsByGroup',
-        get_all_cows_by_snapshot: 'GetAllCowsBySnapshot'
+        get_all_cows_by_snapshot: 'GetAllCowsBySnapshot',
+        get_hato_trends: Optional['GetHatoTrends'] = None,
+        get_corral_series: Optional['GetCorralSeries'] = None,
+        get_snapshot_statistics: Optional['GetSnapshotStatistics'] = None,
+        get_corral_ranking: Optional['GetCorralRanking'] = None,
+        replace_global_hato: Optional['ReplaceGlobalHato'] = None
     ):
         self.create_global_hato = create_global_hato
         self.get_all_global_hatos = get_all_global_hatos
@@ -30,6 +40,11 @@ class GlobalHatoController:
         self.get_corrales_by_snapshot = get_corrales_by_snapshot
         self.get_cows_by_group = get_cows_by_group
         self.get_all_cows_by_snapshot = get_all_cows_by_snapshot
+        self.get_hato_trends = get_hato_trends
+        self.get_corral_series = get_corral_series
+        self.get_snapshot_statistics = get_snapshot_statistics
+        self.get_corral_ranking = get_corral_ranking
+        self.replace_global_hato = replace_global_hato
 
     def _serialize_global_hato(self, global_hato):
         """Serialize GlobalHato entity to JSON."""
@@ -40,7 +55,8 @@ class GlobalHatoController:
             "total_animales": global_hato.total_animales,
             "grupos_detectados": global_hato.grupos_detectados,
             "created_at": global_hato.created_at.isoformat(),
-            "blob_route": global_hato.blob_route
+            "blob_route": global_hato.blob_route,
+            "status": global_hato.status
         }
 
     async def get_global_hatos(self):
@@ -76,7 +92,7 @@ class GlobalHatoController:
                 }
             }), 200
         except Exception as e:
-            print(f"Error getting Global Hatos: {str(e)}")
+            logger.exception("Error getting Global Hatos")
             return jsonify({"error": "Internal server error"}), 500
 
     async def create_global_hato_endpoint(self):
@@ -123,9 +139,7 @@ class GlobalHatoController:
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
-            print(f"Error creating Global Hato: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error creating Global Hato")
             return jsonify({"error": "Internal server error"}), 500
 
     async def delete_global_hato_endpoint(self, global_hato_id: int):
@@ -140,11 +154,22 @@ class GlobalHatoController:
         except ValueError as e:
             return jsonify({"error": str(e)}), 404
         except Exception as e:
-            print(f"Error deleting Global Hato: {str(e)}")
+            logger.exception("Error deleting Global Hato")
             return jsonify({"error": "Internal server error"}), 500
 
+    def _memory_tracking_requested(self) -> bool:
+        """Check whether this upload should run with tracemalloc instrumentation."""
+        if app_config.INGEST_MEMORY_TRACKING:
+            return True
+        requested = request.args.get('track_memory', 'false').lower() == 'true'
+        return requested and getattr(request, 'user_role', None) == ROLE_ADMIN
+
     async def upload_csv_endpoint(self):
         """Handle CSV file upload for Global Hato snapshot."""
+        # pandas is only needed here; importing it lazily keeps worker startup light
+        import pandas as pd
+        from utils.hato_data_cleaner import HatoDataCleaner
+
         try:
             user_id = request.user_id
 
@@ -162,6 +187,8 @@ class GlobalHatoController:
             # Get form data
             nombre = request.form.get('nombre')
             fecha_snapshot_str = request.form.get('fecha_snapshot')
+            # Replace the snapshot of the same date instead of adding another one
+            replace = request.form.get('replace', 'false').lower() == 'true'
 
             if not nombre:
                 return jsonify({"error": "Nombre is required"}), 400
@@ -180,6 +207,7 @@ class GlobalHatoController:
             temp_path = f"/tmp/{uuid.uuid4()}_{filename}"
             file.save(temp_path)
 
+            memory_tracker = start_memory_tracking() if self._memory_tracking_requested() else None
             try:
                 # Parse CSV and validate rows
                 valid_cows = []
@@ -189,76 +217,79 @@ class GlobalHatoController:
                 try:
                     # Read CSV with pandas (handles BOM automatically)
                     # Use on_bad_lines='skip' or similar if needed, but default is usually fine
-                    df = pd.read_csv(temp_path)
-                    
+                    ingest_start = time.perf_counter()
+                    with ingest_stage('parse'):
+                        df = pd.read_csv(temp_path)
+
                     # Run cleaning pipeline
-                    cleaner = HatoDataCleaner(df)
-                    cleaned_df = cleaner.run_pipeline()
+                    with ingest_stage('clean', rows=len(df)):
+                        cleaner = HatoDataCleaner(df)
+                        cleaned_df = cleaner.run_pipeline()
                     
-                    if cleaned_df.empty:
-                         os.remove(temp_path)
-                         return jsonify({
-                             "error": "No valid rows found after cleaning"
-                         }), 400
-
-                    # Convert cleaned DataFrame to list of dicts for validation/processing
-                    # Map DataFrame columns to application fields
-                    for index, row in cleaned_df.iterrows():
-                        try:
-                            # Helper to safely parse string field
-                            def safe_str(value: Any) -> Optional[str]:
-                                """Convert to string and return None if empty."""
-                                if pd.isna(value) or str(value).strip() == '':
-                                    return None
-                                return str(value).strip()
-
-                            # Helper to safely parse numeric values (already handled by fillna(0) but good to be safe)
-                            def safe_float(value: Any) -> Optional[float]:
-                                if pd.isna(value):
-                                    return 0.0
-                                try:
-                                    return float(value)
-                                except (ValueError, TypeError):
-                                    return 0.0
-
-                            def safe_int(value: Any) -> Optional[int]:
-                                if pd.isna(value):
-                                    return 0
-                                try:
-                                    return int(value)
-                                except (ValueError, TypeError):
-                                    return 0
-
-                            cow_data = {
-                                'numero_animal': str(row['Número del animal']).strip(),
-                                'nombre_grupo': str(row['Nombre del grupo']).strip(),
-                                'produccion_leche_ayer': safe_float(row.get('Producción de leche ayer')),
-                                'produccion_media_7dias': safe_float(row.get('Producción media diaria últimos 7 días')),
-                                'estado_reproduccion': safe_str(row.get('Estado de la reproducción')),
-                                'dias_ordeno': safe_int(row.get('Días en ordeño')),
-                                'numero_seleccion': safe_str(row.get('Número(s) de selección de animal')),
-                                # Fields for AI Model
-                                'numero_lactacion': safe_int(row.get('Nº Lactación')),
-                                'numero_inseminaciones': safe_int(row.get('Número de inseminaciones')),
-                                'dias_prenada': safe_int(row.get('Días preñada')),
-                                'dias_para_parto': safe_int(row.get('Días para el parto')),
-                                'produccion_total_lactacion': safe_float(row.get('Producción TOTAL en lactación'))
-                            }
-
-                            # Validate required fields
-                            if not cow_data['numero_animal']:
-                                raise ValueError("Número del animal is required")
-                            if not cow_data['nombre_grupo']:
-                                raise ValueError("Nombre del grupo is required")
-
-                            valid_cows.append(cow_data)
-
-                        except (ValueError, KeyError) as e:
-                            invalid_rows.append({
-                                'row': index + 2, # +2 for 1-based index and header
-                                'error': str(e),
-                                'data': row.to_dict()
-                            })
+                        if cleaned_df.empty:
+                             os.remove(temp_path)
+                             return jsonify({
+                                 "error": "No valid rows found after cleaning"
+                             }), 400
+
+                        # Convert cleaned DataFrame to list of dicts for validation/processing
+                        # Map DataFrame columns to application fields
+                        for index, row in cleaned_df.iterrows():
+                            try:
+                                # Helper to safely parse string field
+                                def safe_str(value: Any) -> Optional[str]:
+                                    """Convert to string and return None if empty."""
+                                    if pd.isna(value) or str(value).strip() == '':
+                                        return None
+                                    return str(value).strip()
+
+                                # Helper to safely parse numeric values (already handled by fillna(0) but good to be safe)
+                                def safe_float(value: Any) -> Optional[float]:
+                                    if pd.isna(value):
+                                        return 0.0
+                                    try:
+                                        return float(value)
+                                    except (ValueError, TypeError):
+                                        return 0.0
+
+                                def safe_int(value: Any) -> Optional[int]:
+                                    if pd.isna(value):
+                                        return 0
+                                    try:
+                                        return int(value)
+                                    except (ValueError, TypeError):
+                                        return 0
+
+                                cow_data = {
+                                    'numero_animal': str(row['Número del animal']).strip(),
+                                    'nombre_grupo': str(row['Nombre del grupo']).strip(),
+                                    'produccion_leche_ayer': safe_float(row.get('Producción de leche ayer')),
+                                    'produccion_media_7dias': safe_float(row.get('Producción media diaria últimos 7 días')),
+                                    'estado_reproduccion': safe_str(row.get('Estado de la reproducción')),
+                                    'dias_ordeno': safe_int(row.get('Días en ordeño')),
+                                    'numero_seleccion': safe_str(row.get('Número(s) de selección de animal')),
+                                    # Fields for AI Model
+                                    'numero_lactacion': safe_int(row.get('Nº Lactación')),
+                                    'numero_inseminaciones': safe_int(row.get('Número de inseminaciones')),
+                                    'dias_prenada': safe_int(row.get('Días preñada')),
+                                    'dias_para_parto': safe_int(row.get('Días para el parto')),
+                                    'produccion_total_lactacion': safe_float(row.get('Producción TOTAL en lactación'))
+                                }
+
+                                # Validate required fields
+                                if not cow_data['numero_animal']:
+                                    raise ValueError("Número del animal is required")
+                                if not cow_data['nombre_grupo']:
+                                    raise ValueError("Nombre del grupo is required")
+
+                                valid_cows.append(cow_data)
+
+                            except (ValueError, KeyError) as e:
+                                invalid_rows.append({
+                                    'row': index + 2, # +2 for 1-based index and header
+                                    'error': str(e),
+                                    'data': row.to_dict()
+                                })
 
                 except Exception as e:
                      # If pandas fails completely (e.g. invalid CSV format)
@@ -273,7 +304,7 @@ class GlobalHatoController:
                     }), 400
 
                 # Upload file to local storage
-                blob_route = local_storage_service.upload_file(
+                blob_route = storage_service.upload_file(
                     temp_path,
                     filename,
                     subfolder="global_hatos"
@@ -282,17 +313,44 @@ class GlobalHatoController:
                 # Clean up temp file
                 os.remove(temp_path)
 
-                # Execute use case with valid rows
-                global_hato = await self.create_global_hato.execute(
-                    user_id=user_id,
-                    nombre=nombre,
-                    fecha_snapshot=fecha_snapshot,
-                    cows_data=valid_cows,
-                    blob_route=blob_route
-                )
+                # Execute use case with valid rows; a rejected upload must not leave its file in storage
+                diff = None
+                try:
+                    if replace:
+                        global_hato, diff = await self.replace_global_hato.execute(
+                            user_id=user_id,
+                            nombre=nombre,
+                            fecha_snapshot=fecha_snapshot,
+                            cows_data=valid_cows,
+                            blob_route=blob_route
+                        )
+                    else:
+                        global_hato = await self.create_global_hato.execute(
+                            user_id=user_id,
+                            nombre=nombre,
+                            fecha_snapshot=fecha_snapshot,
+                            cows_data=valid_cows,
+                            blob_route=blob_route
+                        )
+                except Exception:
+                    storage_service.delete_file(blob_route)
+                    raise
+                INGEST_ROWS_PER_SECOND.observe(len(valid_cows) / (time.perf_counter() - ingest_start))
 
                 # Build response
                 response_data = self._serialize_global_hato(global_hato)
+                if diff is not None:
+                    response_data['replaced'] = {
+                        'unchanged': diff.unchanged,
+                        'changed': diff.changed,
+                        'added': diff.added,
+                        'removed': diff.removed
+                    }
+
+                if memory_tracker is not None:
+                    stop_memory_tracking()
+                    response_data['memory'] = memory_tracker.report()
+                    logger.info("Ingest memory profile", extra={"memory": response_data['memory']})
 
                 # Add warnings if there were invalid rows
                 if invalid_rows:
@@ -301,20 +359,21 @@ class GlobalHatoController:
                         'invalid_rows': invalid_rows[:10]  # Limit to first 10 for readability
                     }
 
-                return jsonify(response_data), 201
+                return jsonify(response_data), 200 if diff is not None else 201
 
             except Exception as e:
                 # Clean up temp file on error
                 if os.path.exists(temp_path):
                     os.remove(temp_path)
                 raise e
+            finally:
+                if memory_tracker is not None:
+                    stop_memory_tracking()
 
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
-            print(f"Error uploading CSV: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error uploading CSV")
             return jsonify({"error": "Internal server error"}), 500
 
     async def download_csv_endpoint(self, global_hato_id: int):
@@ -336,25 +395,144 @@ class GlobalHatoController:
             if not global_hato.blob_route:
                 return jsonify({"error": "No file associated with this Global Hato"}), 404
 
-            # Get file path
-            file_path = local_storage_service.download_file(global_hato.blob_route)
+            if not storage_service.file_exists(global_hato.blob_route):
+                return jsonify({"error": "File not found in storage"}), 404
+
+            # Extract filename from blob_route (without at-rest compression suffix)
+            filename = storage_service.get_download_name(global_hato.blob_route)
 
-            if not file_path:
-                return jsonify({"error": "File not found on disk"}), 404
+            # Offload the transfer to nginx (range requests handled there)
+            internal_path = None
+            if app_config.USE_X_ACCEL_REDIRECT:
+                internal_path = storage_service.get_internal_redirect_path(
+                    global_hato.blob_route,
+                    app_config.X_ACCEL_REDIRECT_PREFIX
+                )
+            if internal_path:
+                response = Response(status=200, mimetype='text/csv')
+                response.headers['X-Accel-Redirect'] = internal_path
+                response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+                return response
+
+            # Fallback: stream the file directly (deployments without nginx)
+            file_path = storage_service.download_file(global_hato.blob_route)
+            compressed = storage_service.is_compressed(global_hato.blob_route)
+
+            if file_path and not compressed:
+                return send_file(
+                    file_path,
+                    mimetype='text/csv',
+                    as_attachment=True,
+                    download_name=filename
+                )
 
-            # Extract filename from blob_route
-            filename = os.path.basename(global_hato.blob_route)
+            # Compressed at rest: hand gzip clients the stored bytes as-is
+            if file_path and request.accept_encodings['gzip']:
+                response = send_file(
+                    file_path,
+                    mimetype='text/csv',
+                    as_attachment=True,
+                    download_name=filename
+                )
+                response.headers['Content-Encoding'] = 'gzip'
+                response.vary.add('Accept-Encoding')
+                return response
 
-            # Send file
-            return send_file(
-                file_path,
+            # Otherwise (or for remote backends) stream through, decompressing on the fly
+            response = send_file(
+                storage_service.open_file(global_hato.blob_route),
                 mimetype='text/csv',
                 as_attachment=True,
                 download_name=filename
             )
+            if compressed:
+                response.vary.add('Accept-Encoding')
+            return response
+
+        except Exception as e:
+            logger.exception("Error downloading CSV")
+            return jsonify({"error": "Internal server error"}), 500
+
+    async def get_trends_endpoint(self):
+        """Handle get herd trends request (one point per snapshot in the date window)."""
+        try:
+            user_id = request.user_id
+            fecha_desde = request.args.get('fecha_desde', None, type=str)
+            fecha_hasta = request.args.get('fecha_hasta', None, type=str)
+
+            # Execute use case
+            try:
+                rollups = await self.get_hato_trends.execute(user_id, fecha_desde, fecha_hasta)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+
+            # Serialize response
+            return jsonify({
+                "trends": [
+                    {
+                        "global_hato_id": rollup.global_hato_id,
+                        "fecha_snapshot": rollup.fecha_snapshot.isoformat(),
+                        "total_animales": rollup.total_animales,
+                        "grupos_detectados": rollup.grupos_detectados,
+                        "produccion_total": rollup.produccion_total,
+                        "produccion_promedio": rollup.produccion_promedio,
+                        "produccion_promedio_7dias": rollup.produccion_promedio_7dias,
+                        "recomendaciones": {
+                            "en_produccion": rollup.en_produccion,
+                            "en_monitoreo": rollup.en_monitoreo,
+                            "previo_secado": rollup.previo_secado,
+                            "sin_recomendacion": rollup.sin_recomendacion
+                        }
+                    }
+                    for rollup in rollups
+                ]
+            }), 200
+        except Exception as e:
+            logger.exception("Error getting herd trends")
+            return jsonify({"error": "Internal server error"}), 500
+
+    async def get_corral_series_endpoint(self):
+        """Handle get per-corral time series request (one point per corral and snapshot)."""
+        try:
+            user_id = request.user_id
+            fecha_desde = request.args.get('fecha_desde', None, type=str)
+            fecha_hasta = request.args.get('fecha_hasta', None, type=str)
+            nombre_grupo = request.args.get('nombre_grupo', None, type=str)
+
+            # Execute use case
+            try:
+                series = await self.get_corral_series.execute(user_id, fecha_desde, fecha_hasta, nombre_grupo)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
 
+            # Serialize response
+            return jsonify({
+                "corrales": [
+                    {
+                        "nombre_grupo": nombre,
+                        "series": [
+                            {
+                                "global_hato_id": point.global_hato_id,
+                                "fecha_snapshot": point.fecha_snapshot.isoformat(),
+                                "total_animales": point.total_animales,
+                                "produccion_promedio": point.produccion_promedio,
+                                "produccion_total": point.produccion_total,
+                                "produccion_promedio_7dias": point.produccion_promedio_7dias,
+                                "recomendaciones": {
+                                    "en_produccion": point.en_produccion,
+                                    "en_monitoreo": point.en_monitoreo,
+                                    "previo_secado": point.previo_secado,
+                                    "sin_recomendacion": point.sin_recomendacion
+                                }
+                            }
+                            for point in points
+                        ]
+                    }
+                    for nombre, points in series.items()
+                ]
+            }), 200
         except Exception as e:
-            print(f"Error downloading CSV: {str(e)}")
+            logger.exception("Error getting corral series")
             return jsonify({"error": "Internal server error"}), 500
 
     async def get_corrales_endpoint(self, global_hato_id: int):
@@ -377,7 +555,104 @@ class GlobalHatoController:
                 for corral in corrales
             ]), 200
         except Exception as e:
-            print(f"Error getting corrales: {str(e)}")
+            logger.exception("Error getting corrales")
+            return jsonify({"error": "Internal server error"}), 500
+
+    async def get_statistics_endpoint(self, global_hato_id: int):
+        """Handle get production statistics (histograms and percentiles) for a snapshot."""
+        try:
+            user_id = request.user_id
+            nombre_grupo = request.args.get('nombre_grupo', None, type=str)
+            bins = request.args.get('bins', None, type=int)
+
+            # Execute use case
+            try:
+                statistics = await self.get_snapshot_statistics.execute(global_hato_id, user_id, nombre_grupo, bins)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+
+            if statistics is None:
+                return jsonify({"error": "Global Hato not found"}), 404
+
+            # Serialize response
+            return jsonify({
+                "global_hato_id": global_hato_id,
+                "nombre_grupo": nombre_grupo,
+                "statistics": {
+                    column: {
+                        "count": stats.count,
+                        "nulls": stats.nulls,
+                        "min": stats.min,
+                        "max": stats.max,
+                        "mean": stats.mean,
+                        "std": stats.std,
+                        "percentiles": {
+                            "p10": stats.p10,
+                            "p25": stats.p25,
+                            "median": stats.median,
+                            "p75": stats.p75,
+                            "p90": stats.p90
+                        },
+                        "histogram": {
+                            "bin_edges": stats.bin_edges,
+                            "counts": stats.counts
+                        }
+                    }
+                    for column, stats in statistics.items()
+                }
+            }), 200
+        except Exception as e:
+            logger.exception("Error getting snapshot statistics")
+            return jsonify({"error": "Internal server error"}), 500
+
+    async def get_ranking_endpoint(self, global_hato_id: int):
+        """Handle get the top or bottom N cows of every corral by one metric."""
+        try:
+            user_id = request.user_id
+            sort_by = request.args.get('sort_by', 'produccion_leche_ayer', type=str)
+            sort_order = request.args.get('sort_order', 'desc', type=str)
+            limit = request.args.get('limit', None, type=int)
+            nombre_grupos = request.args.getlist('nombre_grupo') or None
+
+            # Execute use case
+            try:
+                ranking = await self.get_corral_ranking.execute(
+                    global_hato_id, user_id, sort_by, sort_order, limit, nombre_grupos
+                )
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+
+            if ranking is None:
+                return jsonify({"error": "Global Hato not found"}), 404
+
+            # Serialize response
+            return jsonify({
+                "global_hato_id": global_hato_id,
+                "sort_by": sort_by,
+                "sort_order": sort_order,
+                "corrales": [
+                    {
+                        "nombre_grupo": nombre,
+                        "vacas": [
+                            {
+                                "rank": ranked.rank,
+                                "id": ranked.cow.id,
+                                "numero_animal": ranked.cow.numero_animal,
+                                "produccion_leche_ayer": ranked.cow.produccion_leche_ayer,
+                                "produccion_media_7dias": ranked.cow.produccion_media_7dias,
+                                "estado_reproduccion": ranked.cow.estado_reproduccion,
+                                "dias_ordeno": ranked.cow.dias_ordeno,
+                                "numero_seleccion": ranked.cow.numero_seleccion,
+                                "recomendacion": ranked.cow.recomendacion
+                            }
+                            for ranked in cows
+                        ]
+                    }
+                    for nombre, cows in ranking.items()
+                ]
+            }), 200
+        except Exception as e:
+            logger.exception("Error getting corral ranking")
             return jsonify({"error": "Internal server error"}), 500
 
     async def get_cows_by_group_endpoint(self, global_hato_id: int, nombre_grupo: str):
@@ -404,7 +679,7 @@ class GlobalHatoController:
                 for cow in cows
             ]), 200
         except Exception as e:
-            print(f"Error getting cows by group: {str(e)}")
+            logger.exception("Error getting cows by group")
             return jsonify({"error": "Internal server error"}), 500
 
     async def get_all_cows_endpoint(self, global_hato_id: int):
@@ -418,21 +693,24 @@ class GlobalHatoController:
             sort_by = request.args.get('sort_by', None, type=str)
             sort_order = request.args.get('sort_order', None, type=str)
             search = request.args.get('search', None, type=str)
-            nombre_grupo = request.args.get('nombre_grupo', None, type=str)
-            recomendacion = request.args.get('recomendacion', None, type=int)
+            # nombre_grupo / recomendacion may repeat, so they go through the filters
+            # with the <field>_min / <field>_max ranges
+            filters = request.args.to_dict(flat=False)
 
             # Execute use case
-            result = await self.get_all_cows_by_snapshot.execute(
-                global_hato_id,
-                user_id,
-                page,
-                limit,
-                sort_by,
-                sort_order,
-                search,
-                nombre_grupo,
-                recomendacion
-            )
+            try:
+                result = await self.get_all_cows_by_snapshot.execute(
+                    global_hato_id,
+                    user_id,
+                    page,
+                    limit,
+                    sort_by,
+                    sort_order,
+                    search,
+                    filters=filters
+                )
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
 
             # Serialize response
             return jsonify({
@@ -458,5 +736,5 @@ class GlobalHatoController:
                 }
             }), 200
         except Exception as e:
-            print(f"Error getting all cows for snapshot: {str(e)}")
+            logger.exception("Error getting all cows for snapshot")
             return jsonify({"error": "Internal server error"}), 500
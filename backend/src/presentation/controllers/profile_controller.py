@@ -0,0 +1,34 @@
+"""Profile controller for admin-triggered request profiles."""
+import logging
+from flask import jsonify, request, send_file
+from infrastructure.monitoring import RequestProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileController:
+    """Profile controller with dependency injection."""
+
+    def __init__(self, request_profiler: RequestProfiler):
+        self.request_profiler = request_profiler
+
+    async def list_profiles(self):
+        """Handle list recent request profiles request."""
+        try:
+            limit = request.args.get('limit', 20, type=int)
+            return jsonify({"profiles": self.request_profiler.list_profiles(limit)}), 200
+        except Exception as e:
+            logger.exception("Error listing profiles")
+            return jsonify({"error": "Internal server error"}), 500
+
+    async def download_profile(self, name: str):
+        """Handle download of a saved request profile."""
+        try:
+            path = self.request_profiler.get_profile_path(name)
+            if not path:
+                return jsonify({"error": "Profile not found"}), 404
+
+            return send_file(path, mimetype='application/octet-stream', as_attachment=True, download_name=name)
+        except Exception as e:
+            logger.exception("Error downloading profile")
+            return jsonify({"error": "Internal server error"}), 500
@@ -0,0 +1,74 @@
+"""Cross-snapshot search controller with dependency injection."""
+import logging
+from flask import jsonify, request
+from domain.usecases import SearchCows, FindTermSnapshots
+
+logger = logging.getLogger(__name__)
+
+
+class SearchController:
+    """Cross-snapshot search controller with dependency injection."""
+
+    def __init__(self, search_cows: SearchCows, find_term_snapshots: FindTermSnapshots):
+        self.search_cows = search_cows
+        self.find_term_snapshots = find_term_snapshots
+
+    async def search_endpoint(self, autocomplete: bool = False):
+        """Handle search (substring) and autocomplete (prefix) requests over the user's snapshots."""
+        try:
+            user_id = request.user_id
+            q = request.args.get('q', None, type=str)
+            kind = request.args.get('kind', None, type=str)
+            limit = request.args.get('limit', None, type=int)
+
+            # Execute use case
+            try:
+                matches = await self.search_cows.execute(user_id, q, kind, limit, autocomplete)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+
+            # Serialize response
+            return jsonify({
+                "results": [
+                    {
+                        "kind": match.kind,
+                        "term": match.term,
+                        "snapshots": match.snapshots,
+                        "last_fecha_snapshot": match.last_fecha_snapshot.isoformat()
+                    }
+                    for match in matches
+                ]
+            }), 200
+        except Exception as e:
+            logger.exception("Error searching snapshots")
+            return jsonify({"error": "Internal server error"}), 500
+
+    async def snapshots_endpoint(self):
+        """Handle listing the snapshots a term appears in."""
+        try:
+            user_id = request.user_id
+            kind = request.args.get('kind', None, type=str)
+            term = request.args.get('term', None, type=str)
+
+            # Execute use case
+            try:
+                occurrences = await self.find_term_snapshots.execute(user_id, kind, term)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+
+            # Serialize response
+            return jsonify({
+                "kind": kind,
+                "term": term,
+                "snapshots": [
+                    {
+                        "global_hato_id": occurrence.global_hato_id,
+                        "nombre": occurrence.nombre,
+                        "fecha_snapshot": occurrence.fecha_snapshot.isoformat()
+                    }
+                    for occurrence in occurrences
+                ]
+            }), 200
+        except Exception as e:
+            logger.exception("Error finding term snapshots")
+            return jsonify({"error": "Internal server error"}), 500
@@ -1,7 +1,10 @@
+import logging
 from flask import jsonify, request
 from domain.usecases import GetAllUsers, UpdateUserRole
 from presentation.middleware.auth_middleware import require_auth, require_admin
 
+logger = logging.getLogger(__name__)
+
 
 class UserController:
     """User controller with dependency injection."""
@@ -49,7 +52,7 @@ class UserController:
                 }
             }), 200
         except Exception as e:
-            print(f"Error getting users: {str(e)}")
+            logger.exception("Error getting users")
             return jsonify({"error": "Internal server error"}), 500
 
     @require_auth
@@ -74,5 +77,5 @@ class UserController:
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
-            print(f"Error updating user role: {str(e)}")
+            logger.exception("Error updating user role")
             return jsonify({"error": "Internal server error"}), 500
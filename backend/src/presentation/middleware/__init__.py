@@ -1,8 +1,12 @@
 from .auth_middleware import auth_required, role_required
 from .error_handler import register_error_handlers
+from .metrics_middleware import register_metrics
+from .sql_middleware import register_sql_instrumentation
 
 __all__ = [
     "auth_required",
     "role_required",
     "register_error_handlers",
+    "register_metrics",
+    "register_sql_instrumentation",
 ]
@@ -1,7 +1,13 @@
 from functools import wraps
-from flask import request, jsonify
+from flask import request, jsonify, make_response
 import jwt
 import os
+from infrastructure.monitoring import request_profiler
+from utils.constants.roles import ROLE_ADMIN
+
+# Admins can profile a single request by sending this header (or ?profile=)
+# with value "sample" (default) or "cprofile"
+PROFILE_HEADER = "X-Profile"
 
 
 # Get JWT secret key - fail fast if not set
@@ -36,6 +42,7 @@ def auth_required(f):
 
             # Add user_id to request context
             request.user_id = payload.get("sub")
+            request.user_role = payload.get("role")
 
             if not request.user_id:
                 return jsonify({"error": "Invalid token payload"}), 401
@@ -47,11 +54,26 @@ def auth_required(f):
         except Exception as e:
             return jsonify({"error": "Authentication failed"}), 401
 
+        # On-demand profiling, only honoured for admins (role comes from the signed token)
+        profile_mode = request.headers.get(PROFILE_HEADER) or request.args.get('profile')
+        if profile_mode and payload.get("role") == ROLE_ADMIN:
+            return _run_profiled(profile_mode, f, *args, **kwargs)
+
         return f(*args, **kwargs)
 
     return decorated_function
 
 
+def _run_profiled(mode, f, *args, **kwargs):
+    """Run a view under the request profiler and report the saved profile name."""
+    label = f"{request.endpoint}_user{request.user_id}"
+    result, profile_name = request_profiler.profile(mode, label, f, *args, **kwargs)
+
+    response = make_response(result)
+    response.headers['X-Profile-Id'] = profile_name
+    return response
+
+
 def role_required(*allowed_roles):
     """Role-based authorization middleware decorator."""
     def decorator(f):
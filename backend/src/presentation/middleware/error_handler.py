@@ -1,6 +1,9 @@
+import logging
 from flask import jsonify
 from werkzeug.exceptions import HTTPException
 
+logger = logging.getLogger(__name__)
+
 
 def register_error_handlers(app):
     """Register global error handlers for the Flask app."""
@@ -64,8 +67,7 @@ def register_error_handlers(app):
     @app.errorhandler(Exception)
     def handle_generic_exception(error):
         """Handle all uncaught exceptions."""
-        # Log the error here (use proper logging in production)
-        print(f"Unhandled exception: {str(error)}")
+        logger.error("Unhandled exception", exc_info=error)
 
         return jsonify({
             "error": "Internal Server Error",
@@ -0,0 +1,37 @@
+import time
+from flask import request, g, Response
+from infrastructure.database import db_config
+from infrastructure.monitoring import REQUEST_LATENCY, update_db_pool_metrics, render_metrics
+
+
+def register_metrics(app):
+    """Register request latency tracking and the /metrics endpoint.
+
+    /metrics lives outside /api so nginx does not expose it publicly;
+    Prometheus scrapes the backend container directly.
+    """
+
+    @app.before_request
+    def start_request_timer():
+        """Remember when the request started."""
+        g.request_start_time = time.perf_counter()
+
+    @app.after_request
+    def record_request_latency(response):
+        """Observe request latency per blueprint endpoint."""
+        start = g.pop('request_start_time', None)
+        if start is not None and request.endpoint != 'metrics':
+            REQUEST_LATENCY.labels(
+                method=request.method,
+                endpoint=request.endpoint or 'unmatched',
+                status=response.status_code
+            ).observe(time.perf_counter() - start)
+            update_db_pool_metrics(db_config.engine)
+        return response
+
+    @app.route('/metrics')
+    def metrics():
+        """Expose Prometheus metrics (merged across gunicorn workers)."""
+        update_db_pool_metrics(db_config.engine)
+        data, content_type = render_metrics()
+        return Response(data, mimetype=content_type)
@@ -0,0 +1,57 @@
+import logging
+from flask import request
+from infrastructure.database import db_config
+from infrastructure.monitoring import (
+    install_sql_instrumentation,
+    start_query_stats,
+    stop_query_stats,
+    DB_QUERIES_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+)
+from utils.constants import app_config
+
+logger = logging.getLogger(__name__)
+
+
+def register_sql_instrumentation(app):
+    """Count and time SQL statements per request.
+
+    Adds a Server-Timing header in debug mode and logs requests that are slow
+    in the database, issue too many statements or repeat one (N+1).
+    """
+    install_sql_instrumentation(db_config.engine)
+
+    @app.before_request
+    def start_sql_stats():
+        """Start collecting SQL statistics for this request."""
+        start_query_stats()
+
+    @app.after_request
+    def report_sql_stats(response):
+        """Publish and check the SQL statistics of this request."""
+        stats = stop_query_stats()
+        if stats is None:
+            return response
+
+        endpoint = request.endpoint or 'unmatched'
+        DB_QUERIES_PER_REQUEST.labels(endpoint=endpoint).observe(stats.count)
+        DB_TIME_PER_REQUEST.labels(endpoint=endpoint).observe(stats.total_time)
+
+        if app_config.DEBUG:
+            response.headers.add('Server-Timing', stats.server_timing())
+
+        total_ms = stats.total_time * 1000
+        if total_ms > app_config.SQL_SLOW_REQUEST_MS or stats.count > app_config.SQL_QUERY_COUNT_WARNING:
+            logger.warning(
+                "SQL budget exceeded on %s %s: %d queries, %.1f ms total, slowest %.1f ms: %s",
+                request.method, request.path, stats.count, total_ms,
+                stats.slowest_time * 1000, stats.slowest_statement
+            )
+
+        for statement, count in stats.repeated_statements():
+            logger.warning(
+                "Possible N+1 on %s %s: statement executed %d times: %s",
+                request.method, request.path, count, statement
+            )
+
+        return response
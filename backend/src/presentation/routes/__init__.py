@@ -3,6 +3,8 @@ from .cow_routes import create_cow_routes
 from .dataset_routes import create_dataset_routes
 from .user_routes import create_user_routes
 from .global_hato_routes import create_global_hato_routes
+from .profile_routes import create_profile_routes
+from .search_routes import create_search_routes
 
 __all__ = [
     "create_auth_routes",
@@ -10,4 +12,6 @@ __all__ = [
     "create_dataset_routes",
     "create_user_routes",
     "create_global_hato_routes",
+    "create_profile_routes",
+    "create_search_routes",
 ]
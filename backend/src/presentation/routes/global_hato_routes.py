@@ -20,6 +20,18 @@ def create_global_hato_routes(global_hato_controller):
         """Create a new Global Hato snapshot with cows."""
         return asyncio.run(global_hato_controller.create_global_hato_endpoint())
 
+    @global_hato_bp.route('/trends', methods=['GET'])
+    @require_auth
+    def get_trends():
+        """Get herd trends across the current user's snapshots."""
+        return asyncio.run(global_hato_controller.get_trends_endpoint())
+
+    @global_hato_bp.route('/trends/corrales', methods=['GET'])
+    @require_auth
+    def get_corral_series():
+        """Get per-corral time series across the current user's snapshots."""
+        return asyncio.run(global_hato_controller.get_corral_series_endpoint())
+
     @global_hato_bp.route('/upload-csv', methods=['POST'])
     @require_auth
     def upload_csv():
@@ -38,6 +50,18 @@ def create_global_hato_routes(global_hato_controller):
         """Get corrales (groups) for a Global Hato snapshot."""
         return asyncio.run(global_hato_controller.get_corrales_endpoint(global_hato_id))
 
+    @global_hato_bp.route('/<int:global_hato_id>/estadisticas', methods=['GET'])
+    @require_auth
+    def get_statistics(global_hato_id):
+        """Get production histograms and percentiles for a snapshot (optionally one corral)."""
+        return asyncio.run(global_hato_controller.get_statistics_endpoint(global_hato_id))
+
+    @global_hato_bp.route('/<int:global_hato_id>/ranking', methods=['GET'])
+    @require_auth
+    def get_ranking(global_hato_id):
+        """Get the top or bottom N cows of every corral by one metric."""
+        return asyncio.run(global_hato_controller.get_ranking_endpoint(global_hato_id))
+
     @global_hato_bp.route('/<int:global_hato_id>/vacas', methods=['GET'])
     @require_auth
     def get_all_cows(global_hato_id):
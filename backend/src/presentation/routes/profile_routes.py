@@ -0,0 +1,25 @@
+"""Request profile routes (Admin only)."""
+from flask import Blueprint
+import asyncio
+from presentation.middleware.auth_middleware import require_auth, require_admin
+
+
+def create_profile_routes(profile_controller):
+    """Create profile routes with dependency injection."""
+    profile_bp = Blueprint('profiles', __name__, url_prefix='/api/profiles')
+
+    @profile_bp.route('', methods=['GET'])
+    @require_auth
+    @require_admin
+    def list_profiles():
+        """List recent request profiles (Admin only)."""
+        return asyncio.run(profile_controller.list_profiles())
+
+    @profile_bp.route('/<name>', methods=['GET'])
+    @require_auth
+    @require_admin
+    def download_profile(name):
+        """Download a saved request profile (Admin only)."""
+        return asyncio.run(profile_controller.download_profile(name))
+
+    return profile_bp
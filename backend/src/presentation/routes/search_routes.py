@@ -0,0 +1,29 @@
+"""Cross-snapshot search routes."""
+from flask import Blueprint
+import asyncio
+from presentation.middleware.auth_middleware import require_auth
+
+
+def create_search_routes(search_controller):
+    """Create search routes with dependency injection."""
+    search_bp = Blueprint('search', __name__, url_prefix='/api/search')
+
+    @search_bp.route('', methods=['GET'])
+    @require_auth
+    def search():
+        """Find animal numbers, selection numbers and groups containing q in the user's snapshots."""
+        return asyncio.run(search_controller.search_endpoint())
+
+    @search_bp.route('/autocomplete', methods=['GET'])
+    @require_auth
+    def autocomplete():
+        """Suggest animal numbers, selection numbers and groups starting with q."""
+        return asyncio.run(search_controller.search_endpoint(autocomplete=True))
+
+    @search_bp.route('/snapshots', methods=['GET'])
+    @require_auth
+    def snapshots():
+        """List the user's snapshots a term appears in."""
+        return asyncio.run(search_controller.snapshots_endpoint())
+
+    return search_bp
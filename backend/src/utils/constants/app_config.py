@@ -15,6 +15,9 @@ class AppConfig:
 
     # Database - NO DEFAULT (handled in db_config.py with fail-fast)
     DATABASE_URL = os.getenv("DATABASE_URL")
+    # Run create_all on startup. Disable when the schema is managed out of band
+    # so each gunicorn worker doesn't issue DDL checks on boot.
+    CREATE_TABLES_ON_STARTUP = os.getenv("CREATE_TABLES_ON_STARTUP", "True").lower() == "true"
 
     # JWT - NO DEFAULT (security-critical, handled in adapters/middleware)
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
@@ -30,6 +33,67 @@ class AppConfig:
     AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
     S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "vss-datasets")
 
+    # SQL instrumentation - requests over these limits are logged
+    SQL_SLOW_REQUEST_MS = float(os.getenv("SQL_SLOW_REQUEST_MS", "500"))
+    SQL_QUERY_COUNT_WARNING = int(os.getenv("SQL_QUERY_COUNT_WARNING", "20"))
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+
+    # tracemalloc instrumentation of every CSV ingest (admins can also request it per upload)
+    INGEST_MEMORY_TRACKING = os.getenv("INGEST_MEMORY_TRACKING", "False").lower() == "true"
+
+    # Staged ingestion: cows are committed in chunks, then the snapshot is published
+    INGEST_CHUNK_SIZE = int(os.getenv("INGEST_CHUNK_SIZE", "5000"))
+    # Snapshots still loading with no committed chunk for this long are considered abandoned and removed
+    INGEST_ABANDONED_LOAD_MINUTES = int(os.getenv("INGEST_ABANDONED_LOAD_MINUTES", "60"))
+
+    # Delta-encoded snapshots: store only cows that changed since the user's last full snapshot
+    SNAPSHOT_DELTA_ENCODING = os.getenv("SNAPSHOT_DELTA_ENCODING", "False").lower() == "true"
+    # Store a full copy instead when more than this fraction of the herd changed
+    SNAPSHOT_DELTA_MAX_RATIO = float(os.getenv("SNAPSHOT_DELTA_MAX_RATIO", "0.5"))
+    # Deltas per full snapshot before a new full copy is stored
+    SNAPSHOT_DELTA_KEYFRAME_INTERVAL = int(os.getenv("SNAPSHOT_DELTA_KEYFRAME_INTERVAL", "30"))
+
+    # Cold-tier archival: snapshots older than this (by fecha_snapshot) move to Parquet
+    ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "120"))
+    ARCHIVE_PARQUET_COMPRESSION = os.getenv("ARCHIVE_PARQUET_COMPRESSION", "zstd")
+    # Archived snapshots kept decoded in memory (pagination re-reads the same file)
+    ARCHIVE_CACHE_SIZE = int(os.getenv("ARCHIVE_CACHE_SIZE", "8"))
+
+    # Snapshot statistics: default and maximum number of histogram bins
+    STATISTICS_DEFAULT_BINS = int(os.getenv("STATISTICS_DEFAULT_BINS", "20"))
+    STATISTICS_MAX_BINS = int(os.getenv("STATISTICS_MAX_BINS", "200"))
+
+    # Per-corral rankings: default and maximum cows returned per corral
+    RANKING_DEFAULT_LIMIT = int(os.getenv("RANKING_DEFAULT_LIMIT", "10"))
+    RANKING_MAX_LIMIT = int(os.getenv("RANKING_MAX_LIMIT", "100"))
+
+    # /vacas range and IN-list filters: compiled predicates kept per filter shape
+    COW_FILTER_SHAPE_CACHE_SIZE = int(os.getenv("COW_FILTER_SHAPE_CACHE_SIZE", "256"))
+
+    # Cross-snapshot search: default and maximum number of results
+    SEARCH_DEFAULT_LIMIT = int(os.getenv("SEARCH_DEFAULT_LIMIT", "10"))
+    SEARCH_MAX_LIMIT = int(os.getenv("SEARCH_MAX_LIMIT", "50"))
+
+    # In-memory columnar cache of hot snapshots for /vacas (bytes per worker, 0 disables)
+    SNAPSHOT_CACHE_MAX_BYTES = int(os.getenv("SNAPSHOT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    SNAPSHOT_CACHE_HOT_READS = int(os.getenv("SNAPSHOT_CACHE_HOT_READS", "2"))
+
+    # Bulk re-scoring: cows sent to the model per batch
+    RESCORE_BATCH_SIZE = int(os.getenv("RESCORE_BATCH_SIZE", "5000"))
+
+    # Shared inference server (scripts/inference_server.py): Unix socket the workers send
+    # predictions to (unset: every process loads its own model), how long a request may
+    # wait for an answer, and how long to predict in process after the server failed
+    INFERENCE_SOCKET = os.getenv("INFERENCE_SOCKET") or None
+    # Shared secret clients must prove before the server unpickles anything - NO DEFAULT
+    # (security-critical; without it the workers ignore INFERENCE_SOCKET and predict in process)
+    INFERENCE_AUTHKEY = os.getenv("INFERENCE_AUTHKEY")
+    INFERENCE_TIMEOUT_SECONDS = float(os.getenv("INFERENCE_TIMEOUT_SECONDS", "30"))
+    INFERENCE_RETRY_SECONDS = float(os.getenv("INFERENCE_RETRY_SECONDS", "30"))
+    # Server side: wait this long for concurrent requests to join a batch, up to this many rows
+    INFERENCE_BATCH_WINDOW_MS = float(os.getenv("INFERENCE_BATCH_WINDOW_MS", "5"))
+    INFERENCE_MAX_BATCH_ROWS = int(os.getenv("INFERENCE_MAX_BATCH_ROWS", "10000"))
+
     # Celery
     CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
     CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://redis:6379/0")
@@ -41,6 +105,12 @@ class AppConfig:
     MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH", str(100 * 1024 * 1024)))  # 100MB default
     ALLOWED_EXTENSIONS = {"csv", "json", "xlsx", "parquet"}
 
+    # File Download - opt-in nginx offload via X-Accel-Redirect
+    # When enabled the backend only checks ownership and nginx serves the file
+    # from an internal location mapped to the uploads volume.
+    USE_X_ACCEL_REDIRECT = os.getenv("USE_X_ACCEL_REDIRECT", "False").lower() == "true"
+    X_ACCEL_REDIRECT_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX", "/protected-uploads/")
+
 
 # Export singleton instance
 app_config = AppConfig()
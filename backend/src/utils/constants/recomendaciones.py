@@ -0,0 +1,10 @@
+"""
+Cow recommendation constants.
+
+These are the classes predicted by the recommendation model (Cow.recomendacion).
+"""
+
+# Recommendation constants
+RECOMENDACION_EN_MONITOREO = 0
+RECOMENDACION_EN_PRODUCCION = 1
+RECOMENDACION_PREVIO_SECADO = 2
@@ -0,0 +1,16 @@
+"""
+Cross-snapshot search constants.
+
+Each kind is a cow field whose distinct values are indexed per snapshot.
+"""
+
+SEARCH_KIND_ANIMAL = "animal"
+SEARCH_KIND_SELECCION = "seleccion"
+SEARCH_KIND_GRUPO = "grupo"
+
+# Cow field indexed for each kind
+SEARCH_KIND_FIELDS = {
+    SEARCH_KIND_ANIMAL: "numero_animal",
+    SEARCH_KIND_SELECCION: "numero_seleccion",
+    SEARCH_KIND_GRUPO: "nombre_grupo",
+}
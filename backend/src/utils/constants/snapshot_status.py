@@ -0,0 +1,15 @@
+"""
+Global Hato snapshot status constants.
+
+A snapshot is created as "loading" while its cows are written in chunks and is
+only visible to readers once it is published as "ready". Old snapshots can be
+"archived": their cows move to a Parquet file in storage and are served from it.
+"""
+
+# Status constants
+SNAPSHOT_STATUS_LOADING = "loading"
+SNAPSHOT_STATUS_READY = "ready"
+SNAPSHOT_STATUS_ARCHIVED = "archived"
+
+# Statuses visible to readers
+SNAPSHOT_VISIBLE_STATUSES = (SNAPSHOT_STATUS_READY, SNAPSHOT_STATUS_ARCHIVED)
@@ -0,0 +1,30 @@
+"""Content hash of an uploaded cow row, to tell unchanged rows apart on re-upload."""
+import hashlib
+import json
+from typing import Any, Mapping
+
+
+def _normalize(value: Any) -> Any:
+    """Numbers compare by value (5 == 5.0), so the same export always hashes the same."""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    return str(value)
+
+
+def row_content_hash(row: Mapping[str, Any]) -> str:
+    """
+    Hash every field of a parsed row, including the model inputs that are not stored.
+
+    Args:
+        row: Parsed cow row (field -> value)
+
+    Returns:
+        32-character hex digest
+    """
+    payload = json.dumps(
+        sorted((key, _normalize(value)) for key, value in row.items()),
+        ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
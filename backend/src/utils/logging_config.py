@@ -0,0 +1,85 @@
+"""Structured, non-blocking logging configuration.
+
+Request threads only enqueue log records; a background QueueListener formats
+them (JSON by default) and writes them to stdout, so slow log I/O never holds
+up a request.
+"""
+import os
+import sys
+import copy
+import json
+import queue
+import atexit
+import random
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+
+# Attributes every LogRecord has; anything else came from `extra=` and is emitted as a field
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# Fraction of per-row debug records kept (e.g., one prediction log per 100 cows)
+ROW_LOG_SAMPLE_RATE = float(os.getenv("LOG_ROW_SAMPLE_RATE", "0.01"))
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as one JSON object per line, including `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that defers traceback formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the message now (args may be mutated later) but keep exc_info as-is;
+        # the queue is in-process, so there is no need to pickle the record.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def should_sample(rate: float = None) -> bool:
+    """Decide whether to emit a sampled per-row log record."""
+    rate = ROW_LOG_SAMPLE_RATE if rate is None else rate
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+def configure_logging() -> None:
+    """Route all logging through a queue to a background writer thread (idempotent)."""
+    global _listener
+    if _listener is not None:
+        return
+
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    if os.getenv("LOG_FORMAT", "json").lower() == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    root.handlers = [_NonBlockingQueueHandler(log_queue)]
+    root.setLevel(level)
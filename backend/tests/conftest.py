@@ -0,0 +1,147 @@
+import sys
+import os
+import asyncio
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from domain.entities import GlobalHato, Cow
+from infrastructure.database import Base, UserModel
+from infrastructure.adapters import GlobalHatoRepositoryAdapter, SnapshotRollupRepositoryAdapter
+from domain.usecases import CreateGlobalHato, ReplaceGlobalHato, GetHatoTrends
+
+
+class SQLiteDatabase:
+    """Minimal stand-in for DatabaseConfig bound to an in-memory SQLite engine."""
+
+    def __init__(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self._session_factory = sessionmaker(bind=self.engine)
+
+    def get_session(self):
+        return self._session_factory()
+
+
+class StubPredictionService:
+    """Predicts from dias_ordeno so the recommendation mix is known."""
+
+    def predict_cow_category(self, cow_data):
+        return None if cow_data['dias_ordeno'] % 4 == 3 else cow_data['dias_ordeno'] % 3
+
+    def predict_cows(self, cows_data):
+        return [self.predict_cow_category(cow_data) for cow_data in cows_data]
+
+    def is_available(self):
+        return True
+
+
+class CountingPredictionService:
+    """Predicts from dias_ordeno and remembers which animals were scored."""
+
+    def __init__(self):
+        self.scored = []
+
+    def predict_cow_category(self, cow_data):
+        self.scored.append(cow_data['numero_animal'])
+        return cow_data['dias_ordeno'] % 3
+
+    def predict_cows(self, cows_data):
+        return [self.predict_cow_category(cow_data) for cow_data in cows_data]
+
+    def is_available(self):
+        return True
+
+
+@pytest.fixture
+def db():
+    return SQLiteDatabase()
+
+
+@pytest.fixture
+def user_id(db):
+    session = db.get_session()
+    user = UserModel(name="Test", email="test@example.com", password="x", role=2)
+    session.add(user)
+    session.commit()
+    user_id = user.id
+    session.close()
+    return user_id
+
+
+@pytest.fixture
+def repository(db, user_id):
+    adapter = GlobalHatoRepositoryAdapter()
+    adapter.db = db
+    return adapter, user_id
+
+
+@pytest.fixture
+def delta_repository(repository):
+    repository[0].delta_encoding = True
+    return repository
+
+
+@pytest.fixture
+def rollups(db):
+    adapter = SnapshotRollupRepositoryAdapter()
+    adapter.db = db
+    return adapter
+
+
+@pytest.fixture
+def replace_usecases(delta_repository, rollups):
+    """Uploads (delta-encoded, with rollups) and replace uploads, scored by CountingPredictionService."""
+    global_hatos, user_id = delta_repository
+    predictions = CountingPredictionService()
+    create = CreateGlobalHato(global_hatos, predictions, snapshot_rollup_repository=rollups)
+    return {
+        "user_id": user_id,
+        "repository": global_hatos,
+        "predictions": predictions,
+        "create": create,
+        "replace": ReplaceGlobalHato(global_hatos, create),
+        "trends": GetHatoTrends(rollups),
+    }
+
+
+def make_herd(animals, bumped=()):
+    """Cow entities for animals; the bumped ones produce one litre more."""
+    return [
+        Cow(id=0, numero_animal=str(i), nombre_grupo=f"CORRAL {i % 3}",
+            produccion_leche_ayer=20.25 + i + (1 if i in bumped else 0), produccion_media_7dias=19.5,
+            estado_reproduccion="Vacía", dias_ordeno=i * 2, numero_seleccion=None, recomendacion=i % 3)
+        for i in animals
+    ]
+
+
+def create_snapshot(adapter, user_id, cows):
+    """Store cows as a snapshot through the repository adapter."""
+    global_hato = GlobalHato(
+        id=0, user_id=user_id, nombre="Hato", fecha_snapshot=datetime(2025, 1, 1),
+        total_animales=len(cows), grupos_detectados=3, created_at=datetime.now()
+    )
+    return asyncio.run(adapter.create_global_hato(global_hato, cows))
+
+
+def cow_rows(animals, dias=lambda i: i):
+    """Upload rows (cleaned CSV dicts) for animals, dias_ordeno from `dias`."""
+    return [
+        {"numero_animal": str(i), "nombre_grupo": f"CORRAL {i % 2}", "produccion_leche_ayer": 20.0 + i,
+         "produccion_media_7dias": 19.5, "estado_reproduccion": "Vacía", "dias_ordeno": dias(i),
+         "numero_seleccion": None, "numero_lactacion": 1}
+        for i in animals
+    ]
+
+
+def stored_herd(repository, global_hato_id, user_id):
+    """numero_animal -> (id, dias_ordeno, recomendacion) of a snapshot's cows."""
+    result = asyncio.run(repository.get_all_cows_by_snapshot(global_hato_id, user_id, limit=100))
+    return {cow.numero_animal: (cow.id, cow.dias_ordeno, cow.recomendacion) for cow in result["cows"]}
@@ -0,0 +1,51 @@
+import sys
+import os
+import asyncio
+import pytest
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from domain.usecases import GetCorralRanking
+from conftest import make_herd, create_snapshot
+
+
+def _expected(herd, metric, descending, limit):
+    ranking = {}
+    cows = [cow for cow in herd if cow.nombre_grupo and getattr(cow, metric) is not None]
+    for cow in sorted(cows, key=lambda c: (-getattr(c, metric) if descending else getattr(c, metric))):
+        ranking.setdefault(cow.nombre_grupo, [])
+        if len(ranking[cow.nombre_grupo]) < limit:
+            ranking[cow.nombre_grupo].append(cow.numero_animal)
+    return ranking
+
+
+def test_ranks_each_corral_of_full_and_delta_snapshots(delta_repository):
+    adapter, user_id = delta_repository
+    base_herd = make_herd(range(30))
+    base_herd[4].produccion_leche_ayer = None  # unknown values are not ranked
+    base_herd[5].nombre_grupo = None
+    base = create_snapshot(adapter, user_id, base_herd)
+    next_herd = make_herd(range(30), bumped={0, 3})
+    delta = create_snapshot(adapter, user_id, next_herd)
+    assert delta.base_snapshot_id == base.id
+
+    usecase = GetCorralRanking(adapter)
+    for global_hato_id, herd in ((base.id, base_herd), (delta.id, next_herd)):
+        for sort_order in ("asc", "desc"):
+            ranking = asyncio.run(usecase.execute(global_hato_id, user_id, "produccion_leche_ayer", sort_order, 4))
+            assert list(ranking) == ["CORRAL 0", "CORRAL 1", "CORRAL 2"]
+            assert {grupo: [r.cow.numero_animal for r in cows] for grupo, cows in ranking.items()} == \
+                _expected(herd, "produccion_leche_ayer", sort_order == "desc", 4)
+            assert all([r.rank for r in cows] == [1, 2, 3, 4] for cows in ranking.values())
+
+    ranking = asyncio.run(usecase.execute(base.id, user_id, "dias_ordeno", "asc", 2, ["CORRAL 2"]))
+    assert {grupo: [r.cow.dias_ordeno for r in cows] for grupo, cows in ranking.items()} == {"CORRAL 2": [4, 16]}
+
+    assert asyncio.run(usecase.execute(base.id, user_id + 1, "dias_ordeno")) is None
+    for sort_by, sort_order, limit in (("numero_animal", "asc", 5), ("dias_ordeno", "up", 5), ("dias_ordeno", "asc", 0)):
+        with pytest.raises(ValueError):
+            asyncio.run(usecase.execute(base.id, user_id, sort_by, sort_order, limit))
@@ -0,0 +1,59 @@
+import sys
+import os
+import asyncio
+import pytest
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from domain.entities import CowFilter
+from conftest import make_herd, create_snapshot
+
+
+def _matches(cow):
+    return (cow.dias_ordeno >= 20 and cow.produccion_leche_ayer <= 45.0
+            and cow.nombre_grupo in ("CORRAL 0", "CORRAL 2") and cow.recomendacion in (0, 1))
+
+
+def test_parse_validates_params():
+    cow_filter = CowFilter.from_params({
+        "dias_ordeno_min": ["200"], "produccion_leche_ayer_max": ["15.5"],
+        "nombre_grupo": ["B", "A", "B"], "recomendacion": ["2"], "page": ["3"],
+    })
+    assert cow_filter.ranges == (("produccion_leche_ayer", None, 15.5), ("dias_ordeno", 200, None))
+    assert cow_filter.in_lists == (("nombre_grupo", ("A", "B")), ("recomendacion", (2,)))
+    assert CowFilter.from_params({"page": ["1"]}).is_empty
+
+    for params in ({"dias_ordeno_min": ["x"]}, {"recomendacion": ["uno"]},
+                   {"dias_ordeno_min": ["10"], "dias_ordeno_max": ["5"]}):
+        with pytest.raises(ValueError):
+            CowFilter.from_params(params)
+
+
+def test_filters_full_and_delta_snapshots(delta_repository):
+    adapter, user_id = delta_repository
+    base_herd = make_herd(range(40))
+    base = create_snapshot(adapter, user_id, base_herd)
+    next_herd = make_herd(range(40), bumped={21, 30})
+    delta = create_snapshot(adapter, user_id, next_herd)
+    assert delta.base_snapshot_id == base.id
+
+    params = {"dias_ordeno_min": ["20"], "produccion_leche_ayer_max": ["45"],
+              "nombre_grupo": ["CORRAL 0", "CORRAL 2"], "recomendacion": ["0", "1"]}
+    cow_filter = CowFilter.from_params(params)
+    for global_hato_id, herd in ((base.id, base_herd), (delta.id, next_herd)):
+        result = asyncio.run(adapter.get_all_cows_by_snapshot(
+            global_hato_id, user_id, limit=100, sort_by="dias_ordeno", sort_order="asc", cow_filter=cow_filter
+        ))
+        expected = [cow.numero_animal for cow in herd if _matches(cow)]
+        assert [cow.numero_animal for cow in result["cows"]] == expected
+        assert result["total"] == len(expected)
+
+    # Same shape with other values reuses the compiled predicate
+    other = CowFilter.from_params({**params, "dias_ordeno_min": ["60"], "nombre_grupo": ["CORRAL 1"]})
+    assert other.shape == cow_filter.shape
+    assert asyncio.run(adapter.get_all_cows_by_snapshot(base.id, user_id, cow_filter=other))["total"] == 0
+    assert len(adapter._filter_shapes) == 1
@@ -0,0 +1,86 @@
+"""Partitioning runs against a real PostgreSQL (set TEST_POSTGRES_URL to a throwaway database)."""
+import sys
+import os
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine, text
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from infrastructure.database import Base
+from infrastructure.database.partitioning import CowsPartitionManager
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL not set")
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(POSTGRES_URL)
+    with engine.begin() as conn:
+        conn.execute(text("DROP SCHEMA public CASCADE"))
+        conn.execute(text("CREATE SCHEMA public"))
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (name, email, password, role) VALUES ('T', 't@example.com', 'x', 2)"))
+        for hato_id in (1, 2, 15):
+            conn.execute(text(
+                "INSERT INTO global_hato (id, user_id, nombre, fecha_snapshot, total_animales, grupos_detectados, created_at, status) "
+                "VALUES (:id, 1, 'Hato', :fecha, 3, 1, :fecha, 'ready')"
+            ), {"id": hato_id, "fecha": datetime(2025, 1, 1)})
+            for i in range(3):
+                conn.execute(text(
+                    "INSERT INTO cows (global_hato_id, numero_animal, nombre_grupo) VALUES (:id, :n, 'CORRAL 1')"
+                ), {"id": hato_id, "n": str(i)})
+    yield engine
+    engine.dispose()
+
+
+def test_convert_prunes_reads_and_drops_whole_partitions(engine):
+    manager = CowsPartitionManager(span=10, ahead=1)
+
+    with engine.begin() as conn:
+        assert manager.convert_to_partitioned(conn) is True
+        assert manager.convert_to_partitioned(conn) is False
+
+        names = [name for name, _, _ in manager.list_partitions(conn)]
+        assert names == ["cows_p0", "cows_p10", "cows_p20", "cows_default"]
+        assert conn.execute(text("SELECT count(*) FROM cows")).scalar() == 9
+
+        # Reads by snapshot touch a single partition
+        plan = "\n".join(row[0] for row in conn.execute(text("EXPLAIN SELECT * FROM cows WHERE global_hato_id = 2")))
+        assert "cows_p0" in plan and "cows_p10" not in plan
+
+        # New ids keep coming from the same sequence
+        new_id = conn.execute(text(
+            "INSERT INTO cows (global_hato_id, numero_animal) VALUES (15, 'x') RETURNING id"
+        )).scalar()
+        assert new_id > 9
+
+    with engine.begin() as conn:
+        assert manager.drop_partitions_before(conn, snapshot_id=15) == ["cows_p0"]
+        assert conn.execute(text("SELECT count(*) FROM global_hato")).scalar() == 1
+        assert conn.execute(text("SELECT count(*) FROM cows")).scalar() == 4
+
+
+def test_ensure_moves_rows_out_of_the_default_partition(engine):
+    manager = CowsPartitionManager(span=10, ahead=0)
+
+    with engine.begin() as conn:
+        manager.convert_to_partitioned(conn)
+        conn.execute(text(
+            "INSERT INTO global_hato (id, user_id, nombre, fecha_snapshot, total_animales, grupos_detectados, created_at, status) "
+            "VALUES (25, 1, 'Hato', now(), 1, 1, now(), 'ready')"
+        ))
+        conn.execute(text("INSERT INTO cows (global_hato_id, numero_animal) VALUES (25, 'late')"))
+        assert conn.execute(text("SELECT count(*) FROM cows_default")).scalar() == 1
+
+        assert manager.ensure_partitions(conn) == ["cows_p20"]
+        assert conn.execute(text("SELECT count(*) FROM cows_default")).scalar() == 0
+        assert conn.execute(text("SELECT count(*) FROM cows_p20")).scalar() == 1
@@ -0,0 +1,89 @@
+import sys
+import os
+import asyncio
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from infrastructure.database import GlobalHatoModel, CowModel
+from conftest import make_herd, create_snapshot
+
+
+def _stored_rows(adapter, global_hato_id):
+    session = adapter.db.get_session()
+    try:
+        return session.query(CowModel).filter(CowModel.global_hato_id == global_hato_id).count()
+    finally:
+        session.close()
+
+
+def _reads(adapter, global_hato_id, user_id):
+    cows = asyncio.run(adapter.get_all_cows_by_snapshot(global_hato_id, user_id, limit=100))["cows"]
+    return {
+        "cows": sorted((c.numero_animal, c.produccion_leche_ayer, c.global_hato_id) for c in cows),
+        "corrales": sorted(asyncio.run(adapter.get_corrales_by_snapshot(global_hato_id, user_id)), key=lambda c: c.nombre_grupo),
+        "group": sorted(c.numero_animal for c in asyncio.run(adapter.get_cows_by_group(global_hato_id, user_id, "CORRAL 1"))),
+    }
+
+
+def test_delta_snapshot_reads_like_a_full_copy(delta_repository):
+    adapter, user_id = delta_repository
+    base = create_snapshot(adapter, user_id, make_herd(range(30)))
+
+    # Animals 0-1 left, 30-31 arrived, 5-6 changed production
+    next_day = make_herd(range(2, 32), bumped={5, 6})
+    delta = create_snapshot(adapter, user_id, next_day)
+    assert delta.base_snapshot_id == base.id
+    assert _stored_rows(adapter, delta.id) == 6  # 2 changed + 2 new + 2 tombstones
+
+    adapter.delta_encoding = False
+    full = create_snapshot(adapter, user_id, next_day)
+    assert full.base_snapshot_id is None
+
+    delta_reads = _reads(adapter, delta.id, user_id)
+    full_reads = _reads(adapter, full.id, user_id)
+    assert delta_reads["corrales"] == full_reads["corrales"]
+    assert delta_reads["group"] == full_reads["group"]
+    assert [c[:2] for c in delta_reads["cows"]] == [c[:2] for c in full_reads["cows"]]
+    assert {c[2] for c in delta_reads["cows"]} == {delta.id}
+
+
+def test_deleting_base_materializes_deltas(delta_repository):
+    adapter, user_id = delta_repository
+    base = create_snapshot(adapter, user_id, make_herd(range(30)))
+    delta = create_snapshot(adapter, user_id, make_herd(range(2, 32), bumped={5}))
+    before = _reads(adapter, delta.id, user_id)
+
+    asyncio.run(adapter.delete(base.id, user_id))
+
+    assert asyncio.run(adapter.find_by_id(delta.id)).base_snapshot_id is None
+    assert _stored_rows(adapter, delta.id) == 30
+    assert _reads(adapter, delta.id, user_id) == before
+
+
+def test_base_with_deltas_cannot_be_deleted_directly(delta_repository):
+    adapter, user_id = delta_repository
+    base = create_snapshot(adapter, user_id, make_herd(range(30)))
+    delta = create_snapshot(adapter, user_id, make_herd(range(2, 32), bumped={5}))
+
+    # A delete that skips materialization fails instead of cascading the delta away
+    with adapter.db.engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA foreign_keys = ON")
+        with pytest.raises(IntegrityError):
+            conn.execute(delete(GlobalHatoModel).where(GlobalHatoModel.id == base.id))
+        conn.rollback()
+    assert asyncio.run(adapter.find_by_id(delta.id)).base_snapshot_id == base.id
+
+
+def test_large_changes_store_a_full_copy(delta_repository):
+    adapter, user_id = delta_repository
+    create_snapshot(adapter, user_id, make_herd(range(30)))
+    snapshot = create_snapshot(adapter, user_id, make_herd(range(30), bumped=set(range(20))))
+    assert snapshot.base_snapshot_id is None
+    assert _stored_rows(adapter, snapshot.id) == 30
@@ -0,0 +1,89 @@
+import sys
+import os
+import asyncio
+from datetime import date
+import pytest
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from domain.usecases import CreateGlobalHato, DeleteGlobalHato, GetHatoTrends, GetCorralSeries, RebuildSnapshotRollups
+from conftest import StubPredictionService
+
+
+@pytest.fixture
+def usecases(repository, rollups):
+    global_hatos, user_id = repository
+    return {
+        "user_id": user_id,
+        "create": CreateGlobalHato(global_hatos, StubPredictionService(), snapshot_rollup_repository=rollups),
+        "delete": DeleteGlobalHato(global_hatos, rollups),
+        "trends": GetHatoTrends(rollups),
+        "corrales": GetCorralSeries(rollups),
+        "rebuild": RebuildSnapshotRollups(global_hatos, rollups),
+        "rollups": rollups,
+    }
+
+
+def _cows(n, leche):
+    return [
+        {"numero_animal": str(i), "nombre_grupo": f"CORRAL {i % 2}", "produccion_leche_ayer": leche,
+         "produccion_media_7dias": None if i == 0 else leche, "estado_reproduccion": "Vacía", "dias_ordeno": i}
+        for i in range(n)
+    ]
+
+
+def test_trends_follow_uploads_and_deletes(usecases):
+    user_id = usecases["user_id"]
+    first = asyncio.run(usecases["create"].execute(user_id, "Enero", date(2025, 1, 10), _cows(12, 20.0)))
+    second = asyncio.run(usecases["create"].execute(user_id, "Febrero", date(2025, 2, 10), _cows(8, 25.5)))
+
+    trends = asyncio.run(usecases["trends"].execute(user_id))
+    assert [t.global_hato_id for t in trends] == [first.id, second.id]
+    january = trends[0]
+    assert (january.total_animales, january.grupos_detectados) == (12, 2)
+    assert (january.produccion_total, january.produccion_promedio, january.produccion_promedio_7dias) == (240.0, 20.0, 20.0)
+    # dias_ordeno 3, 7, 11 are unscored; the rest split by dias_ordeno % 3
+    assert (january.en_monitoreo, january.en_produccion, january.previo_secado, january.sin_recomendacion) == (3, 3, 3, 3)
+
+    window = asyncio.run(usecases["trends"].execute(user_id, "2025-02-01", "2025-02-28"))
+    assert [t.global_hato_id for t in window] == [second.id]
+
+    with pytest.raises(ValueError):
+        asyncio.run(usecases["trends"].execute(user_id, "2025-03-01", "2025-02-01"))
+
+    asyncio.run(usecases["delete"].execute(first.id, user_id))
+    assert [t.global_hato_id for t in asyncio.run(usecases["trends"].execute(user_id))] == [second.id]
+
+
+def test_rebuild_fills_missing_rollups(usecases):
+    user_id = usecases["user_id"]
+    created = asyncio.run(usecases["create"].execute(user_id, "Enero", date(2025, 1, 10), _cows(12, 20.0)))
+    expected = asyncio.run(usecases["trends"].execute(user_id))
+    asyncio.run(usecases["rollups"].delete(created.id))
+
+    assert asyncio.run(usecases["rebuild"].execute()) == [created.id]
+    assert asyncio.run(usecases["trends"].execute(user_id)) == expected
+
+
+def test_corral_series_per_group(usecases):
+    user_id = usecases["user_id"]
+    first = asyncio.run(usecases["create"].execute(user_id, "Enero", date(2025, 1, 10), _cows(12, 20.0)))
+    second = asyncio.run(usecases["create"].execute(user_id, "Febrero", date(2025, 2, 10), _cows(8, 25.5)))
+
+    series = asyncio.run(usecases["corrales"].execute(user_id))
+    assert list(series) == ["CORRAL 0", "CORRAL 1"]
+    assert [p.global_hato_id for p in series["CORRAL 1"]] == [first.id, second.id]
+    assert [p.total_animales for p in series["CORRAL 1"]] == [6, 4]
+    assert series["CORRAL 1"][1].produccion_total == 102.0
+
+    only = asyncio.run(usecases["corrales"].execute(user_id, "2025-02-01", None, "CORRAL 0"))
+    assert list(only) == ["CORRAL 0"] and [p.global_hato_id for p in only["CORRAL 0"]] == [second.id]
+
+    # Dropped corral rows are found by the rebuild
+    asyncio.run(usecases["rollups"].delete(first.id))
+    assert asyncio.run(usecases["rebuild"].execute()) == [first.id]
+    assert [p.global_hato_id for p in asyncio.run(usecases["corrales"].execute(user_id))["CORRAL 0"]] == [first.id, second.id]
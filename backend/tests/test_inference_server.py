@@ -0,0 +1,93 @@
+import sys
+import os
+import threading
+import pytest
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from infrastructure.ml.services import PredictionService, InferenceClient, InferenceUnavailableError
+from infrastructure.ml.services.inference_server import InferenceServer
+
+
+AUTHKEY = "test-secret"
+
+
+class SumModel:
+    """sklearn-like model: predicts the sum of the features modulo 3."""
+
+    def predict(self, features):
+        return features.sum(axis=1).astype(int) % 3
+
+
+class RecordingPredictionService:
+    """Server-side service that remembers the size of every batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    def predict_batch(self, features):
+        self.batches.append(len(features))
+        return [int(sum(row)) % 3 for row in features]
+
+
+@pytest.fixture
+def server(tmp_path):
+    service = RecordingPredictionService()
+    # Wide window so the concurrent requests below land in the same batch
+    server = InferenceServer(service, str(tmp_path / "inference.sock"), AUTHKEY.encode(), batch_window=0.2)
+    server.start()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.stop()
+    thread.join(timeout=5)
+
+
+def test_concurrent_requests_share_a_batch(server):
+    client = PredictionService(model_dir="/nonexistent", inference_socket=server.socket_path, authkey=AUTHKEY)
+    results = {}
+
+    def predict(worker):
+        rows = [[worker, i] + [0] * 6 for i in range(worker + 1)]
+        results[worker] = client.predict_batch(rows)
+
+    threads = [threading.Thread(target=predict, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == {worker: [(worker + i) % 3 for i in range(worker + 1)] for worker in range(4)}
+    assert sum(server.prediction_service.batches) == 10
+    assert len(server.prediction_service.batches) < 4
+    # The model was never loaded in the client, which still reports predictions as available
+    assert client.model is None and client.is_available()
+
+
+def test_falls_back_in_process_when_server_is_down(tmp_path):
+    service = PredictionService(
+        model_dir="/nonexistent", inference_socket=str(tmp_path / "missing.sock"), authkey=AUTHKEY
+    )
+    service.model, service.model_type, service._model_loaded = SumModel(), 'sklearn', True
+
+    assert service.predict_cows([{"numero_lactacion": 2, "dias_ordeno": 2}, {"dias_ordeno": None}]) == [1, 0]
+    # The server is not retried until retry_after has passed
+    assert not service._use_server()
+
+
+def test_missing_authkey_predicts_in_process(tmp_path):
+    service = PredictionService(model_dir="/nonexistent", inference_socket=str(tmp_path / "inference.sock"), authkey="")
+    assert service.client is None and not service._use_server()
+
+
+def test_clients_without_the_authkey_are_rejected(server):
+    assert oct(os.stat(server.socket_path).st_mode & 0o777) == oct(0o660)
+    with pytest.raises(InferenceUnavailableError):
+        InferenceClient(server.socket_path, b"wrong").predict_batch([[0] * 8])
+    assert server.prediction_service.batches == []
+    # The server keeps serving authenticated clients
+    assert InferenceClient(server.socket_path, AUTHKEY.encode()).predict_batch([[1] * 8]) == [2]
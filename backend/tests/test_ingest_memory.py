@@ -0,0 +1,44 @@
+import sys
+import os
+import tracemalloc
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from infrastructure.monitoring import ingest_stage, track_memory, current_memory_tracker
+
+
+def _allocate_rows(n):
+    return [{"numero_animal": str(i), "nombre_grupo": "CORRAL 1"} for i in range(n)]
+
+
+def test_ingest_stages_report_peak_memory_and_sites():
+    with track_memory() as tracker:
+        with ingest_stage('clean', rows=5000):
+            rows = _allocate_rows(5000)
+        with ingest_stage('predict', rows=5000):
+            del rows
+
+    report = tracker.report()
+    clean, predict = report["stages"]
+
+    assert clean["stage"] == "clean"
+    assert clean["peak_bytes"] > 500_000
+    assert clean["retained_bytes"] > 0
+    assert clean["peak_bytes_per_1k_rows"] == round(clean["peak_bytes"] * 1000 / 5000)
+    assert any(__file__ in site["site"] for site in clean["top_allocations"])
+    assert predict["retained_bytes"] < 0
+    assert report["peak_bytes"] >= clean["peak_bytes"]
+
+    # Tracing is switched off again once the upload is done
+    assert current_memory_tracker() is None
+    assert not tracemalloc.is_tracing()
+
+
+def test_ingest_stage_without_tracker_does_not_trace():
+    with ingest_stage('parse', rows=10):
+        _allocate_rows(10)
+
+    assert not tracemalloc.is_tracing()
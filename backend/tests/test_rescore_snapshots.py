@@ -0,0 +1,60 @@
+import sys
+import os
+import asyncio
+from datetime import date
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from domain.usecases import RebuildSnapshotRollups, RescoreSnapshots
+from infrastructure.ml.services import FEATURE_FIELDS
+from conftest import cow_rows, stored_herd
+
+
+class BatchPredictionService:
+    """New model: predicts from numero_lactacion, fails on 7 lactations."""
+
+    def __init__(self):
+        self.batches = []
+
+    def predict_batch(self, features):
+        self.batches.append(len(features))
+        lactacion = FEATURE_FIELDS.index("numero_lactacion")
+        return [None if row[lactacion] == 7 else int(row[lactacion]) % 2 for row in features]
+
+
+def test_rescore_updates_stored_and_inherited_cows(replace_usecases):
+    user_id = replace_usecases["user_id"]
+    repository = replace_usecases["repository"]
+    rows = cow_rows(range(10))
+    for i, row in enumerate(rows):
+        row["numero_lactacion"] = i
+    base = asyncio.run(replace_usecases["create"].execute(user_id, "Enero", date(2025, 1, 10), rows))
+    # Same herd one day later: a delta that inherits every cow from the base
+    delta = asyncio.run(replace_usecases["create"].execute(user_id, "Febrero", date(2025, 2, 10), rows))
+    assert delta.base_snapshot_id == base.id
+    before = stored_herd(repository, delta.id, user_id)
+
+    predictions = BatchPredictionService()
+    rebuild = RebuildSnapshotRollups(repository, replace_usecases["trends"].snapshot_rollup_repository)
+    report = asyncio.run(RescoreSnapshots(repository, predictions, rebuild).execute(batch_size=4))
+
+    assert predictions.batches == [4, 4, 2]
+    assert report.snapshots == 2
+    assert report.rows == 10
+    for herd in (stored_herd(repository, base.id, user_id), stored_herd(repository, delta.id, user_id)):
+        expected = {str(i): i % 2 for i in range(10)}
+        # A failed prediction keeps the stored recomendacion
+        expected["7"] = before["7"][2]
+        assert {animal: cow[2] for animal, cow in herd.items()} == expected
+    assert report.changed == sum(1 for i in range(10) if i != 7 and before[str(i)][2] != i % 2)
+
+    # Trend rollups of both snapshots follow the new recomendaciones
+    trends = asyncio.run(replace_usecases["trends"].execute(user_id))
+    assert [(t.en_produccion, t.en_monitoreo, t.previo_secado) for t in trends] == [(5, 5, 0), (5, 5, 0)]
+
+    # Nothing changes on a second run
+    assert asyncio.run(RescoreSnapshots(repository, predictions).execute()).changed == 0
@@ -0,0 +1,80 @@
+import sys
+import os
+import io
+import gzip
+import pytest
+
+moto = pytest.importorskip("moto")
+boto3 = pytest.importorskip("boto3")
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["AWS_REGION"] = "us-east-1"
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from infrastructure.storage.s3_storage_service import S3StorageService
+
+BUCKET = "vss-test-bucket"
+
+
+@pytest.fixture
+def s3_service():
+    with moto.mock_aws():
+        service = S3StorageService()
+        service.bucket_name = BUCKET
+        service.region = "us-east-1"
+        service.endpoint_url = None
+        service.part_size = 5 * 1024 * 1024  # S3 minimum part size
+        service.max_concurrency = 4
+        service._client = None  # Force a client bound to the mocked AWS
+        service.s3_client.create_bucket(Bucket=BUCKET)
+        yield service
+        service._client = None
+
+
+def test_client_is_created_lazily(monkeypatch):
+    monkeypatch.setattr(S3StorageService, "_instance", None)
+    service = S3StorageService()
+    assert service._client is None
+
+
+def test_upload_stream_multipart_counts_bytes(s3_service):
+    payload = b"Numero del animal,Nombre del grupo\n" + b"1234,CORRAL 1\n" * 900_000
+    stream = io.BytesIO(payload)
+
+    blob_route, size = s3_service.upload_stream(stream, "hato.csv", subfolder="global_hatos")
+
+    assert size == len(payload)
+    assert blob_route.startswith(f"s3://{BUCKET}/global_hatos/")
+    assert blob_route.endswith("_hato.csv")
+    assert s3_service.file_exists(blob_route)
+
+    # Larger than one part, so the upload went through multipart
+    key = blob_route[len(f"s3://{BUCKET}/"):]
+    head = s3_service.s3_client.head_object(Bucket=BUCKET, Key=key)
+    assert "-" in head["ETag"]
+
+    with s3_service.open_file(blob_route) as f:
+        assert f.read() == payload
+
+
+def test_compressed_objects_are_decompressed_on_read(s3_service):
+    payload = b"a,b\n1,2\n"
+    blob_route, _ = s3_service.upload_stream(io.BytesIO(gzip.compress(payload)), "hato.csv.gz")
+
+    assert s3_service.is_compressed(blob_route)
+    assert s3_service.get_download_name(blob_route).endswith("_hato.csv")
+    assert s3_service.open_file(blob_route).read() == payload
+
+
+def test_delete_and_missing_objects(s3_service):
+    blob_route, _ = s3_service.upload_stream(io.BytesIO(b"x"), "hato.csv")
+
+    assert s3_service.delete_file(blob_route) is True
+    assert s3_service.file_exists(blob_route) is False
+    assert s3_service.open_file(blob_route) is None
+    assert s3_service.download_file(blob_route) is None
+    assert s3_service.file_exists("/uploads/global_hatos/file.csv") is False
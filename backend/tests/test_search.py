@@ -0,0 +1,94 @@
+import sys
+import os
+import asyncio
+from datetime import date
+import pytest
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from infrastructure.database import UserModel
+from infrastructure.adapters import SearchIndexRepositoryAdapter
+from domain.usecases import CreateGlobalHato, DeleteGlobalHato, SearchCows, FindTermSnapshots, RebuildSearchIndex
+from conftest import StubPredictionService
+
+
+@pytest.fixture
+def usecases(repository):
+    global_hatos, user_id = repository
+    session = global_hatos.db.get_session()
+    other = UserModel(name="Other", email="other@example.com", password="x", role=2)
+    session.add(other)
+    session.commit()
+    user_ids = [user_id, other.id]
+    session.close()
+
+    index = SearchIndexRepositoryAdapter()
+    index.db = global_hatos.db
+    return {
+        "user_ids": user_ids,
+        "create": CreateGlobalHato(global_hatos, StubPredictionService(), search_index_repository=index),
+        "delete": DeleteGlobalHato(global_hatos, search_index_repository=index),
+        "search": SearchCows(index),
+        "snapshots": FindTermSnapshots(index),
+        "rebuild": RebuildSearchIndex(global_hatos, index),
+        "index": index,
+    }
+
+
+def _cows(numeros, grupo):
+    return [
+        {"numero_animal": numero, "nombre_grupo": grupo, "produccion_leche_ayer": 20.0,
+         "produccion_media_7dias": 20.0, "estado_reproduccion": "Vacía", "dias_ordeno": 10,
+         "numero_seleccion": f"S-{numero}"}
+        for numero in numeros
+    ]
+
+
+def test_search_across_snapshots(usecases):
+    user_id, other_user = usecases["user_ids"]
+    create, search = usecases["create"], usecases["search"]
+    enero = asyncio.run(create.execute(user_id, "Enero", date(2025, 1, 10), _cows(["1201", "1202", "3120"], "Corral Norte")))
+    febrero = asyncio.run(create.execute(user_id, "Febrero", date(2025, 2, 10), _cows(["1201", "4100"], "CORRAL 50%")))
+    asyncio.run(create.execute(other_user, "Otro", date(2025, 1, 1), _cows(["1299"], "Corral Norte")))
+
+    # Prefix autocomplete, scoped to the user and counted per snapshot
+    matches = asyncio.run(search.execute(user_id, "12", "animal", autocomplete=True))
+    assert [(m.term, m.snapshots, m.last_fecha_snapshot) for m in matches] == [
+        ("1201", 2, date(2025, 2, 10)), ("1202", 1, date(2025, 1, 10))
+    ]
+
+    # Substring search over every kind, case-insensitive
+    assert [(m.kind, m.term) for m in asyncio.run(search.execute(user_id, "120"))] == [
+        ("animal", "1201"), ("animal", "1202"), ("animal", "3120"),
+        ("seleccion", "S-1201"), ("seleccion", "S-1202"), ("seleccion", "S-3120"),
+    ]
+    assert [m.term for m in asyncio.run(search.execute(user_id, "corral n"))] == ["Corral Norte"]
+
+    # Wildcards are literal
+    assert [m.term for m in asyncio.run(search.execute(user_id, "50%"))] == ["CORRAL 50%"]
+    assert asyncio.run(search.execute(user_id, "_", autocomplete=True)) == []
+
+    occurrences = asyncio.run(usecases["snapshots"].execute(user_id, "animal", "1201"))
+    assert [o.global_hato_id for o in occurrences] == [febrero.id, enero.id]
+
+    with pytest.raises(ValueError):
+        asyncio.run(search.execute(user_id, "  "))
+    with pytest.raises(ValueError):
+        asyncio.run(search.execute(user_id, "12", "vaca"))
+
+    asyncio.run(usecases["delete"].execute(febrero.id, user_id))
+    assert [m.snapshots for m in asyncio.run(search.execute(user_id, "1201", "animal"))] == [1]
+
+
+def test_rebuild_indexes_missing_snapshots(usecases):
+    user_id = usecases["user_ids"][0]
+    created = asyncio.run(usecases["create"].execute(user_id, "Enero", date(2025, 1, 10), _cows(["7701"], "A")))
+    asyncio.run(usecases["index"].delete(created.id))
+    assert asyncio.run(usecases["search"].execute(user_id, "770")) == []
+
+    assert asyncio.run(usecases["rebuild"].execute()) == [created.id]
+    assert [m.term for m in asyncio.run(usecases["search"].execute(user_id, "770"))] == ["7701", "S-7701"]
@@ -0,0 +1,99 @@
+import sys
+import os
+import asyncio
+import pytest
+
+pytest.importorskip("pyarrow")
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from domain.entities import Cow, CowFilter
+from infrastructure.database import CowModel
+from infrastructure.storage import SnapshotArchive
+from utils.constants.snapshot_status import SNAPSHOT_STATUS_ARCHIVED
+from conftest import create_snapshot
+
+
+@pytest.fixture
+def repository(repository):
+    repository[0].archive = SnapshotArchive(cache_size=2)
+    return repository
+
+
+def _create_snapshot(adapter, user_id):
+    cows = [
+        Cow(id=0, numero_animal=str(1000 + i), nombre_grupo=f"CORRAL {i % 3}" if i % 10 else None,
+            produccion_leche_ayer=None if i % 7 == 0 else 20.0 + i, produccion_media_7dias=19.5 + i,
+            estado_reproduccion="Preñada" if i % 2 else "Vacía", dias_ordeno=i * 3,
+            numero_seleccion=None, recomendacion=None if i % 5 == 0 else i % 3,
+            content_hash=f"{i:032x}", numero_lactacion=None if i % 4 == 0 else float(i % 4))
+        for i in range(40)
+    ]
+    return create_snapshot(adapter, user_id, cows).id
+
+
+def _reads(adapter, global_hato_id, user_id):
+    queries = [
+        {},
+        {"page": 2, "limit": 7},
+        {"sort_by": "numero_animal", "sort_order": "desc", "limit": 50},
+        {"sort_by": "dias_ordeno", "sort_order": "asc", "page": 3, "limit": 9},
+        {"search": "preñ", "nombre_grupo": "CORRAL 1"},
+        {"recomendacion": 2, "limit": 50},
+        {"cow_filter": CowFilter.from_params({
+            "dias_ordeno_min": ["30"], "produccion_leche_ayer_max": ["55"], "nombre_grupo": ["CORRAL 0", "CORRAL 2"],
+        }), "sort_by": "produccion_leche_ayer", "sort_order": "desc", "limit": 50},
+    ]
+    corrales = asyncio.run(adapter.get_corrales_by_snapshot(global_hato_id, user_id))
+    return {
+        "corrales": sorted(corrales, key=lambda c: c.nombre_grupo),
+        "group": asyncio.run(adapter.get_cows_by_group(global_hato_id, user_id, "CORRAL 2")),
+        # Column values come in no particular order
+        "values": sorted(zip(*asyncio.run(adapter.get_column_values(
+            global_hato_id, user_id, ["produccion_leche_ayer", "dias_ordeno"], "CORRAL 1"
+        )).values()), key=lambda pair: (pair[1], pair[0] is None, pair[0] or 0)),
+        "ranking": asyncio.run(adapter.get_ranked_cows_by_group(
+            global_hato_id, user_id, "produccion_leche_ayer", descending=True, limit=3
+        )),
+        "pages": [
+            asyncio.run(adapter.get_all_cows_by_snapshot(global_hato_id, user_id, **query))
+            for query in queries
+        ],
+    }
+
+
+def test_archived_snapshot_reads_match_database(repository):
+    adapter, user_id = repository
+    global_hato_id = _create_snapshot(adapter, user_id)
+    before = _reads(adapter, global_hato_id, user_id)
+
+    assert asyncio.run(adapter.archive_snapshot(global_hato_id))
+
+    global_hato = asyncio.run(adapter.find_by_id(global_hato_id))
+    assert global_hato.status == SNAPSHOT_STATUS_ARCHIVED
+    assert global_hato.archive_route.endswith(".parquet")
+    session = adapter.db.get_session()
+    assert session.query(CowModel).filter(CowModel.global_hato_id == global_hato_id).count() == 0
+    session.close()
+
+    assert _reads(adapter, global_hato_id, user_id) == before
+    # Hashes and model inputs are archived too
+    stored = adapter.archive.load(global_hato.archive_route)
+    assert stored["content_hash"].tolist()[:2] == [f"{0:032x}", f"{1:032x}"]
+    assert stored["numero_lactacion"].isna().tolist()[:2] == [True, False]
+    assert stored["numero_lactacion"].tolist()[1:4] == [1.0, 2.0, 3.0]
+
+    # NULLs sort like PostgreSQL: first when descending, last when ascending
+    descending = asyncio.run(adapter.get_all_cows_by_snapshot(
+        global_hato_id, user_id, sort_by="produccion_leche_ayer", sort_order="desc", limit=50
+    ))["cows"]
+    assert [cow.id for cow in descending[:6]] == [1, 8, 15, 22, 29, 36]
+    assert descending[6].produccion_leche_ayer == 59.0
+
+    # Already archived
+    assert not asyncio.run(adapter.archive_snapshot(global_hato_id))
+    adapter.archive.delete(global_hato.archive_route)
@@ -0,0 +1,129 @@
+import sys
+import os
+import asyncio
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from domain.entities import CowFilter
+from infrastructure.cache import SnapshotCache, SnapshotColumns
+from conftest import make_herd, create_snapshot
+
+
+def _page(adapter, global_hato_id, user_id, **kwargs):
+    result = asyncio.run(adapter.get_all_cows_by_snapshot(global_hato_id, user_id, **kwargs))
+    return result["total"], result["pages"], [(c.id, c.numero_animal, c.produccion_leche_ayer) for c in result["cows"]]
+
+
+def test_cached_reads_match_sql(delta_repository):
+    adapter, user_id = delta_repository
+    herd = make_herd(range(60), bumped={7, 8})
+    # NULLs in filtered and sorted columns; mixed-case and accented names sort by code point
+    herd[3].produccion_media_7dias = None
+    herd[5].nombre_grupo = None
+    herd[9].produccion_leche_ayer = None
+    herd[11].numero_seleccion = "S-1"
+    herd[13].nombre_grupo = "corral 1"
+    herd[14].nombre_grupo = "Órden"
+    base = create_snapshot(adapter, user_id, herd)
+    delta = create_snapshot(adapter, user_id, make_herd(range(60), bumped={12, 40}))
+
+    reads = [
+        {},
+        {"page": 3, "limit": 7},
+        {"sort_by": "produccion_leche_ayer", "sort_order": "desc", "limit": 15},
+        {"sort_by": "produccion_leche_ayer", "sort_order": "asc", "page": 4, "limit": 15},
+        {"sort_by": "numero_animal", "sort_order": "desc", "limit": 60},
+        {"sort_by": "dias_ordeno", "sort_order": "desc", "page": 2, "limit": 25},
+        {"search": "corral 1", "sort_by": "numero_animal", "sort_order": "asc"},
+        {"search": "5", "limit": 50},
+        {"nombre_grupo": "CORRAL 2", "recomendacion": 2},
+        # Ties on the sort column are broken by id
+        {"sort_by": "nombre_grupo", "sort_order": "asc", "page": 2, "limit": 9},
+        {"sort_by": "nombre_grupo", "sort_order": "desc", "limit": 60},
+        {"sort_by": "estado_reproduccion", "sort_order": "desc", "page": 3, "limit": 11},
+        {"cow_filter": CowFilter.from_params({
+            "dias_ordeno_min": ["10"], "produccion_leche_ayer_max": ["60"],
+            "nombre_grupo": ["CORRAL 0", "CORRAL 1"], "recomendacion": ["0", "1"],
+        }), "limit": 60},
+    ]
+
+    adapter.cache = SnapshotCache(max_bytes=0)
+    expected = [_page(adapter, snapshot.id, user_id, **read) for snapshot in (base, delta) for read in reads]
+
+    adapter.cache = SnapshotCache(max_bytes=1024 * 1024, hot_reads=1)
+    cached = [_page(adapter, snapshot.id, user_id, **read) for snapshot in (base, delta) for read in reads]
+    assert adapter.cache.nbytes > 0
+    assert cached == expected
+
+    # Deleting the snapshot frees its entry
+    asyncio.run(adapter.delete(delta.id, user_id))
+    assert _page(adapter, delta.id, user_id) == (0, 0, [])
+    assert asyncio.run(adapter.get_all_cows_by_snapshot(base.id, user_id))["total"] == 60
+
+
+def test_nulls_sort_like_postgres():
+    rows = [
+        {"id": i, "numero_animal": str(i), "nombre_grupo": grupo, "produccion_leche_ayer": leche,
+         "produccion_media_7dias": None, "estado_reproduccion": None, "dias_ordeno": 1,
+         "numero_seleccion": None, "recomendacion": None}
+        for i, grupo, leche in ((1, "B", 10.0), (2, None, None), (3, "A", 30.0), (4, "B", None))
+    ]
+    columns = SnapshotColumns.from_rows(9, rows)
+
+    def order(**kwargs):
+        return [cow["id"] for cow in columns.query(limit=10, **kwargs)["cows"]]
+
+    assert order(sort_by="produccion_leche_ayer", sort_order="asc") == [1, 3, 2, 4]
+    assert order(sort_by="produccion_leche_ayer", sort_order="desc") == [2, 4, 3, 1]
+    assert order(sort_by="nombre_grupo", sort_order="asc") == [3, 1, 4, 2]
+    assert order(sort_by="nombre_grupo", sort_order="desc") == [2, 1, 4, 3]
+    assert order(search="b") == [1, 4]
+    assert columns.query(recomendacion=0)["total"] == 0
+
+
+def test_cache_loads_hot_snapshots_and_evicts_by_memory(delta_repository):
+    adapter, user_id = delta_repository
+    adapter.delta_encoding = False
+    first, second = (create_snapshot(adapter, user_id, make_herd(range(200))) for _ in range(2))
+
+    adapter.cache = SnapshotCache(max_bytes=1024 * 1024, hot_reads=2)
+    _page(adapter, first.id, user_id)
+    assert adapter.cache.nbytes == 0  # still cold
+    _page(adapter, first.id, user_id)
+    size = adapter.cache.nbytes
+    assert size > 0
+
+    # Room for one snapshot only: loading the second evicts the first
+    adapter.cache.max_bytes = size + size // 2
+    for _ in range(2):
+        _page(adapter, second.id, user_id)
+    assert adapter.cache.get((first.id, first.created_at)) is None
+    assert adapter.cache.get((second.id, second.created_at)) is not None
+    assert adapter.cache.nbytes == size
+
+    # A snapshot larger than the budget keeps using SQL
+    adapter.cache = SnapshotCache(max_bytes=1, hot_reads=1)
+    assert _page(adapter, first.id, user_id, limit=3)[0] == 200
+    assert adapter.cache.nbytes == 0
+
+
+class _OversizedColumns:
+    nbytes = 2
+
+
+def test_read_bookkeeping_is_pruned_and_bounded():
+    cache = SnapshotCache(max_bytes=1, hot_reads=5)
+    cache.is_hot((1, "t0"))
+    cache.put((2, "t0"), _OversizedColumns())
+    cache.discard(1)
+    cache.discard(2)
+    assert not cache._reads and not cache._too_large
+
+    for snapshot_id in range(3000):
+        cache.is_hot((snapshot_id, "t0"))
+        cache.put((snapshot_id, "t1"), _OversizedColumns())
+    assert len(cache._reads) <= 1024 and len(cache._too_large) <= 1024
@@ -0,0 +1,65 @@
+import sys
+import os
+import asyncio
+from datetime import date
+import pytest
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from conftest import cow_rows, stored_herd
+
+
+def test_replace_rescores_only_changed_rows(replace_usecases):
+    user_id, repository = replace_usecases["user_id"], replace_usecases["repository"]
+    predictions, create = replace_usecases["predictions"], replace_usecases["create"]
+    first = asyncio.run(create.execute(user_id, "Enero", date(2025, 1, 10), cow_rows(range(30))))
+    # A delta snapshot based on the one being replaced must keep its own herd
+    second = asyncio.run(create.execute(user_id, "Febrero", date(2025, 2, 10), cow_rows(range(30), lambda i: i + (i == 4))))
+    assert second.base_snapshot_id == first.id
+    before = stored_herd(repository, first.id, user_id)
+    second_before = stored_herd(repository, second.id, user_id)
+
+    corrected = cow_rows([i for i in range(32) if i not in (7, 8)], lambda i: i + 10 if i in (1, 2) else i)
+    corrected[5]["numero_lactacion"] = 2  # model input only, still re-scored
+    predictions.scored.clear()
+    replaced, diff = asyncio.run(replace_usecases["replace"].execute(
+        user_id, "Enero corregido", date(2025, 1, 10), corrected
+    ))
+
+    assert replaced.id == first.id and replaced.nombre == "Enero corregido" and replaced.total_animales == 30
+    assert (diff.unchanged, diff.changed, diff.added, diff.removed) == (25, 3, 2, 2)
+    assert sorted(predictions.scored) == ["1", "2", "30", "31", "5"]
+
+    after = stored_herd(repository, first.id, user_id)
+    assert set(after) == {str(i) for i in range(32) if i not in (7, 8)}
+    assert after["1"][1:] == (11, 11 % 3) and after["30"][1:] == (30, 0)
+    assert all(after[key] == before[key] for key in after if key not in ("1", "2", "30", "31"))  # rows kept in place
+    assert {key: value[1:] for key, value in stored_herd(repository, second.id, user_id).items()} == \
+        {key: value[1:] for key, value in second_before.items()}
+
+    # Rollups follow the replaced herd
+    trends = asyncio.run(replace_usecases["trends"].execute(user_id))
+    assert [(t.global_hato_id, t.total_animales) for t in trends] == [(first.id, 30), (second.id, 30)]
+
+    # Same export again: nothing is re-scored
+    predictions.scored.clear()
+    _, diff = asyncio.run(replace_usecases["replace"].execute(user_id, "Enero corregido", date(2025, 1, 10), corrected))
+    assert (diff.unchanged, diff.rescored, diff.removed) == (30, 0, 0) and predictions.scored == []
+
+    # The delta snapshot can be replaced too (it is materialized first)
+    _, diff = asyncio.run(replace_usecases["replace"].execute(user_id, "Febrero", date(2025, 2, 10), cow_rows(range(29))))
+    assert (diff.changed, diff.removed) == (1, 1)
+    assert {key: value[1] for key, value in stored_herd(repository, second.id, user_id).items()} == {str(i): i for i in range(29)}
+
+
+def test_replace_creates_when_nothing_to_replace(replace_usecases):
+    user_id = replace_usecases["user_id"]
+    created, diff = asyncio.run(replace_usecases["replace"].execute(user_id, "Marzo", date(2025, 3, 1), cow_rows(range(5))))
+    assert diff is None and created.total_animales == 5
+
+    with pytest.raises(ValueError):
+        asyncio.run(replace_usecases["replace"].execute(user_id, "Marzo", date(2025, 3, 1), cow_rows([1, 1, 2])))
@@ -0,0 +1,56 @@
+import sys
+import os
+import asyncio
+import numpy as np
+import pytest
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from domain.entities import Cow
+from domain.usecases import GetSnapshotStatistics
+from conftest import create_snapshot
+
+
+@pytest.fixture
+def snapshot(repository):
+    adapter, user_id = repository
+    cows = [
+        Cow(id=0, numero_animal=str(i), nombre_grupo=f"CORRAL {i % 2}",
+            produccion_leche_ayer=None if i % 9 == 0 else 10.0 + i * 0.5, produccion_media_7dias=20.0,
+            estado_reproduccion="Vacía", dias_ordeno=i * 3, numero_seleccion=None, recomendacion=None)
+        for i in range(50)
+    ]
+    created = create_snapshot(adapter, user_id, cows)
+    return GetSnapshotStatistics(adapter), created.id, user_id, cows
+
+
+def test_statistics_match_numpy(snapshot):
+    usecase, global_hato_id, user_id, cows = snapshot
+    stats = asyncio.run(usecase.execute(global_hato_id, user_id, bins=5))
+
+    leche = [cow.produccion_leche_ayer for cow in cows if cow.produccion_leche_ayer is not None]
+    produccion = stats["produccion_leche_ayer"]
+    assert (produccion.count, produccion.nulls) == (len(leche), 50 - len(leche))
+    assert (produccion.min, produccion.max) == (min(leche), max(leche))
+    assert produccion.median == pytest.approx(np.median(leche))
+    assert produccion.p90 == pytest.approx(np.percentile(leche, 90))
+    assert len(produccion.bin_edges) == 6 and sum(produccion.counts) == len(leche)
+
+    # Constant column: every value lands in one bin
+    assert stats["produccion_media_7dias"].std == 0.0
+    assert sum(stats["produccion_media_7dias"].counts) == 50
+
+    corral = asyncio.run(usecase.execute(global_hato_id, user_id, nombre_grupo="CORRAL 1"))
+    assert corral["dias_ordeno"].count == 25 and corral["dias_ordeno"].min == 3.0
+    assert len(corral["dias_ordeno"].counts) == 20
+
+    empty = asyncio.run(usecase.execute(global_hato_id, user_id, nombre_grupo="NO EXISTE"))
+    assert empty["dias_ordeno"].count == 0 and empty["dias_ordeno"].median is None
+
+    assert asyncio.run(usecase.execute(global_hato_id, user_id + 1)) is None
+    with pytest.raises(ValueError):
+        asyncio.run(usecase.execute(global_hato_id, user_id, bins=0))
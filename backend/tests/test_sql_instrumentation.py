@@ -0,0 +1,72 @@
+import sys
+import os
+import asyncio
+from datetime import datetime
+import pytest
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from infrastructure.database import GlobalHatoModel, CowModel
+from infrastructure.monitoring import install_sql_instrumentation, track_queries, assert_max_queries
+
+
+@pytest.fixture
+def repository(repository):
+    adapter, user_id = repository
+    install_sql_instrumentation(adapter.db.engine)
+    session = adapter.db.get_session()
+    hato = GlobalHatoModel(
+        user_id=user_id, nombre="Hato", fecha_snapshot=datetime(2025, 1, 1),
+        total_animales=30, grupos_detectados=3
+    )
+    session.add(hato)
+    session.flush()
+    session.add_all([
+        CowModel(global_hato_id=hato.id, numero_animal=str(i), nombre_grupo=f"CORRAL {i % 3}",
+                 produccion_leche_ayer=20 + i, produccion_media_7dias=20, dias_ordeno=100 + i)
+        for i in range(30)
+    ])
+    session.commit()
+    ids = (hato.id, user_id)
+    session.close()
+    return adapter, ids
+
+
+def test_cows_page_query_budget(repository):
+    adapter, (hato_id, user_id) = repository
+
+    with assert_max_queries(3) as stats:
+        result = asyncio.run(adapter.get_all_cows_by_snapshot(hato_id, user_id, page=2, limit=10))
+
+    assert len(result['cows']) == 10
+    assert stats.total_time > 0
+    assert stats.slowest_statement is not None
+
+
+def test_corrales_query_budget(repository):
+    adapter, (hato_id, user_id) = repository
+
+    with assert_max_queries(2):
+        corrales = asyncio.run(adapter.get_corrales_by_snapshot(hato_id, user_id))
+
+    assert len(corrales) == 3
+
+
+def test_repeated_statements_are_flagged(repository):
+    adapter, (hato_id, user_id) = repository
+
+    with track_queries() as stats:
+        for _ in range(6):
+            asyncio.run(adapter.find_by_id(hato_id))
+
+    assert stats.count == 6
+    assert len(stats.repeated_statements()) == 1
+
+    with pytest.raises(AssertionError, match="N\\+1"):
+        with assert_max_queries(10):
+            for _ in range(6):
+                asyncio.run(adapter.find_by_id(hato_id))
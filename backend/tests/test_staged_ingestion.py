@@ -0,0 +1,106 @@
+import sys
+import os
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+
+os.environ.setdefault("UPLOAD_BASE_PATH", "/tmp/vacas_test_uploads")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from domain.entities import GlobalHato, Cow
+from infrastructure.database import GlobalHatoModel, CowModel
+from utils.constants.snapshot_status import SNAPSHOT_STATUS_LOADING, SNAPSHOT_STATUS_READY
+
+
+@pytest.fixture
+def repository(repository):
+    # Small chunks, so a load spans several commits
+    repository[0].chunk_size = 7
+    return repository
+
+
+def _snapshot(user_id, total):
+    return GlobalHato(
+        id=0, user_id=user_id, nombre="Hato", fecha_snapshot=datetime(2025, 1, 1),
+        total_animales=total, grupos_detectados=1, created_at=datetime.now()
+    )
+
+
+def _cows(n):
+    return [
+        Cow(id=0, global_hato_id=0, numero_animal=str(i), nombre_grupo="CORRAL 1",
+            produccion_leche_ayer=20, produccion_media_7dias=20, estado_reproduccion="Vacía",
+            dias_ordeno=100, numero_seleccion=None, recomendacion=1)
+        for i in range(n)
+    ]
+
+
+def _count(adapter, model):
+    session = adapter.db.get_session()
+    try:
+        return session.query(model).count()
+    finally:
+        session.close()
+
+
+def test_chunked_load_is_published(repository):
+    adapter, user_id = repository
+
+    created = asyncio.run(adapter.create_global_hato(_snapshot(user_id, 30), _cows(30)))
+
+    session = adapter.db.get_session()
+    assert session.get(GlobalHatoModel, created.id).status == SNAPSHOT_STATUS_READY
+    session.close()
+    assert _count(adapter, CowModel) == 30
+    assert asyncio.run(adapter.find_all_by_user(user_id))['total'] == 1
+    assert asyncio.run(adapter.find_all_by_user(user_id, sort_by='nombre', sort_order='desc'))['total'] == 1
+
+
+def test_failed_chunk_discards_partial_snapshot(repository):
+    adapter, user_id = repository
+    cows = _cows(30)
+    cows[20].dias_ordeno = object()  # third chunk cannot be bound
+
+    with pytest.raises(Exception):
+        asyncio.run(adapter.create_global_hato(_snapshot(user_id, 30), cows))
+
+    assert _count(adapter, GlobalHatoModel) == 0
+    assert _count(adapter, CowModel) == 0
+
+
+def test_loading_snapshots_are_hidden_and_cleaned_up(repository):
+    adapter, user_id = repository
+    session = adapter.db.get_session()
+    ids = []
+    # Abandoned, just started, and started long ago but still committing chunks
+    loads = [(timedelta(hours=3), None), (timedelta(minutes=1), None), (timedelta(hours=3), timedelta(minutes=1))]
+    for age, progress in loads:
+        hato = GlobalHatoModel(
+            user_id=user_id, nombre="Loading", fecha_snapshot=datetime(2025, 1, 1), total_animales=2,
+            grupos_detectados=1, created_at=datetime.now() - age, status=SNAPSHOT_STATUS_LOADING,
+            updated_at=datetime.now() - progress if progress else None
+        )
+        session.add(hato)
+        session.flush()
+        session.add_all([CowModel(global_hato_id=hato.id, numero_animal=str(i), nombre_grupo="CORRAL 1") for i in range(2)])
+        ids.append(hato.id)
+    session.commit()
+    session.close()
+    abandoned_id, in_progress_id, slow_id = ids
+
+    assert asyncio.run(adapter.find_all_by_user(user_id))['total'] == 0
+    assert asyncio.run(adapter.find_by_id(in_progress_id)) is None
+    assert asyncio.run(adapter.get_all_cows_by_snapshot(in_progress_id, user_id))['cows'] == []
+
+    removed = asyncio.run(adapter.cleanup_abandoned_loads(datetime.now() - timedelta(hours=1)))
+
+    assert removed == 1
+    session = adapter.db.get_session()
+    assert session.get(GlobalHatoModel, abandoned_id) is None
+    assert session.get(GlobalHatoModel, in_progress_id) is not None
+    assert session.get(GlobalHatoModel, slow_id) is not None
+    assert session.query(CowModel).count() == 4
+    session.close()
@@ -0,0 +1,34 @@
+import sys
+import os
+import tempfile
+
+# Add scripts to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../scripts')))
+
+from profile_startup import run_startup_probe
+
+# Budgets for a cold create_app() in a fresh worker; override in slow CI environments
+STARTUP_TIME_BUDGET_S = float(os.getenv("STARTUP_TIME_BUDGET_S", "3.0"))
+STARTUP_RSS_BUDGET_MB = float(os.getenv("STARTUP_RSS_BUDGET_MB", "100"))
+
+
+def _probe():
+    tmp_dir = tempfile.mkdtemp(prefix="vacas_startup_")
+    return run_startup_probe(env={
+        "DATABASE_URL": f"sqlite:///{tmp_dir}/startup.db",
+        "JWT_SECRET_KEY": "startup-budget-test",
+        "UPLOAD_BASE_PATH": os.path.join(tmp_dir, "uploads"),
+    })
+
+
+def test_create_app_stays_within_startup_budget():
+    result = _probe()
+
+    assert result["create_app_seconds"] < STARTUP_TIME_BUDGET_S, result
+    assert result["max_rss_mb"] < STARTUP_RSS_BUDGET_MB, result
+
+
+def test_heavy_dependencies_are_not_imported_at_startup():
+    result = _probe()
+
+    assert result["heavy_modules_loaded"] == []
@@ -21,13 +21,24 @@ CREATE TABLE IF NOT EXISTS global_hato (
     total_animales INTEGER NOT NULL,
     grupos_detectados INTEGER NOT NULL,
     blob_route VARCHAR,
-    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    -- 'loading' while cows are written in chunks, 'ready' once published,
+    -- 'archived' once its cows moved to the Parquet file at archive_route
+    status VARCHAR NOT NULL DEFAULT 'ready',
+    archive_route VARCHAR,
+    -- Delta-encoded snapshots only store cows that differ from this full snapshot;
+    -- RESTRICT: a base can only be deleted once its deltas are materialized
+    base_snapshot_id INTEGER REFERENCES global_hato(id) ON DELETE RESTRICT,
+    -- Set when the snapshot's cows are replaced by a re-upload; while loading,
+    -- the time of the last committed chunk (abandoned-load cleanup)
+    updated_at TIMESTAMP
 );
 
--- Cows table with CSV fields for Global Hato snapshots
+-- Cows table with CSV fields for Global Hato snapshots, range-partitioned by
+-- snapshot (see backend/src/infrastructure/database/partitioning.py)
 CREATE TABLE IF NOT EXISTS cows (
-    id SERIAL PRIMARY KEY,
-    global_hato_id INTEGER REFERENCES global_hato(id) ON DELETE CASCADE,
+    id SERIAL,
+    global_hato_id INTEGER NOT NULL REFERENCES global_hato(id) ON DELETE CASCADE,
     numero_animal VARCHAR,
     nombre_grupo VARCHAR,
     produccion_leche_ayer NUMERIC(10, 2),
@@ -35,17 +46,91 @@ CREATE TABLE IF NOT EXISTS cows (
     estado_reproduccion VARCHAR,
     dias_ordeno INTEGER,
     numero_seleccion VARCHAR,
-    recomendacion INTEGER
+    recomendacion INTEGER,
+    -- Tombstone in a delta snapshot: the animal left since the base snapshot
+    removed BOOLEAN NOT NULL DEFAULT FALSE,
+    -- Hash of the uploaded row; re-uploads only re-score cows whose hash changed
+    content_hash VARCHAR(32),
+    -- Model inputs that are not API fields (float32), for re-scoring with a new model
+    numero_lactacion REAL,
+    numero_inseminaciones REAL,
+    dias_prenada REAL,
+    dias_para_parto REAL,
+    produccion_total_lactacion REAL,
+    PRIMARY KEY (id, global_hato_id)
+) PARTITION BY RANGE (global_hato_id);
+
+CREATE TABLE IF NOT EXISTS cows_p0 PARTITION OF cows FOR VALUES FROM (0) TO (1000);
+CREATE TABLE IF NOT EXISTS cows_p1000 PARTITION OF cows FOR VALUES FROM (1000) TO (2000);
+CREATE TABLE IF NOT EXISTS cows_p2000 PARTITION OF cows FOR VALUES FROM (2000) TO (3000);
+CREATE TABLE IF NOT EXISTS cows_default PARTITION OF cows DEFAULT;
+
+-- Per-snapshot herd totals for trend charts, maintained on upload/delete
+CREATE TABLE IF NOT EXISTS global_hato_rollups (
+    global_hato_id INTEGER PRIMARY KEY REFERENCES global_hato(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    fecha_snapshot DATE NOT NULL,
+    total_animales INTEGER NOT NULL,
+    grupos_detectados INTEGER NOT NULL,
+    produccion_total DOUBLE PRECISION NOT NULL,
+    produccion_promedio DOUBLE PRECISION,
+    produccion_promedio_7dias DOUBLE PRECISION,
+    en_produccion INTEGER NOT NULL DEFAULT 0,
+    en_monitoreo INTEGER NOT NULL DEFAULT 0,
+    previo_secado INTEGER NOT NULL DEFAULT 0,
+    sin_recomendacion INTEGER NOT NULL DEFAULT 0
+);
+
+-- Per-snapshot corral totals for corral time series, maintained with the rollups above
+CREATE TABLE IF NOT EXISTS global_hato_corral_rollups (
+    global_hato_id INTEGER NOT NULL REFERENCES global_hato(id) ON DELETE CASCADE,
+    nombre_grupo VARCHAR NOT NULL,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    fecha_snapshot DATE NOT NULL,
+    total_animales INTEGER NOT NULL,
+    produccion_total DOUBLE PRECISION NOT NULL,
+    produccion_promedio DOUBLE PRECISION,
+    produccion_promedio_7dias DOUBLE PRECISION,
+    en_produccion INTEGER NOT NULL DEFAULT 0,
+    en_monitoreo INTEGER NOT NULL DEFAULT 0,
+    previo_secado INTEGER NOT NULL DEFAULT 0,
+    sin_recomendacion INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (global_hato_id, nombre_grupo)
+);
+
+-- Distinct animal/selection/group values per snapshot, for cross-snapshot search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+CREATE TABLE IF NOT EXISTS cow_search_terms (
+    global_hato_id INTEGER NOT NULL REFERENCES global_hato(id) ON DELETE CASCADE,
+    kind VARCHAR NOT NULL,
+    term VARCHAR NOT NULL,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    fecha_snapshot DATE NOT NULL,
+    search_key VARCHAR NOT NULL,
+    PRIMARY KEY (global_hato_id, kind, term)
 );
 
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_global_hato_user_id ON global_hato(user_id);
 CREATE INDEX IF NOT EXISTS idx_cows_global_hato_id ON cows(global_hato_id);
+CREATE INDEX IF NOT EXISTS idx_cows_snapshot_animal ON cows(global_hato_id, numero_animal);
+CREATE INDEX IF NOT EXISTS idx_cows_snapshot_grupo_leche ON cows(global_hato_id, nombre_grupo, produccion_leche_ayer);
+CREATE INDEX IF NOT EXISTS idx_cows_snapshot_grupo_media7 ON cows(global_hato_id, nombre_grupo, produccion_media_7dias);
+CREATE INDEX IF NOT EXISTS idx_global_hato_rollups_user_fecha ON global_hato_rollups(user_id, fecha_snapshot);
+CREATE INDEX IF NOT EXISTS idx_corral_rollups_user_fecha_grupo ON global_hato_corral_rollups(user_id, fecha_snapshot, nombre_grupo);
+-- Search: prefix range scans in code-point order, and trigram lookups for substrings
+CREATE INDEX IF NOT EXISTS idx_cow_search_terms_user_key ON cow_search_terms(user_id, search_key COLLATE "C", kind);
+CREATE INDEX IF NOT EXISTS idx_cow_search_terms_user_trgm ON cow_search_terms USING gin (user_id, search_key gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_global_hato_base_snapshot ON global_hato(base_snapshot_id) WHERE base_snapshot_id IS NOT NULL;
+-- Only loading snapshots, for the abandoned-load cleanup
+CREATE INDEX IF NOT EXISTS idx_global_hato_loading ON global_hato(created_at) WHERE status = 'loading';
 
 CREATE TABLE IF NOT EXISTS datasets (
     id SERIAL PRIMARY KEY,
     user_id INTEGER NOT NULL REFERENCES users(id),
-    cow_id INTEGER NOT NULL REFERENCES cows(id),
+    -- No FOREIGN KEY: cows is partitioned and cows.id alone is not a unique key
+    cow_id INTEGER NOT NULL,
     name VARCHAR NOT NULL,
     blob_route VARCHAR NOT NULL,
     upload_date TIMESTAMP NOT NULL,
@@ -64,7 +149,7 @@ CREATE TABLE IF NOT EXISTS models (
 CREATE TABLE IF NOT EXISTS predictions (
     id SERIAL PRIMARY KEY,
     user_id INTEGER NOT NULL REFERENCES users(id),
-    cow_id INTEGER NOT NULL REFERENCES cows(id),
+    cow_id INTEGER NOT NULL,
     model_id INTEGER NOT NULL REFERENCES models(id),
     dataset_id INTEGER NOT NULL REFERENCES datasets(id),
     date TIMESTAMP NOT NULL,
@@ -72,6 +157,27 @@ CREATE TABLE IF NOT EXISTS predictions (
     state VARCHAR NOT NULL
 );
 
+-- Migrations already reflected in this schema (see backend/scripts/migrate.py)
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR PRIMARY KEY,
+    applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+INSERT INTO schema_migrations (version) VALUES
+    ('001_global_hato_status'),
+    ('002_partition_cows'),
+    ('003_global_hato_archive'),
+    ('004_delta_snapshots'),
+    ('005_global_hato_rollups'),
+    ('006_corral_rollups'),
+    ('007_cow_search_terms'),
+    ('008_cows_snapshot_grupo'),
+    ('009_cows_group_ranking'),
+    ('010_snapshot_replace'),
+    ('011_cow_features'),
+    ('012_base_snapshot_restrict'),
+    ('013_search_key_code_point')
+ON CONFLICT (version) DO NOTHING;
+
 -- Clean up existing data (in reverse order of foreign key dependencies)
 TRUNCATE TABLE predictions, models, datasets, cows, global_hato, users RESTART IDENTITY CASCADE;
 